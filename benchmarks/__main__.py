@@ -0,0 +1,88 @@
+"""Runs the benchmark suite.
+
+Usage:
+    python -m benchmarks                    Run every benchmark
+    python -m benchmarks -k guild --scale large
+    python -m benchmarks --save             Store the results as the new baseline
+    python -m benchmarks --compare          Fail if a benchmark regressed against the baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+from tabulate import tabulate
+
+from benchmarks import _harness
+from benchmarks import bench_embed
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="pattern", default="", help="only run names containing this")
+    parser.add_argument(
+        "--scale", action="append", choices=[scale.name for scale in bench_embed.SCALES]
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--save", nargs="?", const=BASELINE, type=Path, metavar="PATH")
+    parser.add_argument("--compare", nargs="?", const=BASELINE, type=Path, metavar="PATH")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="slowdown ratio over the baseline counted as a regression (default: 0.5)",
+    )
+    args = parser.parse_args(argv)
+    if args.compare is not None and not args.compare.exists() and args.save != args.compare:
+        parser.error(f"no baseline at {args.compare}, save one on this machine with --save first")
+
+    benchmarks = [
+        bench
+        for bench in _harness.registered()
+        if args.pattern in bench.name
+        and (args.scale is None or any(bench.name.endswith(f"[{s}]") for s in args.scale))
+    ]
+
+    results = []
+    for bench in benchmarks:
+        result = _harness.measure(bench, rounds=args.rounds)
+        results.append(result)
+        print(f"{result.name:<45} {result.median * 1000:>12.3f} ms", file=sys.stderr)
+
+    if args.save is not None:
+        if args.save.exists():
+            # Keep the baselines of benchmarks that weren't run
+            previous = _harness.load(args.save)
+            ran = {result.name for result in results}
+            kept = [result for name, result in previous.items() if name not in ran]
+            results_to_save = sorted(results + kept)
+        else:
+            results_to_save = results
+        _harness.save(results_to_save, args.save)
+
+    if args.compare is None:
+        return 0
+
+    comparisons = _harness.compare(results, _harness.load(args.compare))
+    regressions = [c for c in comparisons if c.ratio > 1 + args.threshold]
+    print(
+        tabulate(
+            [(c.name, c.baseline * 1000, c.current * 1000, f"{c.ratio:.2f}x") for c in comparisons],
+            headers=("Benchmark", "Baseline ms", "Current ms", "Ratio"),
+            floatfmt=".3f",
+        )
+    )
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}:")
+        for c in regressions:
+            print(f"  {c.name}: {c.ratio:.2f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Synthetic fazwynn history frames shaped like the ones `DataFrameLoader` returns."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+import pandas as pd
+
+CHARACTER_COUNTER_COLUMNS = (
+    "xp",
+    "wars",
+    "mobs_killed",
+    "chests_found",
+    "logins",
+    "deaths",
+    "discoveries",
+    "dungeon_completions",
+    "quest_completions",
+    "raid_completions",
+)
+CHARACTER_DECIMAL_COLUMNS = (
+    "playtime",
+    "alchemism",
+    "armouring",
+    "cooking",
+    "jeweling",
+    "scribing",
+    "tailoring",
+    "weaponsmithing",
+    "woodworking",
+    "mining",
+    "woodcutting",
+    "farming",
+    "fishing",
+)
+CHARACTER_FLAG_COLUMNS = ("hardcore", "ultimate_ironman", "ironman", "craftsman", "hunted")
+GUILD_RANKS = ("RECRUIT", "RECRUITER", "CAPTAIN", "STRATEGIST", "CHIEF", "OWNER")
+
+
+def uuid_bytes(i: int) -> bytes:
+    return UUID(int=i + 1).bytes
+
+
+def character_labels(characters: int) -> dict[str, str]:
+    return {str(UUID(bytes=uuid_bytes(i))): f"ARCHER{i + 1}" for i in range(characters)}
+
+
+def character_history(characters: int, rows_per_character: int, seed: int = 0) -> pd.DataFrame:
+    """Rows of every character, sorted by `datetime`. Counters grow on roughly 1 in 10 rows."""
+    rng = np.random.default_rng(seed)
+    n = characters * rows_per_character
+    data: dict[str, Any] = {
+        "character_uuid": np.repeat(
+            np.array([uuid_bytes(i) for i in range(characters)], dtype=object), rows_per_character
+        ),
+        "level": np.repeat(rng.integers(1, 100, characters), rows_per_character),
+    }
+    for column in CHARACTER_COUNTER_COLUMNS:
+        data[column] = _growing(rng, characters, rows_per_character, step=5)
+    for column in CHARACTER_DECIMAL_COLUMNS:
+        data[column] = _growing(rng, characters, rows_per_character, step=1) / 4
+    for column in CHARACTER_FLAG_COLUMNS:
+        data[column] = np.zeros(n, dtype=bool)
+    data["datetime"] = np.tile(_datetimes(rows_per_character), characters)
+    data["unique_id"] = [b""] * n
+    return pd.DataFrame(data).sort_values("datetime", kind="stable", ignore_index=True)
+
+
+def player_history(players: int, rows_per_player: int, seed: int = 0) -> pd.DataFrame:
+    """Rows of every player, sorted by `datetime`. Guild and rank change now and then."""
+    rng = np.random.default_rng(seed)
+    n = players * rows_per_player
+    rank_codes = np.cumsum(rng.random(n) < 0.02) % len(GUILD_RANKS)
+    guild_names = np.where(rng.random(n) < 0.01, "", "Guild")
+    return pd.DataFrame(
+        {
+            "uuid": np.repeat(
+                np.array([uuid_bytes(i) for i in range(players)], dtype=object), rows_per_player
+            ),
+            "username": np.repeat([f"player{i}" for i in range(players)], rows_per_player),
+            "support_rank": ["vip"] * n,
+            "playtime": _growing(rng, players, rows_per_player, step=1) / 4,
+            "guild_name": guild_names,
+            "guild_rank": np.array(GUILD_RANKS, dtype=object)[rank_codes],
+            "rank": ["Player"] * n,
+            "datetime": np.tile(_datetimes(rows_per_player), players),
+            "unique_id": [b""] * n,
+        }
+    ).sort_values("datetime", kind="stable", ignore_index=True)
+
+
+def guild_history(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "uuid": [uuid_bytes(0)] * rows,
+            "level": 50 + _growing(rng, 1, rows, step=1) / 100,
+            "territories": rng.integers(0, 20, rows),
+            "wars": _growing(rng, 1, rows, step=3),
+            "member_total": [100] * rows,
+            "online_members": rng.integers(0, 100, rows),
+            "datetime": _datetimes(rows),
+            "unique_id": [b""] * rows,
+        }
+    )
+
+
+def guild_member_history(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "uuid": [uuid_bytes(0)] * rows,
+            "contributed": _growing(rng, 1, rows, step=100_000),
+            "joined": [datetime(2023, 1, 1)] * rows,
+            "datetime": _datetimes(rows),
+            "unique_id": [b""] * rows,
+        }
+    )
+
+
+def interaction() -> Any:
+    """Stands in for the `Interaction` an `EmbedBuilder` reads the embed author from."""
+    user = SimpleNamespace(
+        display_name="benchmark", display_avatar=SimpleNamespace(url="https://example.com/a.png")
+    )
+    return SimpleNamespace(user=user, created_at=datetime(2024, 1, 1))
+
+
+def _growing(rng: np.random.Generator, groups: int, rows: int, step: int) -> np.ndarray:
+    """Per-group cumulative counters that grow on roughly 1 in 10 rows."""
+    increments = (rng.random((groups, rows)) < 0.1) * rng.integers(1, step + 1, (groups, rows))
+    return np.cumsum(increments, axis=1).ravel()
+
+
+def _datetimes(rows: int) -> np.ndarray:
+    return pd.date_range("2024-01-01", periods=rows, freq="5min").to_numpy()
@@ -0,0 +1,101 @@
+"""A small timing harness, so the suite runs with nothing but the app's own dependencies."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import statistics
+import time
+from typing import Callable, Iterable, NamedTuple
+
+type Setup = Callable[[], Callable[[], object]]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Setup
+    """Prepares the input data outside of the timing, and returns the function to time."""
+
+
+class Result(NamedTuple):
+    name: str
+    median: float
+    minimum: float
+    rounds: int
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+_benchmarks: list[Benchmark] = []
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Registers a setup function as the benchmark `name`."""
+
+    def decorator(setup: Setup) -> Setup:
+        _benchmarks.append(Benchmark(name, setup))
+        return setup
+
+    return decorator
+
+
+def registered() -> list[Benchmark]:
+    return list(_benchmarks)
+
+
+def measure(bench: Benchmark, *, rounds: int = 5, min_round_time: float = 0.1) -> Result:
+    """Times `bench` over `rounds` rounds, each calling it enough times to last at least
+    `min_round_time` seconds.
+
+    Returns:
+        Result: Median and minimum time of a single call, in seconds.
+    """
+    func = bench.setup()
+    func()  # Warm up caches and lazy imports
+
+    calls = 1
+    while True:
+        elapsed = _time_calls(func, calls)
+        if elapsed >= min_round_time:
+            break
+        calls *= 2
+
+    times = [elapsed / calls] + [_time_calls(func, calls) / calls for _ in range(rounds - 1)]
+    return Result(bench.name, statistics.median(times), min(times), rounds)
+
+
+def save(results: Iterable[Result], path: Path) -> None:
+    data = {result.name: {"median": result.median, "min": result.minimum} for result in results}
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def load(path: Path) -> dict[str, Result]:
+    """Loads the results of a saved run, by benchmark name."""
+    data = json.loads(path.read_text())
+    return {name: Result(name, entry["median"], entry["min"], 0) for name, entry in data.items()}
+
+
+def compare(results: Iterable[Result], baseline: dict[str, Result]) -> list[Comparison]:
+    """Compares the fastest call times, which are the least affected by noise from other
+    processes.
+    """
+    return [
+        Comparison(result.name, baseline[result.name].minimum, result.minimum)
+        for result in results
+        if result.name in baseline
+    ]
+
+
+def _time_calls(func: Callable[[], object], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return time.perf_counter() - start
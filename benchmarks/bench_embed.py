@@ -0,0 +1,184 @@
+"""Benchmarks of the field builders and embed directors, fed with synthetic history frames."""
+
+from __future__ import annotations
+
+from typing import Callable, NamedTuple
+
+from benchmarks import _data
+from benchmarks._harness import benchmark
+from faz.bot.app.discord.embed.builder.embed_builder import EmbedBuilder
+from faz.bot.app.discord.embed.builder.guild_history_field_builder import GuildHistoryFieldBuilder
+from faz.bot.app.discord.embed.builder.member_history_field_builder import (
+    MemberHistoryFieldBuilder,
+)
+from faz.bot.app.discord.embed.builder.player_history_field_builder import (
+    PlayerHistoryFieldBuilder,
+)
+from faz.bot.app.discord.embed.director._base_field_embed_director import BaseFieldEmbedDirector
+from faz.bot.app.discord.embed.director._base_table_embed_director import BaseTableEmbedDirector
+from faz.bot.app.discord.embed.embed_field import EmbedField
+from faz.bot.app.discord.history.normalize import normalize_character_history
+from faz.bot.app.discord.history.normalize import normalize_player_history
+from faz.bot.app.discord.select.guild_history_data_options import GuildHistoryDataOption
+from faz.bot.app.discord.select.guild_history_mode_options import GuildHistoryModeOptions
+from faz.bot.app.discord.select.member_history_data_option import MemberHistoryDataOption
+from faz.bot.app.discord.select.member_history_mode_option import MemberHistoryModeOption
+from faz.bot.app.discord.select.player_history_data_option import PlayerHistoryDataOption
+
+
+class Scale(NamedTuple):
+    name: str
+    characters: int
+    rows_per_character: int
+    members: int
+    rows_per_member: int
+    items: int
+
+
+SCALES = (
+    Scale("small", characters=5, rows_per_character=200, members=10, rows_per_member=20, items=100),
+    Scale(
+        "medium",
+        characters=5,
+        rows_per_character=2_000,
+        members=50,
+        rows_per_member=200,
+        items=1_000,
+    ),
+    Scale(
+        "large",
+        characters=5,
+        rows_per_character=20_000,
+        members=100,
+        rows_per_member=1_000,
+        items=10_000,
+    ),
+)
+
+
+class _Director(BaseFieldEmbedDirector):
+    async def setup(self) -> None: ...
+
+
+class _TableDirector(BaseTableEmbedDirector):
+    async def setup(self) -> None: ...
+
+
+def _construct_all_pages(
+    director: BaseFieldEmbedDirector | BaseTableEmbedDirector, *, cold: bool = False
+) -> None:
+    if cold:
+        # Setting the items again starts a new render key, so no page is served from the cache
+        director.set_items(director.items)
+    for page in range(1, director.page_count + 1):
+        director.construct_page(page)
+
+
+def _register(scale: Scale) -> None:
+    def player_history(option: PlayerHistoryDataOption) -> Callable[[], object]:
+        builder = (
+            PlayerHistoryFieldBuilder()
+            .set_character_labels(_data.character_labels(scale.characters))
+            .set_data(
+                _data.player_history(1, scale.rows_per_character),
+                normalize_character_history(
+                    _data.character_history(scale.characters, scale.rows_per_character)
+                ),
+            )
+            .set_data_option(option)
+        )
+        return builder.build
+
+    def guild_history(
+        mode: GuildHistoryModeOptions, data: GuildHistoryDataOption
+    ) -> Callable[[], object]:
+        builder = (
+            GuildHistoryFieldBuilder()
+            .set_data(
+                normalize_player_history(
+                    _data.player_history(scale.members, scale.rows_per_member)
+                ),
+                _data.guild_history(scale.rows_per_member),
+            )
+            .set_mode_option(mode)
+            .set_data_option(data)
+        )
+        return builder.build
+
+    def member_history(
+        mode: MemberHistoryModeOption, data: MemberHistoryDataOption
+    ) -> Callable[[], object]:
+        builder = (
+            MemberHistoryFieldBuilder()
+            .set_character_labels(_data.character_labels(scale.characters))
+            .set_data(
+                normalize_character_history(
+                    _data.character_history(scale.characters, scale.rows_per_character)
+                ),
+                _data.guild_member_history(scale.rows_per_character),
+            )
+            .set_mode_option(mode)
+            .set_data_option(data)
+        )
+        return builder.build
+
+    def table(cold: bool) -> Callable[[], object]:
+        rows = [(f"player{i}", f"{i % 7} hours", i * 1_000, "CAPTAIN") for i in range(scale.items)]
+        director = _TableDirector(
+            EmbedBuilder(_data.interaction()),
+            items=rows,
+            item_header=("Username", "Playtime", "Contributed", "Rank"),
+        )
+        director.PAGE_CACHE_SIZE = director.page_count
+        return lambda: _construct_all_pages(director, cold=cold)
+
+    def construct_page(cold: bool, items_per_page: int = 5) -> Callable[[], object]:
+        fields = [EmbedField(f"Field {i}", f"<t:{i}:R>: `{i}`\n" * 20) for i in range(scale.items)]
+        director = _Director(
+            EmbedBuilder(_data.interaction()), items=fields, items_per_page=items_per_page
+        )
+        director.PAGE_CACHE_SIZE = director.page_count
+        return lambda: _construct_all_pages(director, cold=cold)
+
+    for option in (
+        PlayerHistoryDataOption.ALL,
+        PlayerHistoryDataOption.WARS,
+        PlayerHistoryDataOption.GUILD,
+    ):
+        benchmark(f"player_history/{option.name.lower()}[{scale.name}]")(
+            lambda option=option: player_history(option)
+        )
+
+    for mode, data in (
+        (GuildHistoryModeOptions.OVERALL, GuildHistoryDataOption.MEMBER_LIST),
+        (GuildHistoryModeOptions.HISTORICAL, GuildHistoryDataOption.MEMBER_LIST),
+        (GuildHistoryModeOptions.HISTORICAL, GuildHistoryDataOption.GUILD_LEVEL),
+    ):
+        name = "overall" if mode == GuildHistoryModeOptions.OVERALL else data.name.lower()
+        benchmark(f"guild_history/{name}[{scale.name}]")(
+            lambda mode=mode, data=data: guild_history(mode, data)
+        )
+
+    for mode, data in (
+        (MemberHistoryModeOption.OVERALL, MemberHistoryDataOption.WARS),
+        (MemberHistoryModeOption.HISTORICAL, MemberHistoryDataOption.WARS),
+        (MemberHistoryModeOption.HISTORICAL, MemberHistoryDataOption.XP_CONTRIBUTION),
+    ):
+        name = "overall" if mode == MemberHistoryModeOption.OVERALL else data.name.lower()
+        benchmark(f"member_history/{name}[{scale.name}]")(
+            lambda mode=mode, data=data: member_history(mode, data)
+        )
+
+    for cold, suffix in ((True, "_cold"), (False, "")):
+        benchmark(f"table_director/all_pages{suffix}[{scale.name}]")(lambda cold=cold: table(cold))
+        benchmark(f"field_director/all_pages{suffix}[{scale.name}]")(
+            lambda cold=cold: construct_page(cold)
+        )
+    # Pages packed up to the embed limits, as the history directors paginate
+    benchmark(f"field_director/all_pages_packed_cold[{scale.name}]")(
+        lambda: construct_page(True, _Director.EMBED_FIELD_LIMIT)
+    )
+
+
+for _scale in SCALES:
+    _register(_scale)
@@ -24,6 +24,20 @@ class Properties:
     MYSQL_FAZWYNN_DATABASE: str
     MYSQL_FAZCORD_DATABASE: str
     FAZCORD_MAX_RETRIES: int
+    MYSQL_POOL_SIZE: int
+    MYSQL_MAX_OVERFLOW: int
+    MYSQL_POOL_PRE_PING: bool
+    MYSQL_POOL_RECYCLE: int
+    WHITELIST_CACHE_TTL: float
+    PRECOMPUTE_HISTORY_OPTIONS: bool
+    HISTORY_CACHE_MAX_ENTRIES: int
+    HISTORY_REFRESH_INTERVAL: float
+    HISTORY_MAX_IN_FLIGHT: int
+    HISTORY_MAX_IN_FLIGHT_PER_INTERACTION: int
+    METRICS_SERVER_HOST: str
+    METRICS_SERVER_PORT: int
+    TRACKER_POLL_INTERVAL: float
+    TRACK_INDEX_RECONCILE_INTERVAL: float
 
     # # Additional application property classes
     # ASSET: Asset
@@ -50,6 +64,26 @@ class Properties:
         cls.MYSQL_PASSWORD = cls._must_get_env("MYSQL_PASSWORD")
         cls.MYSQL_FAZCORD_DATABASE = cls._must_get_env("MYSQL_FAZCORD_DATABASE")
         cls.MYSQL_FAZWYNN_DATABASE = cls._must_get_env("MYSQL_FAZWYNN_DATABASE")
+        cls.MYSQL_POOL_SIZE = cls._get_env("MYSQL_POOL_SIZE", 5, int)
+        cls.MYSQL_MAX_OVERFLOW = cls._get_env("MYSQL_MAX_OVERFLOW", 10, int)
+        cls.MYSQL_POOL_PRE_PING = cls._get_env("MYSQL_POOL_PRE_PING", True, cls._parse_bool)
+        cls.MYSQL_POOL_RECYCLE = cls._get_env("MYSQL_POOL_RECYCLE", 300, int)
+        cls.WHITELIST_CACHE_TTL = cls._get_env("WHITELIST_CACHE_TTL", 60.0, float)
+        cls.PRECOMPUTE_HISTORY_OPTIONS = cls._get_env(
+            "PRECOMPUTE_HISTORY_OPTIONS", False, cls._parse_bool
+        )
+        cls.HISTORY_CACHE_MAX_ENTRIES = cls._get_env("HISTORY_CACHE_MAX_ENTRIES", 128, int)
+        cls.HISTORY_REFRESH_INTERVAL = cls._get_env("HISTORY_REFRESH_INTERVAL", 300.0, float)
+        cls.HISTORY_MAX_IN_FLIGHT = cls._get_env("HISTORY_MAX_IN_FLIGHT", cls.MYSQL_POOL_SIZE, int)
+        cls.HISTORY_MAX_IN_FLIGHT_PER_INTERACTION = cls._get_env(
+            "HISTORY_MAX_IN_FLIGHT_PER_INTERACTION", 3, int
+        )
+        cls.METRICS_SERVER_HOST = cls._get_env("METRICS_SERVER_HOST", "127.0.0.1")
+        cls.METRICS_SERVER_PORT = cls._get_env("METRICS_SERVER_PORT", 0, int)
+        cls.TRACKER_POLL_INTERVAL = cls._get_env("TRACKER_POLL_INTERVAL", 60.0, float)
+        cls.TRACK_INDEX_RECONCILE_INTERVAL = cls._get_env(
+            "TRACK_INDEX_RECONCILE_INTERVAL", 300.0, float
+        )
 
     @staticmethod
     def _must_get_env[T](key: str, type_strategy: Callable[[str], T] = str) -> T:
@@ -60,3 +94,18 @@ class Properties:
             raise ValueError(
                 f"Failed parsing environment variable {key} into type {type_strategy}"
             ) from exc
+
+    @classmethod
+    def _get_env[T](cls, key: str, default: T, type_strategy: Callable[[str], T] = str) -> T:
+        if os.getenv(key) in (None, ""):
+            return default
+        return cls._must_get_env(key, type_strategy)
+
+    @staticmethod
+    def _parse_bool(value: str) -> bool:
+        lowered = value.strip().lower()
+        if lowered in ("1", "true", "yes", "on"):
+            return True
+        if lowered in ("0", "false", "no", "off"):
+            return False
+        raise ValueError(f"{value!r} is not a boolean")
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from threading import Lock
-from typing import Generator
+from typing import Any, Generator
 
 from faz.bot.core.logger_setup import LoggerSetup
 from faz.bot.database.fazcord.fazcord_database import FazcordDatabase
 from faz.bot.database.fazwynn.fazwynn_database import FazwynnDatabase
+from faz.utils.database.base_database import BaseDatabase
 from loguru import logger
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from faz.bot.app.discord.app._properties import Properties
 from faz.bot.app.discord.bot.bot import Bot
@@ -16,6 +19,7 @@ from faz.bot.app.discord.bot.bot import Bot
 class App:
     def __init__(self) -> None:
         self._locks: dict[str, Lock] = {}
+        self._created_databases: set[str] = set()
 
         self._properties = Properties()
         self.properties.setup()
@@ -45,24 +49,68 @@ class App:
             yield self._bot
 
     def create_fazcord_db(self) -> FazcordDatabase:
+        """Creates the fazcord database of this process.
+
+        The database owns a connection pool, so it may only be created once. Use
+        `Bot.fazcord_db` to access it.
+
+        Raises:
+            RuntimeError: If the database has already been created.
+        """
+        self._must_not_be_created("fazcord")
         p = self.properties
-        return FazcordDatabase(
+        db = FazcordDatabase(
             p.MYSQL_USER,
             p.MYSQL_PASSWORD,
             p.MYSQL_HOST,
             p.MYSQL_PORT,
             p.MYSQL_FAZCORD_DATABASE,
         )
+        return self._configure_pool(db)
 
     def create_fazwynn_db(self) -> FazwynnDatabase:
+        """Creates the fazwynn database of this process.
+
+        The database owns a connection pool, so it may only be created once. Use
+        `Bot.fazwynn_db` to access it.
+
+        Raises:
+            RuntimeError: If the database has already been created.
+        """
+        self._must_not_be_created("fazwynn")
         p = self.properties
-        return FazwynnDatabase(
+        db = FazwynnDatabase(
             p.MYSQL_USER,
             p.MYSQL_PASSWORD,
             p.MYSQL_HOST,
             p.MYSQL_PORT,
             p.MYSQL_FAZWYNN_DATABASE,
         )
+        return self._configure_pool(db)
+
+    def _must_not_be_created(self, name: str) -> None:
+        if name in self._created_databases:
+            raise RuntimeError(
+                f"The {name} database has already been created. Use the one owned by Bot "
+                "instead of creating another connection pool."
+            )
+        self._created_databases.add(name)
+
+    def _configure_pool[T: BaseDatabase](self, db: T) -> T:
+        """Replaces the default engines of `db` with ones using the configured pool options.
+
+        No connection has been opened at this point, so the replaced engines hold no resources.
+        """
+        p = self.properties
+        pool_options: dict[str, Any] = {
+            "pool_size": p.MYSQL_POOL_SIZE,
+            "max_overflow": p.MYSQL_MAX_OVERFLOW,
+            "pool_pre_ping": p.MYSQL_POOL_PRE_PING,
+            "pool_recycle": p.MYSQL_POOL_RECYCLE,
+        }
+        db._engine = create_engine(db.engine.url, **pool_options)  # type: ignore
+        db._async_engine = create_async_engine(db.async_engine.url, **pool_options)  # type: ignore
+        return db
 
     def _get_lock(self, key: str) -> Lock:
         if key not in self._locks:
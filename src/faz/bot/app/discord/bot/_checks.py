@@ -5,6 +5,9 @@ from typing import Any, TYPE_CHECKING
 from loguru import logger
 from nextcord import Interaction
 
+from faz.bot.app.discord.bot._whitelist_cache import Groups
+from faz.bot.app.discord.bot._whitelist_cache import WhitelistCache
+
 if TYPE_CHECKING:
     from faz.bot.app.discord.bot.bot import Bot
 
@@ -12,12 +15,23 @@ if TYPE_CHECKING:
 class Checks:
     def __init__(self, bot: Bot) -> None:
         self._bot = bot
+        self._whitelist_cache = WhitelistCache(
+            bot.fazcord_db, bot.metrics, bot.app.properties.WHITELIST_CACHE_TTL
+        )
         self.load_checks()
 
     def load_checks(self) -> None:
         """Loads global checks to the client."""
-        self.bot.client.add_application_command_check(self.is_not_banned)
-        self.bot.client.add_application_command_check(self.is_whitelisted)
+        self.bot.client.add_application_command_check(self._global_check)
+
+    async def _global_check(self, interaction: Interaction[Any]) -> bool:
+        """Runs the checks every application command must pass, timed into the
+        "command_checks_seconds" histogram of the command.
+        """
+        command = interaction.application_command
+        label = command.qualified_name if command else ""
+        with self.bot.metrics.time("command_checks_seconds", label):
+            return await self.is_not_banned(interaction) and await self.is_whitelisted(interaction)
 
     async def is_admin(self, interaction: Interaction[Any]) -> bool:
         if not interaction.user:
@@ -39,8 +53,7 @@ class Checks:
             return True
 
         user_id = interaction.user.id
-        db = self.bot.fazcord_db
-        is_banned = await db.whitelist_group.is_banned_user(user_id)
+        is_banned = await self._whitelist_cache.is_member(Groups.BAN, user_id)
 
         if is_banned:
             logger.warning(
@@ -59,8 +72,7 @@ class Checks:
             return False
         guild_id = interaction.guild.id
 
-        db = self.bot.fazcord_db
-        is_whitelisted = await db.whitelist_group.is_whitelisted_guild(guild_id)
+        is_whitelisted = await self._whitelist_cache.is_member(Groups.GUILD, guild_id)
 
         if not is_whitelisted:
             logger.warning(
@@ -83,6 +95,14 @@ class Checks:
 
         return is_guild_admin
 
+    def invalidate_ban(self, user_id: int) -> None:
+        """Makes the next `is_banned` check of `user_id` read from the database."""
+        self._whitelist_cache.invalidate(Groups.BAN, user_id)
+
+    def invalidate_whitelist(self, guild_id: int) -> None:
+        """Makes the next `is_whitelisted` check of `guild_id` read from the database."""
+        self._whitelist_cache.invalidate(Groups.GUILD, guild_id)
+
     @property
     def bot(self) -> Bot:
         return self._bot
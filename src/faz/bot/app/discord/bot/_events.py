@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from time import perf_counter
 import traceback
 from typing import Any, TYPE_CHECKING
 
@@ -27,6 +28,7 @@ class Events:
         self._bot = bot
         self._cooldown = CooldownMapping(Cooldown(1, 3.0), BucketType.user)
         self._ready = False
+        self._invoked_at: dict[int, float] = {}
         self.load_events()
 
     def load_events(self) -> None:
@@ -48,11 +50,14 @@ class Events:
         if not self._ready:
             # Loads all cogs and commands to the client
             await self._bot.on_ready_setup()
+            self._ready = True
 
     async def on_application_command_completion(self, interaction: Interaction[Any]) -> None:
+        self._observe_latency(interaction)
         await self._log_event(interaction, self.on_application_command_completion.__name__)
 
     async def on_application_command_error(self, intr: Interaction[Any], error: Exception) -> None:
+        self._observe_latency(intr)
         await self._log_event(intr, self.on_application_command_error.__name__)
         # NOTE: Error is being wrapped by ApplicationInvokeError. Unwrap is first
         if isinstance(error, errors.ApplicationInvokeError) and isinstance(
@@ -69,6 +74,18 @@ class Events:
     async def before_application_invoke(self, interaction: Interaction[Any]) -> None:
         # await self.__log_event(interaction, self.before_application_invoke.__name__)
         self._ratelimit(interaction)
+        self._invoked_at[interaction.id] = perf_counter()
+        if interaction.application_command:
+            self._bot.metrics.bind_command(interaction.application_command.qualified_name)
+
+    def _observe_latency(self, interaction: Interaction[Any]) -> None:
+        """Records the time from invoking the command of `interaction` into its latency histogram."""
+        invoked_at = self._invoked_at.pop(interaction.id, None)
+        if invoked_at is None or not interaction.application_command:
+            return
+        self._bot.metrics.histogram(
+            "command_latency_seconds", interaction.application_command.qualified_name
+        ).observe(perf_counter() - invoked_at)
 
     def _ratelimit(self, interaction: Interaction[Any]) -> None:
         if not interaction.message:
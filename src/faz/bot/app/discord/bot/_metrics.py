@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+import math
+from time import perf_counter
+from typing import Iterator, Sequence
+
+
+class Counter:
+    """Monotonically increasing count, in the style of Prometheus counters."""
+
+    def __init__(self) -> None:
+        self._value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class Gauge:
+    """Value that can go up and down, in the style of Prometheus gauges."""
+
+    def __init__(self) -> None:
+        self._value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self._value += amount
+
+    def dec(self, amount: int = 1) -> None:
+        self._value -= amount
+
+    def set(self, value: int) -> None:
+        self._value = value
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class Histogram:
+    """Cumulative histogram of observed values, in the style of Prometheus histograms."""
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(sorted(buckets))
+        # The last slot counts observations above the largest bucket (+Inf)
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimates the `q`-quantile of the observed values, in the style of Prometheus'
+        `histogram_quantile`.
+
+        Values are assumed to be spread linearly within a bucket. Quantiles that fall in the
+        +Inf bucket are reported as the largest bucket bound.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The estimated quantile, or NaN if nothing has been observed yet.
+        """
+        if self._count == 0:
+            return math.nan
+        rank = q * self._count
+        cumulative = self.bucket_counts
+        for i, upper in enumerate(self._buckets):
+            if cumulative[i] < rank:
+                continue
+            lower = self._buckets[i - 1] if i > 0 else 0.0
+            below = cumulative[i - 1] if i > 0 else 0
+            in_bucket = cumulative[i] - below
+            if in_bucket == 0:
+                return upper
+            return lower + (upper - lower) * (rank - below) / in_bucket
+        return self._buckets[-1]
+
+    @property
+    def buckets(self) -> tuple[float, ...]:
+        return self._buckets
+
+    @property
+    def bucket_counts(self) -> list[int]:
+        """Cumulative observation count of each bucket, with the +Inf bucket last."""
+        ret: list[int] = []
+        total = 0
+        for count in self._counts:
+            total += count
+            ret.append(total)
+        return ret
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+
+_current_command: ContextVar[tuple[Metrics, str] | None] = ContextVar(
+    "current_command", default=None
+)
+
+
+@contextmanager
+def timed_phase(phase: str) -> Iterator[None]:
+    """Times a phase of the application command being invoked in the current context into
+    the "command_<phase>_seconds" histogram, labelled by the command name.
+
+    Does nothing outside of a command bound with `Metrics.bind_command`, e.g. in a button
+    callback of a view.
+
+    Args:
+        phase (str): Phase name, e.g. "db_fetch".
+    """
+    current = _current_command.get()
+    if current is None:
+        yield
+        return
+    metrics, command = current
+    with metrics.time(f"command_{phase}_seconds", command):
+        yield
+
+
+class Metrics:
+    """Registry of the runtime metrics of the bot."""
+
+    def __init__(self) -> None:
+        self._counters: dict[tuple[str, str], Counter] = {}
+        self._gauges: dict[tuple[str, str], Gauge] = {}
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+
+    def counter(self, name: str, label: str = "") -> Counter:
+        """Gets the counter of `name` and `label`, creating it if it doesn't exist yet.
+
+        Args:
+            name (str): Metric name, e.g. "whitelist_cache_hits_total".
+            label (str, optional): Metric label. Defaults to "".
+
+        Returns:
+            Counter: The counter.
+        """
+        key = (name, label)
+        if key not in self._counters:
+            self._counters[key] = Counter()
+        return self._counters[key]
+
+    def gauge(self, name: str, label: str = "") -> Gauge:
+        """Gets the gauge of `name` and `label`, creating it if it doesn't exist yet.
+
+        Args:
+            name (str): Metric name, e.g. "outbox_queue_depth".
+            label (str, optional): Metric label. Defaults to "".
+
+        Returns:
+            Gauge: The gauge.
+        """
+        key = (name, label)
+        if key not in self._gauges:
+            self._gauges[key] = Gauge()
+        return self._gauges[key]
+
+    def histogram(self, name: str, label: str = "") -> Histogram:
+        """Gets the histogram of `name` and `label`, creating it if it doesn't exist yet.
+
+        Args:
+            name (str): Metric name, e.g. "command_latency_seconds".
+            label (str, optional): Metric label, e.g. a command name. Defaults to "".
+
+        Returns:
+            Histogram: The histogram.
+        """
+        key = (name, label)
+        if key not in self._histograms:
+            self._histograms[key] = Histogram()
+        return self._histograms[key]
+
+    @contextmanager
+    def time(self, name: str, label: str = "") -> Iterator[None]:
+        """Observes the duration of the `with` block into the histogram of `name` and `label`.
+
+        Args:
+            name (str): Metric name, e.g. "command_checks_seconds".
+            label (str, optional): Metric label. Defaults to "".
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram(name, label).observe(perf_counter() - start)
+
+    def bind_command(self, command: str) -> None:
+        """Makes `timed_phase` record into this registry under `command` for the rest of the
+        current context, i.e. the task invoking the command.
+
+        Args:
+            command (str): Qualified name of the command, e.g. "history guild_history".
+        """
+        _current_command.set((self, command))
+
+    async def monitor_event_loop(self, interval: float = 1.0) -> None:
+        """Samples the event loop lag into the "event_loop_lag_seconds" histogram forever.
+
+        The lag is the time a `sleep(interval)` overshoots by. A loop blocked by synchronous
+        work shows up as a large lag.
+
+        Args:
+            interval (float, optional): Sampling interval in seconds. Defaults to 1.0.
+        """
+        histogram = self.histogram("event_loop_lag_seconds")
+        while True:
+            start = perf_counter()
+            await asyncio.sleep(interval)
+            histogram.observe(max(perf_counter() - start - interval, 0.0))
+
+    @property
+    def counters(self) -> dict[tuple[str, str], Counter]:
+        return self._counters
+
+    @property
+    def gauges(self) -> dict[tuple[str, str], Gauge]:
+        return self._gauges
+
+    @property
+    def histograms(self) -> dict[tuple[str, str], Histogram]:
+        return self._histograms
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from faz.bot.app.discord.bot._metrics import Metrics
+
+
+class MetricsServer:
+    """Serves the bot metrics in the Prometheus text format on `GET /metrics`.
+
+    This is a minimal HTTP/1.0 server meant to be scraped from the local network only.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, metrics: Metrics, host: str, port: int) -> None:
+        self._metrics = metrics
+        self._host = host
+        self._port = port
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+        logger.info(f"Serving metrics on http://{self._host}:{self._port}/metrics")
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            # Skip the headers, the request has no body
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status = "200 OK"
+                body = render_prometheus(self._metrics).encode()
+            else:
+                status = "404 Not Found"
+                body = b"Not Found\n"
+
+            writer.write(
+                f"HTTP/1.0 {status}\r\n"
+                f"Content-Type: {self.CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @property
+    def port(self) -> int:
+        """The listening port, which differs from the configured one if that was 0."""
+        if self._server is None or len(self._server.sockets) == 0:
+            return self._port
+        return self._server.sockets[0].getsockname()[1]
+
+
+def render_prometheus(metrics: Metrics) -> str:
+    """Renders `metrics` in the Prometheus text exposition format.
+
+    Metric labels are exported as the `label` label, e.g.
+    `command_latency_seconds_count{label="history guild_history"} 3`.
+
+    Args:
+        metrics (Metrics): The metrics to render.
+
+    Returns:
+        str: The rendered metrics.
+    """
+    lines: list[str] = []
+
+    written_types: set[str] = set()
+    for (name, label), counter in sorted(metrics.counters.items()):
+        if name not in written_types:
+            lines.append(f"# TYPE {name} counter")
+            written_types.add(name)
+        lines.append(f"{name}{_labels(label)} {counter.value}")
+
+    for (name, label), gauge in sorted(metrics.gauges.items()):
+        if name not in written_types:
+            lines.append(f"# TYPE {name} gauge")
+            written_types.add(name)
+        lines.append(f"{name}{_labels(label)} {gauge.value}")
+
+    for (name, label), histogram in sorted(metrics.histograms.items()):
+        if name not in written_types:
+            lines.append(f"# TYPE {name} histogram")
+            written_types.add(name)
+        bounds = [repr(float(bucket)) for bucket in histogram.buckets] + ["+Inf"]
+        for bound, count in zip(bounds, histogram.bucket_counts):
+            lines.append(f"{name}_bucket{_labels(label, le=bound)} {count}")
+        lines.append(f"{name}_sum{_labels(label)} {histogram.sum}")
+        lines.append(f"{name}_count{_labels(label)} {histogram.count}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _labels(label: str, **extra: str) -> str:
+    pairs = {"label": label, **extra} if label else extra
+    if len(pairs) == 0:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
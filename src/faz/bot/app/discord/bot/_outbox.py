@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import time
+from typing import Any, Callable, NamedTuple, TYPE_CHECKING
+
+from loguru import logger
+from nextcord import DiscordException
+from nextcord import HTTPException
+
+if TYPE_CHECKING:
+    from nextcord.abc import Messageable
+
+    from faz.bot.app.discord.bot._metrics import Metrics
+
+
+class TokenBucket:
+    """Token bucket rate limiter. Holds up to `capacity` tokens, refilled at `rate` tokens per
+    second.
+    """
+
+    def __init__(
+        self, rate: float, capacity: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._clock = clock
+
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+
+    def try_acquire(self) -> float:
+        """Takes a token if one is available.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the seconds until one is available.
+        """
+        now = self._clock()
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+    async def acquire(self) -> None:
+        """Waits until a token is available, then takes it."""
+        while (wait := self.try_acquire()) > 0:
+            await asyncio.sleep(wait)
+
+    def block(self, seconds: float) -> None:
+        """Hands out no tokens for the next `seconds` seconds, and empties the bucket.
+
+        Args:
+            seconds (float): The seconds to block for.
+        """
+        now = self._clock()
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self._tokens = 0.0
+        self._updated_at = self._blocked_until
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+class _Pending(NamedTuple):
+    channel: Messageable
+    content: str
+    enqueued_at: float
+    future: asyncio.Future[None]
+
+
+class Outbox:
+    """Delivers messages through one queue per channel, paced under the discord rate limits.
+
+    Every channel has its own queue, drained by a worker task that only lives while the queue
+    has messages. A worker joins the messages pending in its queue into as few messages as fit
+    `MESSAGE_LIMIT` characters, then sends each after taking a token from the global bucket and
+    one from the channel's bucket. Sending a message is rate limited per channel by discord, so
+    the channel bucket is also the route bucket.
+
+    nextcord already waits out the rate limits it is told about. A send that still fails with
+    429 or a server error is retried with exponential backoff, or after the `Retry-After` of
+    the response, while the channel's bucket is blocked.
+
+    Metrics: gauge `outbox_queue_depth`, histogram `outbox_delivery_seconds` from enqueue to
+    delivery, and counters `outbox_messages_total`, `outbox_retries_total` and
+    `outbox_failures_total`.
+    """
+
+    MESSAGE_LIMIT = 2000
+    """Maximum length of a discord message."""
+
+    def __init__(
+        self,
+        metrics: Metrics,
+        global_rate: float = 50.0,
+        global_burst: int = 50,
+        channel_rate: float = 1.0,
+        channel_burst: int = 5,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a new Outbox instance.
+
+        Args:
+            metrics (Metrics): The metrics to record deliveries in.
+            global_rate (float, optional): Messages per second, across all channels.
+                Defaults to 50.0.
+            global_burst (int, optional): Messages sent at once, across all channels.
+                Defaults to 50.
+            channel_rate (float, optional): Messages per second, per channel. Defaults to 1.0.
+            channel_burst (int, optional): Messages sent at once, per channel. Defaults to 5.
+            max_retries (int, optional): Retries of a failed send. Defaults to 3.
+            backoff (float, optional): Seconds before the first retry, doubled on every
+                retry. Defaults to 1.0.
+            clock (Callable[[], float], optional): Clock of the buckets and delivery latency.
+                Defaults to time.monotonic.
+        """
+        self._metrics = metrics
+        self._channel_rate = channel_rate
+        self._channel_burst = channel_burst
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._clock = clock
+
+        self._global_bucket = TokenBucket(global_rate, global_burst, clock)
+        self._buckets: dict[int, TokenBucket] = {}
+        self._queues: dict[int, deque[_Pending]] = {}
+        self._workers: dict[int, asyncio.Task[None]] = {}
+
+    def enqueue(self, channel: Messageable, content: str) -> asyncio.Future[Any]:
+        """Queues a message for a channel. Content longer than `MESSAGE_LIMIT` is split
+        between lines, or within a line that doesn't fit.
+
+        Args:
+            channel (Messageable): The channel to send to. Must have an `id`.
+            content (str): The message content.
+
+        Returns:
+            asyncio.Future[Any]: Done once the content is delivered, or failed with the
+                exception of the last attempt. Failures are logged, so the future doesn't need
+                to be awaited.
+        """
+        loop = asyncio.get_running_loop()
+        channel_id: int = channel.id  # type: ignore
+        queue = self._queues.setdefault(channel_id, deque())
+        futures: list[asyncio.Future[None]] = []
+        for part in self._split(content):
+            future: asyncio.Future[None] = loop.create_future()
+            future.add_done_callback(self._retrieve_exception)
+            queue.append(_Pending(channel, part, self._clock(), future))
+            futures.append(future)
+        self._metrics.gauge("outbox_queue_depth").inc(len(futures))
+
+        if channel_id not in self._workers:
+            self._workers[channel_id] = loop.create_task(self._drain(channel_id))
+        gathered = asyncio.gather(*futures)
+        gathered.add_done_callback(self._retrieve_exception)
+        return gathered
+
+    async def send(self, channel: Messageable, content: str) -> None:
+        """Queues a message for a channel, and waits for it to be delivered.
+
+        Args:
+            channel (Messageable): The channel to send to. Must have an `id`.
+            content (str): The message content.
+
+        Raises:
+            Exception: The last attempt failed, e.g. with a `DiscordException`.
+        """
+        await self.enqueue(channel, content)
+
+    async def close(self) -> None:
+        """Stops the workers, and cancels the messages still queued."""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for queue in self._queues.values():
+            for pending in queue:
+                pending.future.cancel()
+        self._metrics.gauge("outbox_queue_depth").set(0)
+        self._queues.clear()
+
+    async def _drain(self, channel_id: int) -> None:
+        queue = self._queues[channel_id]
+        try:
+            while len(queue) > 0:
+                batch = self._take_batch(queue)
+                self._metrics.gauge("outbox_queue_depth").dec(len(batch))
+                try:
+                    await self._deliver(channel_id, batch)
+                except asyncio.CancelledError:
+                    for pending in batch:
+                        pending.future.cancel()
+                    raise
+                except Exception as exc:
+                    # e.g. a connection error, which would otherwise end the worker and leave
+                    # the batch unresolved
+                    self._fail(channel_id, batch, exc)
+        finally:
+            del self._workers[channel_id]
+            if len(queue) == 0:
+                del self._queues[channel_id]
+
+    def _take_batch(self, queue: deque[_Pending]) -> list[_Pending]:
+        """Pops the pending messages that fit in one message, at least one."""
+        batch = [queue.popleft()]
+        length = len(batch[0].content)
+        while len(queue) > 0 and length + 1 + len(queue[0].content) <= self.MESSAGE_LIMIT:
+            length += 1 + len(queue[0].content)
+            batch.append(queue.popleft())
+        return batch
+
+    async def _deliver(self, channel_id: int, batch: list[_Pending]) -> None:
+        content = "\n".join(pending.content for pending in batch)
+        channel = batch[-1].channel
+        if channel_id not in self._buckets:
+            self._buckets[channel_id] = TokenBucket(
+                self._channel_rate, self._channel_burst, self._clock
+            )
+        bucket = self._buckets[channel_id]
+
+        attempt = 0
+        while True:
+            await self._global_bucket.acquire()
+            await bucket.acquire()
+            try:
+                await channel.send(content)
+                break
+            except HTTPException as exc:
+                if attempt >= self._max_retries or not self._is_retryable(exc):
+                    self._fail(channel_id, batch, exc)
+                    return
+                bucket.block(self._retry_delay(exc, attempt))
+                attempt += 1
+                self._metrics.counter("outbox_retries_total").inc()
+            except DiscordException as exc:
+                self._fail(channel_id, batch, exc)
+                return
+
+        now = self._clock()
+        histogram = self._metrics.histogram("outbox_delivery_seconds")
+        for pending in batch:
+            histogram.observe(now - pending.enqueued_at)
+            if not pending.future.done():
+                pending.future.set_result(None)
+        self._metrics.counter("outbox_messages_total").inc()
+
+    def _fail(self, channel_id: int, batch: list[_Pending], exc: Exception) -> None:
+        self._metrics.counter("outbox_failures_total").inc()
+        logger.warning(f"Failed sending message to channel {channel_id}: {exc}")
+        for pending in batch:
+            if not pending.future.done():
+                pending.future.set_exception(exc)
+
+    def _retry_delay(self, exc: HTTPException, attempt: int) -> float:
+        headers = getattr(exc.response, "headers", None) or {}
+        retry_after = headers.get("Retry-After")
+        if exc.status == 429 and retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return self._backoff * 2**attempt
+
+    @staticmethod
+    def _is_retryable(exc: HTTPException) -> bool:
+        return exc.status == 429 or exc.status >= 500
+
+    @classmethod
+    def _split(cls, content: str) -> list[str]:
+        """Splits content into parts of at most `MESSAGE_LIMIT` characters, between lines
+        where possible.
+        """
+        if len(content) <= cls.MESSAGE_LIMIT:
+            return [content]
+        parts: list[str] = []
+        current: str | None = None
+        for line in content.split("\n"):
+            while len(line) > cls.MESSAGE_LIMIT:
+                if current is not None:
+                    parts.append(current)
+                    current = None
+                parts.append(line[: cls.MESSAGE_LIMIT])
+                line = line[cls.MESSAGE_LIMIT :]
+            if current is None:
+                current = line
+            elif len(current) + 1 + len(line) <= cls.MESSAGE_LIMIT:
+                current += "\n" + line
+            else:
+                parts.append(current)
+                current = line
+        if current is not None:
+            parts.append(current)
+        return parts
+
+    @staticmethod
+    def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+        # Failures are logged, so an unawaited future shouldn't warn again
+        if not future.cancelled():
+            future.exception()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of messages waiting to be sent."""
+        return sum(len(queue) for queue in self._queues.values())
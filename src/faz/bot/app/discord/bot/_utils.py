@@ -6,6 +6,7 @@ import dateparser
 from faz.bot.database.fazwynn.model.guild_info import GuildInfo
 from faz.bot.database.fazwynn.model.player_info import PlayerInfo
 
+from faz.bot.app.discord.bot._metrics import timed_phase
 from faz.bot.app.discord.bot.errors import InvalidArgumentException
 from faz.bot.app.discord.bot.errors import ParseException
 
@@ -71,7 +72,8 @@ class Utils:
         )
 
     async def must_get_wynn_guild(self, guild: str) -> GuildInfo:
-        guild_info = await self._bot.fazwynn_db.guild_info.get_guild(guild)
+        with timed_phase("entity_lookup"):
+            guild_info = await self._bot.fazwynn_db.guild_info.get_guild(guild)
         if not guild_info:
             raise InvalidArgumentException(
                 f"Guild not found (reason: Can't find guild with name or uuid {guild})"
@@ -79,7 +81,8 @@ class Utils:
         return guild_info
 
     async def must_get_wynn_player(self, player: str) -> PlayerInfo:
-        player_info = await self._bot.fazwynn_db.player_info.get_player(player)
+        with timed_phase("entity_lookup"):
+            player_info = await self._bot.fazwynn_db.player_info.get_player(player)
         if not player_info:
             raise InvalidArgumentException(
                 f"Player not found (reason: Can't find player with username or uuid {player})"
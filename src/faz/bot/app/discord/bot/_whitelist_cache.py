@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from datetime import datetime
+from time import monotonic
+from typing import NamedTuple, TYPE_CHECKING
+
+from faz.bot.database.fazcord.repository.whitelist_group_repository import WhitelistGroupRepository
+
+if TYPE_CHECKING:
+    from faz.bot.database.fazcord.fazcord_database import FazcordDatabase
+
+    from faz.bot.app.discord.bot._metrics import Metrics
+
+
+Groups = WhitelistGroupRepository.Groups
+
+
+class _Entry(NamedTuple):
+    is_member: bool
+    expires_at: float
+
+
+class WhitelistCache:
+    """Caches whether ids are in a whitelist group, e.g. banned users or whitelisted guilds.
+
+    Entries live for `ttl` seconds, or until the `until` time of the whitelist group entry
+    if that comes first, so an expired ban or whitelist is never served from the cache.
+    """
+
+    def __init__(self, db: FazcordDatabase, metrics: Metrics, ttl: float = 60.0) -> None:
+        self._db = db
+        self._metrics = metrics
+        self._ttl = ttl
+        self._entries: dict[tuple[Groups, int], _Entry] = {}
+
+    async def is_member(self, group: Groups, id: int) -> bool:
+        """Checks whether `id` is in `group` and hasn't expired yet.
+
+        Args:
+            group (Groups): The whitelist group.
+            id (int): Discord ID of the user or guild.
+
+        Returns:
+            bool: True if `id` is in `group`.
+        """
+        key = (group, id)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > monotonic():
+            self._metrics.counter("whitelist_cache_hits_total", group.value).inc()
+            return entry.is_member
+
+        self._metrics.counter("whitelist_cache_misses_total", group.value).inc()
+        entry = await self._load(group, id)
+        self._entries[key] = entry
+        return entry.is_member
+
+    def invalidate(self, group: Groups, id: int) -> None:
+        """Drops the cached entry of `id` in `group`. Call this after modifying the group."""
+        self._entries.pop((group, id), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def _load(self, group: Groups, id: int) -> _Entry:
+        expires_at = monotonic() + self._ttl
+        whitelist_group = await self._db.whitelist_group.select((id, group.value))
+        if whitelist_group is None:
+            return _Entry(False, expires_at)
+
+        until = whitelist_group.until
+        if until is None:
+            return _Entry(True, expires_at)
+
+        remaining = (until - datetime.now(until.tzinfo)).total_seconds()
+        if remaining <= 0:
+            return _Entry(False, expires_at)
+        return _Entry(True, min(expires_at, monotonic() + remaining))
@@ -11,11 +11,21 @@ from sqlalchemy.exc import IntegrityError
 
 from faz.bot.app.discord.bot._checks import Checks
 from faz.bot.app.discord.bot._events import Events
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.bot._metrics_server import MetricsServer
+from faz.bot.app.discord.bot._outbox import Outbox
 from faz.bot.app.discord.bot._utils import Utils
 from faz.bot.app.discord.cog.cog_core import CogCore
+from faz.bot.app.discord.history.dataframe_loader import DataFrameLoader
+from faz.bot.app.discord.history.history_cache import HistoryCache
+from faz.bot.app.discord.track.guild_tracker import GuildTracker
+from faz.bot.app.discord.track.online_tracker import OnlineTracker
+from faz.bot.app.discord.track.track_entry_loader import TrackEntryLoader
+from faz.bot.app.discord.track.track_index import TrackIndex
 
 if TYPE_CHECKING:
     from faz.bot.app.discord.app.app import App
+    from faz.bot.app.discord.track._base_tracker import BaseTracker
 
 
 class Bot:
@@ -24,6 +34,43 @@ class Bot:
 
         self._fazcord_db = app.create_fazcord_db()
         self._fazwynn_db = app.create_fazwynn_db()
+        self._metrics = Metrics()
+        self._history_cache = HistoryCache(
+            self._metrics,
+            app.properties.HISTORY_CACHE_MAX_ENTRIES,
+            app.properties.HISTORY_REFRESH_INTERVAL,
+        )
+        self._dataframe_loader = DataFrameLoader(
+            self._fazwynn_db,
+            app.properties.MYSQL_POOL_SIZE,
+            self._history_cache,
+            max_in_flight=app.properties.HISTORY_MAX_IN_FLIGHT,
+            max_in_flight_per_gather=app.properties.HISTORY_MAX_IN_FLIGHT_PER_INTERACTION,
+        )
+        self._outbox = Outbox(self._metrics)
+        self._track_entry_loader = TrackEntryLoader(self._fazcord_db, self._fazwynn_db)
+        self._track_index = TrackIndex(
+            self._track_entry_loader,
+            self._metrics,
+            app.properties.TRACK_INDEX_RECONCILE_INTERVAL,
+        )
+        self._trackers: list[BaseTracker] = (
+            [
+                tracker_cls(self, app.properties.TRACKER_POLL_INTERVAL)
+                for tracker_cls in (OnlineTracker, GuildTracker)
+            ]
+            if app.properties.TRACKER_POLL_INTERVAL
+            else []
+        )
+        self._metrics_server = (
+            MetricsServer(
+                self._metrics,
+                app.properties.METRICS_SERVER_HOST,
+                app.properties.METRICS_SERVER_PORT,
+            )
+            if app.properties.METRICS_SERVER_PORT
+            else None
+        )
 
         # set intents
         intents = Intents.default()
@@ -56,15 +103,30 @@ class Bot:
 
     async def _async_teardown(self) -> None:
         await self.client.close()
+        for tracker in self._trackers:
+            await tracker.stop()
+        await self._track_index.stop()
+        await self._outbox.close()
+        if self._metrics_server is not None:
+            await self._metrics_server.close()
+        self.dataframe_loader.shutdown()
         await self.fazcord_db.teardown()
         await self.fazwynn_db.teardown()
 
     async def on_ready_setup(self) -> None:
         """Setup after the bot is ready."""
+        self._event_loop.create_task(self.metrics.monitor_event_loop())
+        if self._metrics_server is not None:
+            await self._metrics_server.start()
         await self._whitelist_dev_guild()
         whitelisted_guild_ids = await self._get_whitelisted_guild_ids()
         await self.cogs.setup(whitelisted_guild_ids)
         await self._sync_dev_guild()
+        await self._track_index.load()
+        if self._track_index.reconcile_interval:
+            self._track_index.start()
+        for tracker in self._trackers:
+            tracker.start()
 
     @property
     def fazcord_db(self):
@@ -74,6 +136,34 @@ class Bot:
     def fazwynn_db(self):
         return self._fazwynn_db
 
+    @property
+    def dataframe_loader(self) -> DataFrameLoader:
+        return self._dataframe_loader
+
+    @property
+    def track_entry_loader(self) -> TrackEntryLoader:
+        return self._track_entry_loader
+
+    @property
+    def track_index(self) -> TrackIndex:
+        return self._track_index
+
+    @property
+    def trackers(self) -> list[BaseTracker]:
+        return self._trackers
+
+    @property
+    def history_cache(self) -> HistoryCache:
+        return self._history_cache
+
+    @property
+    def metrics(self) -> Metrics:
+        return self._metrics
+
+    @property
+    def outbox(self) -> Outbox:
+        return self._outbox
+
     @property
     def cogs(self) -> CogCore:
         return self._cogs
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import io
 import subprocess
 from typing import Any, Iterable, override
 
 import nextcord
 from nextcord import Interaction
+from tabulate import tabulate
 
 from faz.bot.app.discord.bot._utils import Utils
 from faz.bot.app.discord.bot.errors import ApplicationException
@@ -60,6 +62,7 @@ class AdminCog(CogBase):
                 session=s,
             )
 
+        self._bot.checks.invalidate_ban(user.id)
         await self._respond_successful(intr, f"Banned user `{user.name} ({user.id})`")
 
     @admin.subcommand(name="unban")
@@ -81,6 +84,7 @@ class AdminCog(CogBase):
 
             await repo.unban_user(user.id, session=s)
 
+        self._bot.checks.invalidate_ban(user.id)
         await self._respond_successful(intr, f"Unbanned user `{user.name} ({user.id}).`")
 
     @admin.subcommand(name="echo")
@@ -105,6 +109,8 @@ class AdminCog(CogBase):
         message : str
             Message to send.
         """
+        # The outbox may wait on rate limits and retries for longer than the interaction lasts
+        await intr.response.defer()
         channel = await self._utils.must_get_channel(channel_id)
 
         if not self._is_channel_sendable(channel):
@@ -113,8 +119,9 @@ class AdminCog(CogBase):
             )
 
         try:
-            await channel.send(message)  # type: ignore
-        except nextcord.DiscordException as exc:
+            await self._bot.outbox.send(channel, message)  # type: ignore
+        except Exception as exc:
+            # e.g. a DiscordException, or a connection error
             raise ApplicationException(f"Failed sending message: {exc}") from exc
 
         await self._respond_successful(
@@ -210,6 +217,7 @@ class AdminCog(CogBase):
                 session=s,
             )
 
+        self._bot.checks.invalidate_whitelist(guild.id)
         await self._respond_successful(intr, f"Whitelisted guild `{guild.name} ({guild.id})`")
 
     @admin.subcommand(name="unwhitelist")
@@ -233,8 +241,18 @@ class AdminCog(CogBase):
 
             await repo.unwhitelist_guild(guild.id, session=s)
 
+        self._bot.checks.invalidate_whitelist(guild.id)
         await self._respond_successful(intr, f"Unwhitelisted guild `{guild.name} ({guild.id})`")
 
+    @admin.subcommand(name="metrics")
+    async def metrics(self, intr: Interaction[Any]) -> None:
+        """(dev only) Shows the command phase timings and counters of the bot."""
+        text = self._format_metrics()
+        if len(text) <= 1900:
+            await intr.send(f"```\n{text}\n```")
+        else:
+            await intr.send(file=nextcord.File(io.BytesIO(text.encode()), "metrics.txt"))
+
     @admin.subcommand(name="execute")
     async def execute(self, intr: Interaction[Any], command: str) -> None:
         """(dev only) Execute `command` directly to the host device.
@@ -254,5 +272,29 @@ class AdminCog(CogBase):
             err_msg = f"Error executing command.\nError message:\n```\n{result.stderr}"
             raise ApplicationException(err_msg)
 
+    def _format_metrics(self) -> str:
+        metrics = self._bot.metrics
+        histogram_rows = [
+            [
+                name.removesuffix("_seconds"),
+                label,
+                histogram.count,
+                *(f"{histogram.quantile(q) * 1000:.1f}" for q in (0.5, 0.95, 0.99)),
+            ]
+            for (name, label), histogram in sorted(metrics.histograms.items())
+            if histogram.count > 0
+        ]
+        counter_rows = [
+            [name, label, counter.value]
+            for (name, label), counter in sorted(
+                [*metrics.counters.items(), *metrics.gauges.items()]
+            )
+        ]
+        return (
+            tabulate(histogram_rows, ["Timing", "Label", "Count", "p50 ms", "p95 ms", "p99 ms"])
+            + "\n\n"
+            + tabulate(counter_rows, ["Counter", "Label", "Value"])
+        )
+
     def _is_channel_sendable(self, channel: object) -> bool:
         return hasattr(channel, "send")
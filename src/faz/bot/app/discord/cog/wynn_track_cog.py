@@ -1,11 +1,19 @@
-from typing import Any, Iterable, Literal, override
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Callable, Iterable, Literal, override, TYPE_CHECKING
 
 from nextcord import Interaction
 from nextcord import slash_command
+from tabulate import tabulate
 
 from faz.bot.app.discord.bot.errors import InvalidActionException
 from faz.bot.app.discord.bot.errors import InvalidArgumentException
 from faz.bot.app.discord.cog._base_cog import CogBase
+from faz.bot.app.discord.track.track_entry_loader import TrackEntryLoader
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class WynnTrackCog(CogBase):
@@ -31,33 +39,42 @@ class WynnTrackCog(CogBase):
         db = self._bot.fazcord_db
         channel = await self._utils.must_get_channel(channel_id)
         track_entry = await db.track_entry.toggle(channel.id)
+        self._bot.track_index.set_enabled(channel.id, track_entry)
         await self._respond_successful(
             intr,
             f"Toggled track entry on channel `{channel.id}` (`{channel.name}`) to {track_entry}",  # type: ignore
         )
 
+    @track_admin.subcommand(name="index")
+    async def index(self, intr: Interaction[Any]) -> None:
+        """(dev only) Shows the track entry counts of the in-memory track index."""
+        track_index = self._bot.track_index
+        table = tabulate(track_index.counts(), ["Type", "Entries", "Enabled", "Values"])
+        await intr.send(
+            f"```\n{table}\n\nVersion: {track_index.version}\nChecksum: {track_index.checksum}\n```"
+        )
+
     @track.subcommand()
     async def show(self, intr: Interaction[Any]) -> None:
         """Shows all Wynncraft trackers on this server."""
-        db = self._bot.fazcord_db
+        loader = self._bot.track_entry_loader
         guild_id = intr.guild.id  # type: ignore
-        track_entries = await db.track_entry.select_by_guild_id(guild_id)
+        track_entries = await loader.select_by_guild_id(guild_id)
         if len(track_entries) == 0:
             await self._respond_successful(
                 intr, "This server does not have any Wynncraft trackers registred"
             )
         else:
+            names = await loader.get_display_names(track_entries)
             responses = []
             for entry in track_entries:
-                await entry.awaitable_attrs.channel
                 responses.append(
                     f"- `{entry.channel_id} ({entry.channel.channel_name})`: {entry.type}"
                 )
-                if entry.type in {"GUILD", "ONLINE"}:
-                    await entry.awaitable_attrs.associations
+                if entry.type in TrackEntryLoader.NAMED_TYPES:
                     subresponses = []
                     for value in entry.associations:
-                        subresponses.append(f"\t- `{value.associated_value}`")
+                        subresponses.append(f"\t- `{names[value.associated_value]}`")
                     subresponse = "\n".join(subresponses)
                     responses.append(subresponse)
             response = "\n".join(responses)
@@ -73,6 +90,7 @@ class WynnTrackCog(CogBase):
         db = self._bot.fazcord_db
         channel = await self._utils.must_get_channel(channel_id)
         track_entry = await db.track_entry.toggle(channel.id)
+        self._bot.track_index.set_enabled(channel.id, track_entry)
         await self._respond_successful(
             intr,
             f"Toggled track entry on channel `{channel.id} ({channel.name})` to {track_entry}",  # type: ignore
@@ -87,7 +105,11 @@ class WynnTrackCog(CogBase):
         """
         db = self._bot.fazcord_db
         channel = await self._utils.must_get_channel(channel_id)
-        await db.track_entry.delete(channel.id)
+        async with db.enter_async_session() as ses:
+            track_entry = await db.track_entry.select_by_channel_id(channel.id, session=ses)
+            if track_entry is not None:
+                await db.track_entry.delete(track_entry.id, session=ses)
+        self._bot.track_index.remove_entry(channel.id)
         await self._respond_successful(
             intr,
             f"Removed track entry on channel `{channel.id} ({channel.name})`",  # type: ignore
@@ -152,7 +174,7 @@ class WynnTrackCog(CogBase):
 
         This method handles adding new tracking entries or updating existing ones for a specified
         channel in a Discord server. It also allows the association of additional values for types
-        "PLAYER" and "GUILD" with the track entry. If the specified value already exists, it removes the
+        "GUILD", "ONLINE" and "PLAYER" with the track entry. If the specified value already exists, it removes the
         association; otherwise, it creates a new association. The method also ensures that a track
         entry is removed if it has no more associated values after deletion.
 
@@ -160,91 +182,112 @@ class WynnTrackCog(CogBase):
             intr (Interaction): The interaction object containing the context of the command invocation.
             channel_id (str): The ID of the channel where the track entry is to be added or modified.
             type (Literal["GUILD", "HUNTED", "ONLINE", "PLAYER", "STAFF"]): The type of tracking entry
-                to be added or modified. Only "GUILD" and "ONLINE" types can have additional associated values.
+                to be added or modified. Only "GUILD", "ONLINE" and "PLAYER" types can have additional
+                associated values.
             value (str, optional): The optional value to associate with the track entry (e.g., a guild name
-                or player UUID). Required for "GUILD" and "ONLINE" types.
+                or player UUID). Required for "GUILD", "ONLINE" and "PLAYER" types.
 
         Raises:
             BadArgument: If a guild or player cannot be fetched using the provided `value`, or if
                 an invalid track entry type is provided for editing.
         """
         db = self._bot.fazcord_db
+        channel = await self._utils.must_get_channel(channel_id)
+
+        async with db.enter_async_session() as ses:
+            message, index_changes = await self._edit_track_entry(
+                intr, ses, channel, channel_id, type, value
+            )
+        # The track index follows the database only once the changes are committed
+        for index_change in index_changes:
+            index_change()
+        await self._respond_successful(intr, message)
+
+    async def _edit_track_entry(
+        self,
+        intr: Interaction[Any],
+        ses: AsyncSession,
+        channel: Any,
+        channel_id: str,
+        type: Literal["GUILD", "HUNTED", "ONLINE", "PLAYER", "STAFF"],
+        value: str | None,
+    ) -> tuple[str, list[Callable[[], None]]]:
+        """Adds or edits the track entry of a channel in a session, as `_add_track_entry`.
+
+        Returns:
+            tuple[str, list[Callable[[], None]]]: The response message, and the changes to
+                apply to the track index once the session is committed.
+        """
+        db = self._bot.fazcord_db
         track_repo = db.track_entry
         track_value_repo = db.track_entry_association
-        channel = await self._utils.must_get_channel(channel_id)
+        track_index = self._bot.track_index
         assert intr.user
 
-        async with db.enter_async_session() as ses:
-            await self._utils.add_to_db(intr, channel, ses)
-            track_entry = await track_repo.select_by_channel_id(channel.id, session=ses)
-
-            if track_entry is None:
-                # NOTE: Add track entry
-                track_entry = track_repo.model(
-                    channel_id=channel.id,
-                    created_by=intr.user.id,
-                    enabled=True,
-                    type=type,
-                )
-                await track_repo.insert(track_entry, session=ses)
+        await self._utils.add_to_db(intr, channel, ses)
+        track_entry = await track_repo.select_by_channel_id(channel.id, session=ses)
 
-                await self._respond_successful(
-                    intr,
-                    f"Added `{type}` track entry on channel `{channel.id} ({channel.name})`",  # type: ignore
+        if track_entry is None:
+            # NOTE: Add track entry
+            track_entry = track_repo.model(
+                channel_id=channel.id,
+                created_by=intr.user.id,
+                enabled=True,
+                type=type,
+            )
+            await track_repo.insert(track_entry, session=ses)
+            return (
+                f"Added `{type}` track entry on channel `{channel.id} ({channel.name})`",
+                [partial(track_index.add_entry, channel.id, type)],
+            )
+
+        if type == "GUILD":
+            assert value
+            guild = await self._bot.fazwynn_db.guild_info.get_guild(value)
+            if not guild:
+                raise InvalidArgumentException(
+                    f"Guild {value} does not exist in faz-bot's database"
                 )
-                return
-
-            if type == "GUILD":
-                assert value
-                guild = await self._bot.fazwynn_db.guild_info.get_guild(value)
-                if not guild:
-                    raise InvalidArgumentException(
-                        f"Guild {value} does not exist in faz-bot's database"
-                    )
-                uuid = guild.uuid
-
-            elif type == "ONLINE":
-                assert value
-                player = await self._bot.fazwynn_db.player_info.get_player(value)
-                if not player:
-                    raise InvalidArgumentException(
-                        f"Player {value} does not exist in faz-bot's database"
-                    )
-                uuid = player.uuid
-            else:
-                raise InvalidActionException(
-                    "Tracker that is not of type `guild` or `online` cannot be edited. "
-                    f"Remove with `/remove {channel_id}`."
+            uuid = guild.uuid
+
+        elif type in ("ONLINE", "PLAYER"):
+            assert value
+            player = await self._bot.fazwynn_db.player_info.get_player(value)
+            if not player:
+                raise InvalidArgumentException(
+                    f"Player {value} does not exist in faz-bot's database"
                 )
+            uuid = player.uuid
+        else:
+            raise InvalidActionException(
+                "Tracker that is not of type `guild`, `online` or `player` cannot be edited. "
+                f"Remove with `/remove {channel_id}`."
+            )
 
-            # NOTE: Toggle
-            await track_entry.awaitable_attrs.associations
-            associations_size = len(track_entry.associations)
-            for val in track_entry.associations:
-                if val.associated_value == uuid:
-                    # NOTE: Value exists. Remove the value
-                    await ses.delete(val)
-                    if associations_size == 1:
-                        # NOTE: The deleted value was the latest value associated with the track entry
-                        await ses.delete(track_entry)
-                        await self._respond_successful(
-                            intr,
-                            f"Removed track entry on channel `{channel.id} ({channel.name})`",  # type: ignore
-                        )
-                        return
-                    await self._respond_successful(
-                        intr,
-                        f"Removed {type.lower()} `{value}` from `{type}` track entry on channel `{channel.id} ({channel.name})`",  # type: ignore
+        # NOTE: Toggle
+        await track_entry.awaitable_attrs.associations
+        associations_size = len(track_entry.associations)
+        for val in track_entry.associations:
+            if val.associated_value == uuid:
+                # NOTE: Value exists. Remove the value
+                await ses.delete(val)
+                if associations_size == 1:
+                    # NOTE: The deleted value was the latest value associated with the track entry
+                    await ses.delete(track_entry)
+                    return (
+                        f"Removed track entry on channel `{channel.id} ({channel.name})`",
+                        [partial(track_index.remove_entry, channel.id)],
                     )
-                    return
+                return (
+                    f"Removed {type.lower()} `{value}` from `{type}` track entry on channel `{channel.id} ({channel.name})`",
+                    [partial(track_index.remove_value, channel.id, uuid)],
+                )
 
-            # NOTE: Value is new. Add the value
-            track_value = track_value_repo.model(
-                track_entry_id=track_entry.id, associated_value=uuid
-            )
+        # NOTE: Value is new. Add the value
+        track_value = track_value_repo.model(track_entry_id=track_entry.id, associated_value=uuid)
 
-            await track_value_repo.insert(track_value, session=ses)
-            await self._respond_successful(
-                intr,
-                f"Added {type.lower()} `{value}` to `{type}` track entry on channel `{channel.id} ({channel.name})`",  # type: ignore
-            )
+        await track_value_repo.insert(track_value, session=ses)
+        return (
+            f"Added {type.lower()} `{value}` to `{type}` track entry on channel `{channel.id} ({channel.name})`",
+            [partial(track_index.add_value, channel.id, uuid)],
+        )
@@ -1,7 +1,7 @@
 from abc import ABC
 from abc import abstractmethod
 from datetime import datetime
-from typing import Any, MutableSequence, Sequence
+from typing import Any, Callable, MutableSequence, Sequence
 
 import pandas as pd
 
@@ -9,6 +9,9 @@ from faz.bot.app.discord.embed.embed_field import EmbedField
 
 
 class BaseFieldBuilder(ABC):
+    FIELD_VALUE_LIMIT = 1024
+    """Maximum length of the value of an embed field."""
+
     def _common_numerical_float_string_parser(self, timestamp: str, value: float) -> str:
         ret = f"{timestamp}: `{value:.2f}`"
         return ret
@@ -17,20 +20,26 @@ class BaseFieldBuilder(ABC):
         ret = f"{timestamp}: `{value}`"
         return ret
 
-    @staticmethod
-    def _add_embed_field(container: MutableSequence[EmbedField], label: str, value: str) -> None:
-        """Handles max embed value limit of 1024 characters."""
-        if "\n" not in value and len(value) <= 1024:
-            container.append(EmbedField(name=label, value=value))
-        while True:
-            idx = value.rfind("\n", 0, 1024)
+    @classmethod
+    def _add_embed_field(
+        cls, container: MutableSequence[EmbedField], label: str, value: str
+    ) -> None:
+        """Handles max embed value limit of 1024 characters.
+
+        Values are split at the last line break that fits, or within the line if a single line
+        is too long.
+        """
+        limit = cls.FIELD_VALUE_LIMIT
+        while len(value) > limit:
+            idx = value.rfind("\n", 0, limit + 1)
             if idx == -1:
-                break
-            container.append(EmbedField(name=label, value=value[:idx]))
+                container.append(EmbedField(name=label, value=value[:limit]))
+                value = value[limit:]
+            else:
+                container.append(EmbedField(name=label, value=value[:idx]))
+                value = value[idx + 1 :]
             label = ""  # Only the first field has a label
-            value = value[idx + 1 :]
-            if len(value) <= 1024:
-                break
+        container.append(EmbedField(name=label, value=value))
 
     @staticmethod
     def _get_max_key_length(dict_: dict[str, Any]) -> int:
@@ -53,5 +62,38 @@ class BaseFieldBuilder(ABC):
         ret = f"<t:{timestamp:.0f}:R>"
         return ret
 
+    @staticmethod
+    def _get_formatted_timestamps(datetimes: pd.Series) -> list[str]:
+        """Vectorized `_get_formatted_timestamp` over a datetime column."""
+        seconds = (datetimes - pd.Timestamp(0)) / pd.Timedelta(seconds=1)
+        return [f"<t:{timestamp:.0f}:R>" for timestamp in seconds.tolist()]
+
+    @classmethod
+    def _get_change_point_lines(
+        cls,
+        datetimes: pd.Series,
+        values: pd.Series,
+        string_parser: Callable[[str, Any], str],
+    ) -> list[str]:
+        """Formats the rows where the value differs from the value of the previous row.
+
+        The first row is always included.
+
+        Args:
+            datetimes (pd.Series): Datetime of each row, sorted in ascending order.
+            values (pd.Series): Value of each row, aligned with `datetimes`.
+            string_parser (Callable[[str, Any], str]): Formats a row from its formatted
+                timestamp and value.
+
+        Returns:
+            list[str]: One formatted line per change point.
+        """
+        is_changed = values.ne(values.shift()).to_numpy()
+        timestamps = cls._get_formatted_timestamps(datetimes[is_changed])
+        return [
+            string_parser(timestamp, value)
+            for timestamp, value in zip(timestamps, values[is_changed].tolist())
+        ]
+
     @abstractmethod
     def build(self) -> Sequence[EmbedField]: ...
@@ -184,6 +184,16 @@ class EmbedBuilder:
         self._embed.timestamp = self.interaction.created_at
         return self
 
+    @property
+    def initial_embed(self) -> Embed:
+        """
+        Returns the initial state that `reset` restores the embed to.
+
+        Returns:
+            Embed: The initial embed object. Must not be modified.
+        """
+        return self._initial_embed
+
     @property
     def interaction(self) -> Interaction[Any]:
         """
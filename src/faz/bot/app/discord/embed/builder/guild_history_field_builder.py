@@ -1,5 +1,6 @@
 from typing import Callable, override, Self, Sequence
 
+import numpy as np
 import pandas as pd
 
 from faz.bot.app.discord.embed.builder._base_field_builder import BaseFieldBuilder
@@ -29,6 +30,9 @@ class GuildHistoryFieldBuilder(BaseFieldBuilder):
         return self
 
     def set_data(self, player_df: pd.DataFrame, guild_df: pd.DataFrame) -> Self:
+        """Sets the frames to build from. `player_df` must be normalized with
+        `normalize_player_history`.
+        """
         self._player_df = player_df
         self._guild_df = guild_df
         return self
@@ -44,8 +48,6 @@ class GuildHistoryFieldBuilder(BaseFieldBuilder):
     def _parser_overall(
         self,
     ) -> Sequence[EmbedField]:
-        self._player_df.replace("", "None", inplace=True)
-        self._guild_df.replace("", "None", inplace=True)
         ret: Sequence[EmbedField] = []
         if len(self._guild_df) == 0:
             return []
@@ -58,27 +60,24 @@ class GuildHistoryFieldBuilder(BaseFieldBuilder):
         if level1 != level2:
             self._add_embed_field(ret, "Level", f"{level1} -> {level2}")
 
-        # HACK: This is inefficient
         lines_guild = {}
         lines_rank = {}
-        for uuid in pd.unique(self._player_df["uuid"]):
-            player = self._player_df[self._player_df["uuid"] == uuid]
-            earliest_: pd.Series = player.iloc[player["datetime"].idxmin()]  # type: ignore
-            latest_: pd.Series = player.iloc[player["datetime"].idxmax()]  # type: ignore
-
-            username = latest_["username"]
-
-            guild1 = earliest_["guild_name"]
-            guild2 = latest_["guild_name"]
-
-            if guild1 != guild2:
-                lines_guild[username] = f"{guild1} -> {guild2}"
-
-            rank1 = earliest_["guild_rank"]
-            rank2 = latest_["guild_rank"]
-
-            if rank1 != rank2:
-                lines_rank[username] = f"{rank1} -> {rank2}"
+        # Players in order of first appearance, as pd.unique orders them
+        by_player = self._player_df.groupby("uuid", sort=False, observed=True)["datetime"]
+        earliest_ = self._player_df.loc[by_player.idxmin().to_numpy()]
+        latest_ = self._player_df.loc[by_player.idxmax().to_numpy()]
+
+        usernames = latest_["username"].to_numpy()
+        guilds1 = earliest_["guild_name"].to_numpy()
+        guilds2 = latest_["guild_name"].to_numpy()
+        ranks1 = earliest_["guild_rank"].to_numpy()
+        ranks2 = latest_["guild_rank"].to_numpy()
+        for i in np.flatnonzero((guilds1 != guilds2) | (ranks1 != ranks2)):
+            username = usernames[i]
+            if guilds1[i] != guilds2[i]:
+                lines_guild[username] = f"{guilds1[i]} -> {guilds2[i]}"
+            if ranks1[i] != ranks2[i]:
+                lines_rank[username] = f"{ranks1[i]} -> {ranks2[i]}"
 
         if not len(lines_guild) == 0:
             label_space = self._get_max_key_length(lines_guild)
@@ -104,29 +103,41 @@ class GuildHistoryFieldBuilder(BaseFieldBuilder):
         Assumption:
         - player_df is sorted by `datetime` column, ascending
         """
-        self._player_df.replace("", "None", inplace=True)
-        self._guild_df.replace("", "None", inplace=True)
+        df = self._player_df
+        # Rows grouped by player in order of first appearance, in datetime order within a player
+        codes, _ = pd.factorize(df["uuid"])
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        guild_names = df["guild_name"].to_numpy(dtype=object)[order]
+        guild_ranks = df["guild_rank"].to_numpy(dtype=object)[order]
+        values = np.array(
+            [
+                "None" if guild_name == "None" else f"{guild_name} ({guild_rank})"
+                for guild_name, guild_rank in zip(guild_names, guild_ranks)
+            ],
+            dtype=object,
+        )
+
+        # A row is listed if its value differs from the previous row, even if the previous row
+        # belongs to the previous player
+        is_changed = np.ones(len(values), dtype=bool)
+        is_changed[1:] = values[1:] != values[:-1]
+        changed = np.flatnonzero(is_changed)
+        timestamps = self._get_formatted_timestamps(df["datetime"].iloc[order[changed]])
+        change_lines = [f"{ts}: {value}" for ts, value in zip(timestamps, values[changed])]
+
+        player_count = codes.max() + 1 if len(codes) > 0 else 0
+        change_counts = np.bincount(codes[changed], minlength=player_count)
+        last_rows = np.flatnonzero(np.diff(codes, append=player_count))
+        usernames = df["username"].to_numpy()[order[last_rows]]
+
         lines = []
-        prev_value = None
-        for uuid in pd.unique(self._player_df["uuid"]):
-            player = self._player_df[self._player_df["uuid"] == uuid]
-            lines.append(f"**{player.iloc[-1]["username"]}**")
-            new_lines = []
-            for _, row in player.iterrows():
-                if row["guild_name"] == "None":
-                    val = "None"
-                else:
-                    val = f"{row['guild_name']} ({row['guild_rank']})"
-                if prev_value == val:
-                    continue
-                prev_value = val
-                formatted_ts = self._get_formatted_timestamp(row)
-                line = f"{formatted_ts}: {val}"
-                new_lines.append(line)
-            if len(new_lines) < 2:
-                lines.pop()
-                continue
-            lines.extend(new_lines)
+        line_idx = 0
+        for username, change_count in zip(usernames, change_counts.tolist()):
+            if change_count >= 2:
+                lines.append(f"**{username}**")
+                lines.extend(change_lines[line_idx : line_idx + change_count])
+            line_idx += change_count
         desc = "\n".join(lines)
         ret = []
         self._add_embed_field(ret, "Member List", desc)
@@ -135,8 +146,6 @@ class GuildHistoryFieldBuilder(BaseFieldBuilder):
     def _parser_historical_guild_level(
         self,
     ) -> Sequence[EmbedField]:
-        self._player_df.replace("", "None", inplace=True)
-        self._guild_df.replace("", "None", inplace=True)
         lines = []
         prev_value = None
         for _, row in self._guild_df.iterrows():
@@ -52,14 +52,11 @@ class MemberHistoryFieldBuilder(BaseFieldBuilder):
 
         lines = {}
 
-        self._char_df.replace("", "None", inplace=True)
-        self._member_df.replace("", "None", inplace=True)
-
         if len(self._char_df) == 0 and len(self._member_df) == 0:
             return ret
 
         total_war_count = 0
-        for _, group in self._char_df.groupby("character_uuid"):
+        for _, group in self._char_df.groupby("character_uuid", observed=True):
             sorted_group = group.sort_values("datetime")
             first_war = sorted_group.iloc[0]["wars"]
             last_war = sorted_group.iloc[-1]["wars"]
@@ -1,6 +1,7 @@
 from typing import Any, Callable, override, Self, Sequence
 from uuid import UUID
 
+import numpy as np
 import pandas as pd
 
 from faz.bot.app.discord.embed.builder._base_field_builder import BaseFieldBuilder
@@ -103,26 +104,8 @@ class PlayerHistoryFieldBuilder(BaseFieldBuilder):
         if not guildrank1 == guildrank2:
             lines["Guild Rank"] = f"{guildrank1} -> {guildrank2}"
 
-        for chuuid in pd.unique(self._char_df["character_uuid"]):
-            char = self._char_df[self._char_df["character_uuid"] == chuuid]
-            idxmin = char["datetime"].idxmin()  # type: ignore
-            idxmax = char["datetime"].idxmax()  # type: ignore
-
-            for name, col in char.items():  # type: ignore
-                if name in ["character_uuid", "datetime", "unique_id"]:
-                    continue
-                before = col.iloc[idxmin]
-                after = col.iloc[idxmax]
-
-                if before == after:
-                    continue
-
-                diff = after - before
-                line = self._format_number(diff)
-                if diff > 0:
-                    name: str
-                    name = name.replace("_", " ").title()
-                    lines[name] = f"+{line}"
+        if not self._char_df.empty:
+            self._add_character_diff_lines(lines)
 
         label_space = self._get_max_key_length(lines)
         desc = "\n".join(
@@ -132,6 +115,37 @@ class PlayerHistoryFieldBuilder(BaseFieldBuilder):
         self._add_embed_field(ret, "All", desc)
         return ret
 
+    def _add_character_diff_lines(self, lines: dict[str, str]) -> None:
+        """Adds the increase of each stat between the earliest and latest row of each character.
+
+        If several characters increased the same stat, the last one is shown.
+        """
+        char_df = self._char_df
+        value_columns = [
+            col for col in char_df.columns if col not in ("character_uuid", "datetime", "unique_id")
+        ]
+        befores = char_df.drop_duplicates("character_uuid", keep="first").set_index(
+            "character_uuid"
+        )
+        afters = (
+            char_df.drop_duplicates("character_uuid", keep="last")
+            .set_index("character_uuid")
+            .loc[befores.index]
+        )
+        before_cols = [befores[col].to_numpy() for col in value_columns]
+        after_cols = [afters[col].to_numpy() for col in value_columns]
+        is_changed = np.column_stack(
+            [before != after for before, after in zip(before_cols, after_cols)]
+        )
+
+        # Only the changed cells need formatting. nonzero() walks characters first, then columns
+        for char_idx, col_idx in zip(*is_changed.nonzero()):
+            diff = after_cols[col_idx][char_idx] - before_cols[col_idx][char_idx]
+            line = self._format_number(diff)
+            if diff > 0:
+                name = value_columns[col_idx].replace("_", " ").title()
+                lines[name] = f"+{line}"
+
     def _parser_categorical_guild(self) -> Sequence[EmbedField]:
         lines = []
         prev_value = None
@@ -167,24 +181,21 @@ class PlayerHistoryFieldBuilder(BaseFieldBuilder):
 
     def _common_numerical_parser(
         self,
-        value_parser: Callable[[pd.Series], str],
+        value_parser: Callable[[pd.DataFrame], pd.Series],
         string_parser: Callable[[str, Any], str],
     ) -> Sequence[EmbedField]:
         ret: Sequence[EmbedField] = []
+        if self._char_df.empty:
+            return ret
+        chars = self._char_df.groupby("character_uuid", sort=False, observed=True)
         for chuuid, chlabel in self._character_labels.items():
-            char = self._char_df[self._char_df["character_uuid"] == UUID(chuuid).bytes]
-            lines: list[str] = []
-            prev_value = None
-            for _, row in char.iterrows():
-                value = value_parser(row)
-                if prev_value == value:
-                    continue
-                prev_value = value
-                timestamp = self._get_formatted_timestamp(row)
-                line = string_parser(timestamp, value)
-                lines.append(line)
-            if prev_value is None:
+            chuuid_bytes = UUID(chuuid).bytes
+            if chuuid_bytes not in chars.groups:
                 continue
+            char = chars.get_group(chuuid_bytes)
+            lines = self._get_change_point_lines(
+                char["datetime"], value_parser(char), string_parser
+            )
             desc = "\n".join(lines)
             self._add_embed_field(ret, chlabel, desc)
         return ret
@@ -193,8 +204,8 @@ class PlayerHistoryFieldBuilder(BaseFieldBuilder):
         self,
     ) -> Sequence[EmbedField]:
         """level + (xp/100)"""
-        # value_parser = lambda row: row["level"] + row["xp"] / 100
-        value_parser = lambda row: row["level"]
+        # value_parser = lambda df: df["level"] + df["xp"] / 100
+        value_parser = lambda df: df["level"]
         ret = self._common_numerical_parser(
             value_parser, self._common_numerical_float_string_parser
         )
@@ -204,7 +215,7 @@ class PlayerHistoryFieldBuilder(BaseFieldBuilder):
         self,
     ) -> Sequence[EmbedField]:
         """wars"""
-        value_parser = lambda row: row["wars"]
+        value_parser = lambda df: df["wars"]
         ret = self._common_numerical_parser(value_parser, self._common_numerical_int_string_parser)
         return ret
 
@@ -212,7 +223,7 @@ class PlayerHistoryFieldBuilder(BaseFieldBuilder):
         self,
     ) -> Sequence[EmbedField]:
         """playtime"""
-        value_parser = lambda row: row["playtime"]
+        value_parser = lambda df: df["playtime"]
         ret = self._common_numerical_parser(
             value_parser, self._common_numerical_float_string_parser
         )
@@ -222,7 +233,7 @@ class PlayerHistoryFieldBuilder(BaseFieldBuilder):
         self,
     ) -> Sequence[EmbedField]:
         """mobs_killed"""
-        value_parser = lambda row: row["mobs_killed"]
+        value_parser = lambda df: df["mobs_killed"]
         ret = self._common_numerical_parser(value_parser, self._common_numerical_int_string_parser)
         return ret
 
@@ -230,7 +241,7 @@ class PlayerHistoryFieldBuilder(BaseFieldBuilder):
         self,
     ) -> Sequence[EmbedField]:
         """chests_found"""
-        value_parser = lambda row: row["chests_found"]
+        value_parser = lambda df: df["chests_found"]
         ret = self._common_numerical_parser(value_parser, self._common_numerical_int_string_parser)
         return ret
 
@@ -238,7 +249,7 @@ class PlayerHistoryFieldBuilder(BaseFieldBuilder):
         self,
     ) -> Sequence[EmbedField]:
         """logins"""
-        value_parser = lambda row: row["logins"]
+        value_parser = lambda df: df["logins"]
         ret = self._common_numerical_parser(value_parser, self._common_numerical_int_string_parser)
         return ret
 
@@ -246,7 +257,7 @@ class PlayerHistoryFieldBuilder(BaseFieldBuilder):
         self,
     ) -> Sequence[EmbedField]:
         """deaths"""
-        value_parser = lambda row: row["deaths"]
+        value_parser = lambda df: df["deaths"]
         ret = self._common_numerical_parser(value_parser, self._common_numerical_int_string_parser)
         return ret
 
@@ -0,0 +1,76 @@
+from numbers import Number
+from typing import Any, Iterable, Sequence
+
+
+class TableBuilder:
+    """A builder class for fixed-width text tables, laid out like the tabulate "github" format.
+
+    Column widths are computed once, across all rows, so every page of a paginated table has the
+    same layout. Every row is formatted once, and building a page only joins its lines.
+
+    Numeric columns, whose values are all numbers, are right-aligned. Other columns are
+    left-aligned. Unlike tabulate, floats are not aligned at the decimal point, and strings are
+    never parsed as numbers.
+    """
+
+    MIN_PADDING = 2
+    """Extra width of a column over its header, the same as tabulate."""
+
+    def __init__(self, header: Sequence[str], rows: Iterable[Iterable[Any]]) -> None:
+        """Initialize a new TableBuilder instance.
+
+        Args:
+            header (Sequence[str]): The column headers.
+            rows (Iterable[Iterable[Any]]): The rows of the table.
+        """
+        rows = [tuple(row) for row in rows]
+        cells = [[self._format_cell(value) for value in row] for row in rows]
+        columns = list(zip(*rows))
+        is_numeric = [self._is_numeric(column) for column in columns] or [False] * len(header)
+        widths = [len(name) + self.MIN_PADDING for name in header]
+        for row in cells:
+            widths = [max(width, len(cell)) for width, cell in zip(widths, row)]
+
+        def format_line(row: Sequence[str]) -> str:
+            aligned = (
+                cell.rjust(width) if numeric else cell.ljust(width)
+                for cell, width, numeric in zip(row, widths, is_numeric)
+            )
+            return "| " + " | ".join(aligned) + " |"
+
+        self._header_lines = (
+            format_line(header),
+            "|" + "|".join("-" * (width + 2) for width in widths) + "|",
+        )
+        self._row_lines = [format_line(row) for row in cells]
+
+    def build(self, start: int = 0, stop: int | None = None) -> str:
+        """Build the table with the rows from `start` up to `stop`.
+
+        Args:
+            start (int, optional): Index of the first row. Defaults to 0.
+            stop (int | None, optional): Index after the last row. Defaults to None, the end.
+
+        Returns:
+            str: The header lines and the rows, one per line.
+        """
+        return "\n".join((*self._header_lines, *self._row_lines[start:stop]))
+
+    @staticmethod
+    def _format_cell(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            return f"{value:g}"
+        return str(value).strip()
+
+    @staticmethod
+    def _is_numeric(column: Sequence[Any]) -> bool:
+        values = [value for value in column if value is not None]
+        return len(values) > 0 and all(
+            isinstance(value, Number) and not isinstance(value, bool) for value in values
+        )
+
+    @property
+    def row_count(self) -> int:
+        return len(self._row_lines)
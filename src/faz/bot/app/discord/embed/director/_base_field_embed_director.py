@@ -1,13 +1,120 @@
+from __future__ import annotations
+
 from abc import ABC
-from typing import override, Sequence
+import asyncio
+from typing import Callable, Hashable, Iterable, override, Sequence, TYPE_CHECKING
 
+from faz.bot.app.discord.bot._metrics import timed_phase
 from faz.bot.app.discord.embed.director._base_pagination_embed_director import (
     BasePaginationEmbedDirector,
 )
 from faz.bot.app.discord.embed.embed_field import EmbedField
 
+if TYPE_CHECKING:
+    from faz.bot.app.discord.embed.builder.embed_builder import EmbedBuilder
+
 
 class BaseFieldEmbedDirector(BasePaginationEmbedDirector[EmbedField], ABC):
+    """Pagination embed director whose items are embed fields.
+
+    Fields are packed into pages greedily, in one pass, up to Discord's limits on the size and
+    field count of an embed, so that every page can be sent and as few pages as possible are
+    needed.
+
+    Directors with selectable options build their fields through `_get_fields`, which memoizes
+    the fields of each option for the lifetime of the director, so switching back to an option
+    doesn't rebuild its fields.
+    """
+
+    EMBED_SIZE_LIMIT = 6000
+    """Maximum total length of the title, description, fields, footer and author of an embed."""
+    EMBED_FIELD_LIMIT = 25
+    """Maximum number of fields of an embed."""
+    AUTHOR_NAME_RESERVE = 256
+    """Length reserved for the author name, which is only set when the embed is built."""
+
+    def __init__(
+        self,
+        embed_builder: EmbedBuilder,
+        *,
+        items: Sequence[EmbedField] | None = None,
+        items_per_page: int = EMBED_FIELD_LIMIT,
+    ) -> None:
+        """
+        Args:
+            embed_builder (EmbedBuilder): Builds the pages. Its initial embed when the items are
+                paginated is counted towards the size of every page.
+            items (Sequence[EmbedField] | None, optional): The fields to paginate. Defaults to
+                None.
+            items_per_page (int, optional): Maximum number of fields per page. Defaults to
+                EMBED_FIELD_LIMIT.
+        """
+        super().__init__(embed_builder, items=items, items_per_page=items_per_page)
+        self._fields_cache: dict[Hashable, Sequence[EmbedField]] = {}
+
+    async def precompute_fields(self) -> None:
+        """Builds and memoizes the fields of every option.
+
+        Yields to the event loop between options, so it can run as a background task.
+        """
+        for key, build in self._iter_field_builds():
+            if key in self._fields_cache:
+                continue
+            self._fields_cache[key] = build()
+            await asyncio.sleep(0)
+
+    def _get_fields(
+        self, key: Hashable, build: Callable[[], Sequence[EmbedField]]
+    ) -> Sequence[EmbedField]:
+        """Gets the fields of an option, building them with `build` on the first call.
+
+        Args:
+            key (Hashable): Identifies the option, e.g. `(data, mode)`.
+            build (Callable[[], Sequence[EmbedField]]): Builds the fields of the option.
+
+        Returns:
+            Sequence[EmbedField]: The fields of the option.
+        """
+        if key not in self._fields_cache:
+            with timed_phase("field_build"):
+                self._fields_cache[key] = build()
+        return self._fields_cache[key]
+
+    def _iter_field_builds(
+        self,
+    ) -> Iterable[tuple[Hashable, Callable[[], Sequence[EmbedField]]]]:
+        """Yields the `_get_fields` key and build function of every option.
+
+        Used by `precompute_fields`. Yields nothing by default.
+        """
+        return ()
+
+    @override
+    def _paginate(self, items: Sequence[EmbedField]) -> list[int]:
+        size_budget = (
+            self.EMBED_SIZE_LIMIT - self.AUTHOR_NAME_RESERVE - len(self.embed_builder.initial_embed)
+        )
+        field_budget = min(self.items_per_page, self.EMBED_FIELD_LIMIT)
+        sizes = [len(field.name) + len(field.value) for field in items]
+        if len(items) <= field_budget and sum(sizes) <= size_budget:
+            return [0, len(items)]
+
+        # Leave room for the page field, whose page numbers are at most len(items)
+        size_budget -= len("Page") + len(f"({len(items)} / {len(items)})")
+        field_budget = min(field_budget, self.EMBED_FIELD_LIMIT - 1)
+        page_bounds = [0]
+        page_size = 0
+        for i, size in enumerate(sizes):
+            page_start = page_bounds[-1]
+            if i > page_start and (
+                i - page_start == field_budget or page_size + size > size_budget
+            ):
+                page_bounds.append(i)
+                page_size = 0
+            page_size += size
+        page_bounds.append(len(items))
+        return page_bounds
+
     @override
     def _process_page_items(self, items: Sequence[EmbedField]) -> None:
         self.embed_builder.add_fields(items)
@@ -2,26 +2,38 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
-from typing import Self, Sequence, TYPE_CHECKING
+import asyncio
+from collections import OrderedDict
+from typing import Any, Hashable, Self, Sequence, TYPE_CHECKING
 
+from nextcord import Embed
+
+from faz.bot.app.discord.bot._metrics import timed_phase
 from faz.bot.app.discord.embed.director._base_embed_director import BaseEmbedDirector
 from faz.bot.app.discord.embed.embed_field import EmbedField
 
 if TYPE_CHECKING:
-    from nextcord import Embed
-
     from faz.bot.app.discord.embed.builder.embed_builder import EmbedBuilder
 
 
 class BasePaginationEmbedDirector[T](BaseEmbedDirector, ABC):
     """Abstract base class that provides functionality for paginating items in an embed.
 
+    Items are split into pages by `_paginate`, once per `set_items`. By default every page holds
+    `items_per_page` items.
+
+    Rendered pages are cached by render key and page number, so showing a page again doesn't
+    rebuild it. `prerender_neighbours` fills the cache with the pages around the current one.
+
     Attributes:
         _items (Sequence[T]): The sequence of items to paginate.
         _items_per_page (int): The number of items to display per page.
         _current_page (int): The current page number.
     """
 
+    PAGE_CACHE_SIZE = 64
+    """Maximum number of rendered pages kept."""
+
     def __init__(
         self,
         embed_builder: EmbedBuilder,
@@ -34,6 +46,9 @@ class BasePaginationEmbedDirector[T](BaseEmbedDirector, ABC):
         self._items = items
         self._items_per_page = items_per_page
         self._current_page = 1
+        self._page_bounds: list[int] | None = None
+        self._render_key: Hashable = object()
+        self._page_cache: OrderedDict[tuple[Hashable, int], dict[str, Any]] = OrderedDict()
 
     @abstractmethod
     def _process_page_items(self, items: Sequence[T]) -> None:
@@ -56,7 +71,7 @@ class BasePaginationEmbedDirector[T](BaseEmbedDirector, ABC):
         ...
 
     def construct_page(self, page: int) -> Embed:
-        """Construct an embed page.
+        """Construct an embed page, or copy it from the page cache.
 
         Args:
             page (int): Page of the embed to construct.
@@ -64,20 +79,47 @@ class BasePaginationEmbedDirector[T](BaseEmbedDirector, ABC):
         Returns:
             Embed: Constructed embed.
         """
-        self.embed_builder.reset()
-        items = self.set_page(page).get_items()
-        if len(items) == 0:
-            self._add_empty_field("")
-        else:
-            self._process_page_items(items)
-            if self.page_count > 1:
-                self._add_page_field()
-        embed = self.embed_builder.build()
-        return embed
+        self.set_page(page)
+        rendered = self._page_cache.get((self._render_key, page))
+        if rendered is None:
+            return self._render_page(page)
+        self._page_cache.move_to_end((self._render_key, page))
+        return Embed.from_dict(rendered)
+
+    async def prerender_neighbours(self) -> None:
+        """Renders the pages before and after the current page into the page cache, wrapping
+        around like the navigation buttons do.
+
+        Yields to the event loop between pages, so it can run as a background task.
+        """
+        current_page = self._current_page
+        next_page = current_page % self.page_count + 1
+        previous_page = (current_page - 2) % self.page_count + 1
+        for page in (next_page, previous_page):
+            # The items may have changed while yielding
+            if not self._check_page(page) or (self._render_key, page) in self._page_cache:
+                continue
+            shown_page = self._current_page
+            self._render_page(page)
+            self._current_page = shown_page
+            await asyncio.sleep(0)
+
+    def set_items(self, items: Sequence[T], render_key: Hashable | None = None) -> Self:
+        """Set pagination items for the builder.
+
+        Args:
+            items (Sequence[T]): The items to paginate.
+            render_key (Hashable | None, optional): Identifies everything the pages depend on
+                besides the page number, e.g. the selected options. Pages rendered under the
+                same key are reused. If None, pages are reused until the items are set again.
+                Defaults to None.
 
-    def set_items(self, items: Sequence[T]) -> Self:
-        """Set pagination items for the builder."""
+        Returns:
+            Self: Returns self for method chaining.
+        """
         self._items = items
+        self._page_bounds = None
+        self._render_key = object() if render_key is None else render_key
         return self
 
     def set_page(self, page: int) -> Self:
@@ -112,9 +154,48 @@ class BasePaginationEmbedDirector[T](BaseEmbedDirector, ABC):
         page = page or self._current_page
         if not self._check_page(page):
             raise ValueError(f"Invalid page number: {page}")
-        l_idx = self.items_per_page * (page - 1)
-        r_idx = self.items_per_page * page
-        return self.items[l_idx:r_idx]
+        page_bounds = self._get_page_bounds()
+        return self.items[page_bounds[page - 1] : page_bounds[page]]
+
+    def _paginate(self, items: Sequence[T]) -> list[int]:
+        """Splits the items into pages.
+
+        Args:
+            items (Sequence[T]): The items to paginate.
+
+        Returns:
+            list[int]: Index of the first item of every page, followed by `len(items)`. Has at
+                least two elements, so that there is always one page.
+        """
+        if len(items) == 0:
+            return [0, 0]
+        return [*range(0, len(items), self._items_per_page), len(items)]
+
+    def _get_page_bounds(self) -> list[int]:
+        """Gets the `_paginate` result of the current items, paginating them on the first call."""
+        if self._page_bounds is None:
+            self._page_bounds = self._paginate(self._items)
+        return self._page_bounds
+
+    def _render_page(self, page: int) -> Embed:
+        """Renders a page into the page cache. Sets the current page.
+
+        The cache holds a dict of the embed, so changes to the returned embed don't reach it.
+        """
+        with timed_phase("embed_build"):
+            self.embed_builder.reset()
+            items = self.set_page(page).get_items()
+            if len(items) == 0:
+                self._add_empty_field("")
+            else:
+                self._process_page_items(items)
+                if self.page_count > 1:
+                    self._add_page_field()
+            embed = self.embed_builder.build()
+        self._page_cache[(self._render_key, page)] = embed.to_dict()
+        if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+        return embed
 
     def _add_empty_field(self, name: str, inline: bool = False) -> None:
         field = EmbedField(name=name, value="```No data found.\n```", inline=inline)
@@ -150,4 +231,4 @@ class BasePaginationEmbedDirector[T](BaseEmbedDirector, ABC):
 
     @property
     def page_count(self) -> int:
-        return max(1, -(-len(self._items) // self._items_per_page))
+        return len(self._get_page_bounds()) - 1
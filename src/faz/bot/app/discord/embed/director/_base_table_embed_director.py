@@ -1,16 +1,24 @@
 from abc import ABC
-from typing import Any, Iterable, override, Sequence
+from typing import Any, Hashable, Iterable, override, Self, Sequence
 
 from tabulate import TableFormat
 from tabulate import tabulate
 
 from faz.bot.app.discord.embed.builder.embed_builder import EmbedBuilder
+from faz.bot.app.discord.embed.builder.table_builder import TableBuilder
 from faz.bot.app.discord.embed.director._base_pagination_embed_director import (
     BasePaginationEmbedDirector,
 )
 
 
 class BaseTableEmbedDirector(BasePaginationEmbedDirector[Iterable[Any]], ABC):
+    """Pagination embed director whose items are the rows of a table.
+
+    "github" tables are rendered by `TableBuilder`, with the same column widths on every page.
+    Other formats, or every format if `use_tabulate` is set, are rendered by `tabulate` one page
+    at a time, with column widths fitted to each page.
+    """
+
     def __init__(
         self,
         embed_builder: EmbedBuilder,
@@ -19,20 +27,32 @@ class BaseTableEmbedDirector(BasePaginationEmbedDirector[Iterable[Any]], ABC):
         items_per_page: int = 20,
         item_header: Sequence[str],
         table_format: str | TableFormat = "github",
+        use_tabulate: bool = False,
     ) -> None:
         super().__init__(embed_builder, items=items, items_per_page=items_per_page)
         self.item_header = item_header
         self.table_format = table_format
+        self.use_tabulate = use_tabulate
+        self._table_builder: TableBuilder | None = None
+
+    @override
+    def set_items(self, items: Sequence[Iterable[Any]], render_key: Hashable | None = None) -> Self:
+        self._table_builder = None
+        return super().set_items(items, render_key)
 
     @override
     def _process_page_items(self, items: Sequence[Iterable[Any]]) -> None:
-        desc = (
-            "```ml\n"
-            + tabulate(
-                items,
-                headers=self.item_header,
-                tablefmt=self.table_format,
-            )
-            + "\n```"
-        )
-        self.embed_builder.set_description(desc)
+        if self.use_tabulate or self.table_format != "github":
+            table = tabulate(items, headers=self.item_header, tablefmt=self.table_format)
+        else:
+            start = self._get_page_bounds()[self.current_page - 1]
+            table = self._get_table_builder().build(start, start + len(items))
+        self.embed_builder.set_description("```ml\n" + table + "\n```")
+
+    def _get_table_builder(self) -> TableBuilder:
+        """Gets the table of all items, formatting it on the first call after the items are
+        set.
+        """
+        if self._table_builder is None:
+            self._table_builder = TableBuilder(self.item_header, self.items)
+        return self._table_builder
@@ -4,6 +4,8 @@ from datetime import timedelta
 from typing import Iterable, override, TYPE_CHECKING
 
 from nextcord import Embed
+import numpy as np
+import pandas as pd
 from sortedcontainers import SortedList
 
 from faz.bot.app.discord.embed.builder.description_builder import DescriptionBuilder
@@ -15,7 +17,6 @@ if TYPE_CHECKING:
     from datetime import datetime
 
     from faz.bot.database.fazwynn.model.guild_info import GuildInfo
-    from faz.bot.database.fazwynn.model.player_activity_history import PlayerActivityHistory
 
     from faz.bot.app.discord.view.wynn_history.guild_activity_view import GuildActivityView
 
@@ -42,7 +43,7 @@ class GuildActivityEmbedDirector(BaseTableEmbedDirector):
             view.interaction, Embed(title=f"Guild Member Activity ({guild.name})")
         )
 
-        self._db = view.bot.app.create_fazwynn_db()
+        self._loader = view.bot.dataframe_loader
 
         super().__init__(self._embed_builder, item_header=["#", "Username", "Activity"])
 
@@ -60,34 +61,52 @@ class GuildActivityEmbedDirector(BaseTableEmbedDirector):
     async def _fetch_data(self) -> None:
         await self._guild.awaitable_attrs.members
 
+        sessions = await self._loader.player_activities(
+            (member.uuid for member in self._guild.members), self._period_begin, self._period_end
+        )
+        activity_times = self._get_activity_times(sessions, self._period_begin, self._period_end)
+
         self._activities: Iterable[_ActivityResult] = SortedList()
         for player in self._guild.members:
-            entities = await self._db.player_activity_history.get_activities_between_period(
-                player.uuid, self._period_begin, self._period_end
-            )
-            playtime = self._get_activity_time(entities, self._period_begin, self._period_end)
+            playtime = timedelta(seconds=activity_times.get(player.uuid, 0.0))
             activity_result = _ActivityResult(player.latest_username, playtime)
             if not self._show_inactive and activity_result.playtime.total_seconds() < 60:
                 continue
             self._activities.add(activity_result)
 
     @staticmethod
-    def _get_activity_time(
-        entities: Iterable[PlayerActivityHistory],
+    def _get_activity_times(
+        sessions: pd.DataFrame,
         period_begin: datetime,
         period_end: datetime,
-    ) -> timedelta:
-        res = 0
-        begin_ts = period_begin.timestamp()
-        end_ts = period_end.timestamp()
-        for e in entities:
-            on_ts = e.logon_datetime.timestamp()
-            off_ts = e.logoff_datetime.timestamp()
-            on = begin_ts if on_ts <= begin_ts else on_ts
-            off = end_ts if off_ts >= end_ts else off_ts
-            res += off - on
-        ret = timedelta(seconds=res)
-        return ret
+    ) -> dict[bytes, float]:
+        """Sums the seconds each player was online within the period.
+
+        Sessions are clipped to the period, so a session which started before `period_begin` or
+        ended after `period_end` only counts its part within the period.
+
+        Args:
+            sessions (pd.DataFrame): `uuid`, `logon_datetime` and `logoff_datetime` of sessions
+                overlapping the period.
+            period_begin (datetime): The start of the period.
+            period_end (datetime): The end of the period.
+
+        Returns:
+            dict[bytes, float]: Seconds online within the period, keyed by player UUID.
+        """
+        if sessions.empty:
+            return {}
+        # Session datetimes are naive local time, the same as what datetime.timestamp() assumes
+        begin = np.datetime64(period_begin.astimezone().replace(tzinfo=None), "us")
+        end = np.datetime64(period_end.astimezone().replace(tzinfo=None), "us")
+        logon = sessions["logon_datetime"].to_numpy(dtype="datetime64[us]")
+        logoff = sessions["logoff_datetime"].to_numpy(dtype="datetime64[us]")
+
+        seconds = (np.minimum(logoff, end) - np.maximum(logon, begin)) / np.timedelta64(1, "s")
+        # Sessions outside the period overlap it by a negative duration
+        seconds = np.clip(seconds, 0, None)
+        playtimes = pd.Series(seconds, index=sessions["uuid"].to_numpy()).groupby(level=0).sum()
+        return playtimes.to_dict()
 
 
 class _ActivityResult:
@@ -1,22 +1,24 @@
 from __future__ import annotations
 
-from typing import override, Self, TYPE_CHECKING
+from functools import partial
+from typing import Callable, Hashable, Iterable, override, Self, Sequence, TYPE_CHECKING
 
 from nextcord import Embed
-import pandas as pd
 
 from faz.bot.app.discord.embed.builder.description_builder import DescriptionBuilder
 from faz.bot.app.discord.embed.builder.embed_builder import EmbedBuilder
 from faz.bot.app.discord.embed.builder.guild_history_field_builder import GuildHistoryFieldBuilder
 from faz.bot.app.discord.embed.director._base_field_embed_director import BaseFieldEmbedDirector
+from faz.bot.app.discord.embed.embed_field import EmbedField
+from faz.bot.app.discord.history.normalize import normalize_player_history
+from faz.bot.app.discord.select.guild_history_data_options import GuildHistoryDataOption
+from faz.bot.app.discord.select.guild_history_mode_options import GuildHistoryModeOptions
 
 if TYPE_CHECKING:
     from datetime import datetime
 
     from faz.bot.database.fazwynn.model.guild_info import GuildInfo
 
-    from faz.bot.app.discord.select.guild_history_data_options import GuildHistoryDataOption
-    from faz.bot.app.discord.select.guild_history_mode_options import GuildHistoryModeOptions
     from faz.bot.app.discord.view.wynn_history.guild_history_view import GuildHistoryView
 
 
@@ -41,9 +43,9 @@ class GuildHistoryEmbedDirector(BaseFieldEmbedDirector):
         )
         self.field_builder = GuildHistoryFieldBuilder()
 
-        self._db = view.bot.app.create_fazwynn_db()
+        self._loader = view.bot.dataframe_loader
 
-        super().__init__(self._embed_builder, items_per_page=5)
+        super().__init__(self._embed_builder)
 
     @override
     async def setup(self) -> None:
@@ -51,9 +53,7 @@ class GuildHistoryEmbedDirector(BaseFieldEmbedDirector):
         self.field_builder.set_data(self._player_df, self._guild_df)
 
     def set_options(self, data: GuildHistoryDataOption, mode: GuildHistoryModeOptions) -> Self:
-        fields = self.field_builder.set_data_option(data).set_mode_option(mode).build()
-        self.set_items(fields)
-
+        key = (mode, None if mode == GuildHistoryModeOptions.OVERALL else data)
         description = (
             self._desc_builder.reset()
             .add_line("Data", data.value)
@@ -63,20 +63,46 @@ class GuildHistoryEmbedDirector(BaseFieldEmbedDirector):
         embed = self._embed_builder.reset().set_description(description).get_embed()
         self.embed_builder.set_builder_initial_embed(embed)
 
+        fields = self._get_fields(key, lambda: self._build_fields(data, mode))
+        self.set_items(fields, render_key=(data, mode))
+
         return self
 
+    @override
+    def _iter_field_builds(
+        self,
+    ) -> Iterable[tuple[Hashable, Callable[[], Sequence[EmbedField]]]]:
+        yield (
+            (GuildHistoryModeOptions.OVERALL, None),
+            partial(
+                self._build_fields,
+                GuildHistoryDataOption.MEMBER_LIST,
+                GuildHistoryModeOptions.OVERALL,
+            ),
+        )
+        for data in GuildHistoryDataOption:
+            yield (
+                (GuildHistoryModeOptions.HISTORICAL, data),
+                partial(self._build_fields, data, GuildHistoryModeOptions.HISTORICAL),
+            )
+
+    def _build_fields(
+        self, data: GuildHistoryDataOption, mode: GuildHistoryModeOptions
+    ) -> Sequence[EmbedField]:
+        return self.field_builder.set_data_option(data).set_mode_option(mode).build()
+
     async def _fetch_data(self) -> None:
         await self._guild.awaitable_attrs.members
 
-        self._player_df = pd.DataFrame()
-        for member in self._guild.members:
-            player_df_: pd.DataFrame = self._db.player_history.select_between_period_as_dataframe(
-                member.uuid, self._period_begin, self._period_end
-            )
-            if player_df_.empty:
-                continue
-            self._player_df = pd.concat([self._player_df, player_df_])
-
-        self._guild_df = self._db.guild_history.select_between_period_as_dataframe(
-            self._guild.uuid, self._period_begin, self._period_end
+        player_df, self._guild_df = await self._loader.gather(
+            partial(
+                self._loader.player_histories,
+                [member.uuid for member in self._guild.members],
+                self._period_begin,
+                self._period_end,
+            ),
+            partial(
+                self._loader.guild_history, self._guild.uuid, self._period_begin, self._period_end
+            ),
         )
+        self._player_df = normalize_player_history(player_df)
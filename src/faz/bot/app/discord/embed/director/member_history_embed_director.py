@@ -1,23 +1,23 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from datetime import datetime
-from typing import override, Self, TYPE_CHECKING
-from uuid import UUID
+from functools import partial
+from typing import Callable, Hashable, Iterable, override, Self, Sequence, TYPE_CHECKING
 
 from nextcord import Embed
-import pandas as pd
 
 from faz.bot.app.discord.embed.builder.description_builder import DescriptionBuilder
 from faz.bot.app.discord.embed.builder.embed_builder import EmbedBuilder
 from faz.bot.app.discord.embed.builder.member_history_field_builder import MemberHistoryFieldBuilder
 from faz.bot.app.discord.embed.director._base_field_embed_director import BaseFieldEmbedDirector
+from faz.bot.app.discord.embed.embed_field import EmbedField
+from faz.bot.app.discord.history.character_history_context import CharacterHistoryContext
+from faz.bot.app.discord.select.member_history_data_option import MemberHistoryDataOption
+from faz.bot.app.discord.select.member_history_mode_option import MemberHistoryModeOption
 
 if TYPE_CHECKING:
     from faz.bot.database.fazwynn.model.player_info import PlayerInfo
 
-    from faz.bot.app.discord.select.member_history_data_option import MemberHistoryDataOption
-    from faz.bot.app.discord.select.member_history_mode_option import MemberHistoryModeOption
     from faz.bot.app.discord.view.wynn_history.member_history_view import MemberHistoryView
 
 
@@ -42,23 +42,20 @@ class MemberHistoryEmbedDirector(BaseFieldEmbedDirector):
         )
         self.field_builder = MemberHistoryFieldBuilder()
 
-        self._db = view.bot.app.create_fazwynn_db()
+        self._loader = view.bot.dataframe_loader
+        self._characters = CharacterHistoryContext(self._loader, player, period_begin, period_end)
 
-        super().__init__(self._embed_builder, items_per_page=5)
+        super().__init__(self._embed_builder)
 
     @override
     async def setup(self) -> None:
-        await self._player.awaitable_attrs.characters
-        self._fetch_data()
-        await self._setup_character_lables()
+        await self._fetch_data()
         self.field_builder.set_data(self._char_df, self._member_df).set_character_labels(
             self._character_labels
         )
 
     def set_options(self, data: MemberHistoryDataOption, mode: MemberHistoryModeOption) -> Self:
-        fields = self.field_builder.set_data_option(data).set_mode_option(mode).build()
-        self.set_items(fields)
-
+        key = (mode, None if mode == MemberHistoryModeOption.OVERALL else data)
         description = (
             self._desc_builder.reset()
             .add_line("Data", data.value)
@@ -68,39 +65,41 @@ class MemberHistoryEmbedDirector(BaseFieldEmbedDirector):
         embed = self._embed_builder.reset().set_description(description).get_embed()
         self.embed_builder.set_builder_initial_embed(embed)
 
-        return self
-
-    def _fetch_data(self) -> None:
-        self._char_df = pd.DataFrame()
+        fields = self._get_fields(key, lambda: self._build_fields(data, mode))
+        self.set_items(fields, render_key=(data, mode))
 
-        for ch in self._player.characters:
-            df_char_ = self._db.character_history.select_between_period_as_dataframe(
-                ch.character_uuid, self._period_begin, self._period_end
-            )
-            if df_char_.empty:
-                continue
-            self._char_df = pd.concat([self._char_df, df_char_])
+        return self
 
-        self._member_df = self._db.guild_member_history.select_between_period_as_dataframe(
-            self._player.uuid, self._period_begin, self._period_end
+    @override
+    def _iter_field_builds(
+        self,
+    ) -> Iterable[tuple[Hashable, Callable[[], Sequence[EmbedField]]]]:
+        yield (
+            (MemberHistoryModeOption.OVERALL, None),
+            partial(
+                self._build_fields, MemberHistoryDataOption.WARS, MemberHistoryModeOption.OVERALL
+            ),
         )
-
-    async def _setup_character_lables(self) -> None:
-        ch_counter = defaultdict(int)
-        self._character_labels = {}
-        for ch in self._player.characters:
-            ch_hists = await self._db.character_history.select_between_period(
-                ch.character_uuid, self._period_begin, self._period_end
+        for data in MemberHistoryDataOption:
+            yield (
+                (MemberHistoryModeOption.HISTORICAL, data),
+                partial(self._build_fields, data, MemberHistoryModeOption.HISTORICAL),
             )
-            if len(ch_hists) == 0:
-                continue
-
-            ch_counter[ch.type] += 1
 
-            latest_ch_hist = max(ch_hists, key=lambda x: x.datetime)
-            total_level = latest_ch_hist.get_total_level()
-
-            label = f"{ch.type}{ch_counter[ch.type]} (Lv. {total_level})"
-            uuid = str(UUID(bytes=ch.character_uuid))
-
-            self._character_labels[uuid] = label
+    def _build_fields(
+        self, data: MemberHistoryDataOption, mode: MemberHistoryModeOption
+    ) -> Sequence[EmbedField]:
+        return self.field_builder.set_data_option(data).set_mode_option(mode).build()
+
+    async def _fetch_data(self) -> None:
+        characters, self._member_df = await self._loader.gather(
+            self._characters.load,
+            partial(
+                self._loader.guild_member_history,
+                self._player.uuid,
+                self._period_begin,
+                self._period_end,
+            ),
+        )
+        self._char_df = characters.character_df
+        self._character_labels = characters.character_labels
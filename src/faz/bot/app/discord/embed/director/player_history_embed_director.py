@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import override, Self, TYPE_CHECKING
+from functools import partial
+from typing import Callable, Hashable, Iterable, override, Self, Sequence, TYPE_CHECKING
 from uuid import UUID
 
 from faz.bot.database.fazwynn.model.player_info import PlayerInfo
@@ -12,9 +13,11 @@ from faz.bot.app.discord.embed.builder.description_builder import DescriptionBui
 from faz.bot.app.discord.embed.builder.embed_builder import EmbedBuilder
 from faz.bot.app.discord.embed.builder.player_history_field_builder import PlayerHistoryFieldBuilder
 from faz.bot.app.discord.embed.director._base_field_embed_director import BaseFieldEmbedDirector
+from faz.bot.app.discord.embed.embed_field import EmbedField
 from faz.bot.app.discord.select.player_history_data_option import PlayerHistoryDataOption
 
 if TYPE_CHECKING:
+    from faz.bot.app.discord.history.character_history_context import CharacterHistoryContext
     from faz.bot.app.discord.view.wynn_history.player_history_view import PlayerHistoryView
 
 
@@ -25,9 +28,10 @@ class PlayerHistoryEmbedDirector(BaseFieldEmbedDirector):
         player: PlayerInfo,
         period_begin: datetime,
         period_end: datetime,
-        character_labels: dict[str, str],
+        characters: CharacterHistoryContext,
     ) -> None:
-        self._character_labels = character_labels
+        self._characters = characters
+        self._character_labels = characters.character_labels
         self._period_begin = period_begin
         self._period_end = period_end
         self._player = player
@@ -38,11 +42,13 @@ class PlayerHistoryEmbedDirector(BaseFieldEmbedDirector):
 
         self._desc_builder = DescriptionBuilder([("Period", f"<t:{begin_ts}:R> to <t:{end_ts}:R>")])
         self._embed_builder = EmbedBuilder(view.interaction, initial_embed)
-        self._field_builder = PlayerHistoryFieldBuilder().set_character_labels(character_labels)
+        self._field_builder = PlayerHistoryFieldBuilder().set_character_labels(
+            self._character_labels
+        )
 
-        self._db = view.bot.app.create_fazwynn_db()
+        self._loader = view.bot.dataframe_loader
 
-        super().__init__(self._embed_builder, items_per_page=5)
+        super().__init__(self._embed_builder)
 
     @override
     async def setup(self) -> None:
@@ -52,12 +58,8 @@ class PlayerHistoryEmbedDirector(BaseFieldEmbedDirector):
 
     def set_options(self, data: PlayerHistoryDataOption, character_uuid: str | None = None) -> Self:
         if character_uuid is None:
-            char_df = self._char_df
             char_label = "All characters"
         else:
-            char_df: pd.DataFrame = self._char_df[  # type: ignore
-                self._char_df["character_uuid"] == UUID(character_uuid).bytes
-            ]
             char_label = self._character_labels[character_uuid]
 
         description = (
@@ -69,23 +71,37 @@ class PlayerHistoryEmbedDirector(BaseFieldEmbedDirector):
         embed = self._embed_builder.reset().set_description(description).get_embed()
         self.embed_builder.set_builder_initial_embed(embed)
 
-        fields = self._field_builder.set_data_option(data).set_character_data(char_df).build()
-        self.set_items(fields)
+        fields = self._get_fields(
+            (data, character_uuid), lambda: self._build_fields(data, character_uuid)
+        )
+        self.set_items(fields, render_key=(data, character_uuid))
 
         return self
 
+    @override
+    def _iter_field_builds(
+        self,
+    ) -> Iterable[tuple[Hashable, Callable[[], Sequence[EmbedField]]]]:
+        for character_uuid in (None, *self._character_labels):
+            for data in PlayerHistoryDataOption:
+                yield (data, character_uuid), partial(self._build_fields, data, character_uuid)
+
+    def _build_fields(
+        self, data: PlayerHistoryDataOption, character_uuid: str | None
+    ) -> Sequence[EmbedField]:
+        if character_uuid is None:
+            char_df = self._char_df
+        else:
+            char_df: pd.DataFrame = self._char_df[  # type: ignore
+                self._char_df["character_uuid"] == UUID(character_uuid).bytes
+            ]
+        return self._field_builder.set_data_option(data).set_character_data(char_df).build()
+
     async def _fetch_data(self) -> None:
-        await self._player.awaitable_attrs.characters
-
-        self._char_df = pd.DataFrame()
-        for ch in self._player.characters:
-            df_char_ = self._db.character_history.select_between_period_as_dataframe(
-                ch.character_uuid, self._period_begin, self._period_end
-            )
-            if df_char_.empty:
-                continue
-            self._char_df = pd.concat([self._char_df, df_char_])
-
-        self._player_df = self._db.player_history.select_between_period_as_dataframe(
-            self._player.uuid, self._period_begin, self._period_end
+        characters, self._player_df = await self._loader.gather(
+            self._characters.load,
+            partial(
+                self._loader.player_history, self._player.uuid, self._period_begin, self._period_end
+            ),
         )
+        self._char_df = characters.character_df
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import pandas as pd
+
+NON_VALUE_COLUMNS = ("datetime", "unique_id")
+"""History columns that change on every row without being a value."""
+
+
+class ChangePointReducer:
+    """Reduces time-ordered history, fed in chunks, to the rows the history builders read.
+
+    A row is kept if it is the first or last row of its entity, or if any of its value columns
+    differs from the previous row of the same entity. The dropped rows repeat the values of the
+    row before them, so change points, and earliest and latest values, are the same in the
+    reduced frame as in the full one. Only the kept rows and the current chunk are held in
+    memory, however long the period is.
+    """
+
+    def __init__(self, key: str, ignore: Iterable[str] = NON_VALUE_COLUMNS) -> None:
+        """
+        Args:
+            key (str): Column identifying the entity of each row.
+            ignore (Iterable[str], optional): Columns that change on every row without being a
+                value. Defaults to NON_VALUE_COLUMNS.
+        """
+        self._key = key
+        self._ignore = frozenset(ignore) | {key}
+        self._kept: list[pd.DataFrame] = []
+        self._last: pd.DataFrame | None = None
+        self._empty: pd.DataFrame | None = None
+        self._rows_fed = 0
+
+    def feed(self, chunk: pd.DataFrame) -> None:
+        """Adds the next chunk. Rows must come in the same order as the chunks before it.
+
+        Args:
+            chunk (pd.DataFrame): The next rows of the history.
+        """
+        # Number the rows across chunks, so that result() can restore the order
+        chunk = chunk.set_axis(pd.RangeIndex(self._rows_fed, self._rows_fed + len(chunk)))
+        self._rows_fed += len(chunk)
+        if self._empty is None:
+            self._empty = chunk.iloc[:0]
+        if chunk.empty:
+            return
+
+        # The last row of every entity so far comes first, so that the first row of the chunk
+        # is compared with the row before it
+        carried = 0 if self._last is None else len(self._last)
+        frame = chunk if self._last is None else pd.concat([self._last, chunk])
+        values = [column for column in frame.columns if column not in self._ignore]
+        previous = frame.groupby(self._key, sort=False)[values].shift()
+        is_kept = frame[values].ne(previous).any(axis=1) | ~frame[self._key].duplicated()
+
+        self._kept.append(chunk[is_kept.iloc[carried:].to_numpy()])
+        self._last = frame.drop_duplicates(self._key, keep="last")
+
+    def result(self) -> pd.DataFrame:
+        """Returns the kept rows in the order they were fed, with a fresh index."""
+        if self._last is None:
+            return pd.DataFrame() if self._empty is None else self._empty.reset_index(drop=True)
+        frame = pd.concat([*self._kept, self._last])
+        frame = frame[~frame.index.duplicated()].sort_index()
+        return frame.reset_index(drop=True)
+
+    @property
+    def rows_fed(self) -> int:
+        return self._rows_fed
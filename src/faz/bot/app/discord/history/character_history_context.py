@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from functools import partial
+import math
+from typing import Self, TYPE_CHECKING
+from uuid import UUID
+
+import pandas as pd
+
+from faz.bot.app.discord.history.normalize import normalize_character_history
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from faz.bot.database.fazwynn.model.player_info import PlayerInfo
+
+    from faz.bot.app.discord.history.dataframe_loader import DataFrameLoader
+
+
+TOTAL_LEVEL_COLUMNS = (
+    "level",
+    "alchemism",
+    "armouring",
+    "cooking",
+    "jeweling",
+    "scribing",
+    "tailoring",
+    "weaponsmithing",
+    "woodworking",
+    "mining",
+    "woodcutting",
+    "farming",
+    "fishing",
+)
+"""Columns summed by `CharacterHistory.get_total_level`."""
+
+
+class CharacterHistoryContext:
+    """The history of a player's characters over a period, loaded once per command.
+
+    Both the character labels of a view and the frames of its embed director are derived from
+    the same load, instead of querying every character twice.
+    """
+
+    def __init__(
+        self,
+        loader: DataFrameLoader,
+        player: PlayerInfo,
+        period_begin: datetime,
+        period_end: datetime,
+    ) -> None:
+        self._loader = loader
+        self._player = player
+        self._period_begin = period_begin
+        self._period_end = period_end
+
+        self._character_df = pd.DataFrame()
+        self._character_labels: dict[str, str] = {}
+        self._load_task: asyncio.Future[None] | None = None
+
+    async def load(self) -> Self:
+        """Loads the history of every character of the player. Loads once, concurrent and later
+        calls wait for the same load.
+        """
+        if self._load_task is None:
+            self._load_task = asyncio.ensure_future(self._load())
+        await self._load_task
+        return self
+
+    async def _load(self) -> None:
+        await self._player.awaitable_attrs.characters
+
+        characters = self._player.characters
+        char_dfs = await self._loader.gather(
+            *(
+                partial(
+                    self._loader.character_history,
+                    ch.character_uuid,
+                    self._period_begin,
+                    self._period_end,
+                )
+                for ch in characters
+            )
+        )
+
+        frames: list[pd.DataFrame] = []
+        type_counter: defaultdict[str, int] = defaultdict(int)
+        for ch, char_df in zip(characters, char_dfs):
+            if char_df.empty:
+                continue
+            frames.append(char_df)
+
+            type_counter[ch.type] += 1
+            latest = char_df.loc[char_df["datetime"].idxmax()]
+            label = f"{ch.type}{type_counter[ch.type]} (Lv. {self._get_total_level(latest)})"
+            self._character_labels[str(UUID(bytes=ch.character_uuid))] = label
+
+        if len(frames) > 0:
+            self._character_df = normalize_character_history(pd.concat(frames))
+
+    @staticmethod
+    def _get_total_level(row: pd.Series) -> int:
+        return sum(math.floor(row[column]) for column in TOTAL_LEVEL_COLUMNS)
+
+    @property
+    def character_df(self) -> pd.DataFrame:
+        """`CharacterHistory` records of all characters, with `character_uuid` encoded by
+        `normalize_character_history`.
+        """
+        return self._character_df
+
+    @property
+    def character_labels(self) -> dict[str, str]:
+        """Label of each character with history in the period, by character UUID string."""
+        return self._character_labels
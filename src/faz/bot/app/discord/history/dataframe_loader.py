@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from contextvars import ContextVar
+from datetime import timedelta
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Sequence, TYPE_CHECKING
+
+from faz.bot.database.fazwynn.model.character_history import CharacterHistory
+from faz.bot.database.fazwynn.model.guild_history import GuildHistory
+from faz.bot.database.fazwynn.model.guild_member_history import GuildMemberHistory
+from faz.bot.database.fazwynn.model.player_activity_history import PlayerActivityHistory
+from faz.bot.database.fazwynn.model.player_history import PlayerHistory
+from loguru import logger
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy import or_
+from sqlalchemy import select
+
+from faz.bot.app.discord.bot._metrics import timed_phase
+from faz.bot.app.discord.history.change_point_reducer import ChangePointReducer
+from faz.bot.app.discord.history.change_point_reducer import NON_VALUE_COLUMNS
+from faz.bot.app.discord.history.history_cache import trim_rows
+from faz.bot.app.discord.history.history_cache import trim_sessions
+
+_gather_slots: ContextVar[asyncio.Semaphore | None] = ContextVar("_gather_slots", default=None)
+"""Query slots of the outermost `DataFrameLoader.gather` the current task runs in."""
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from faz.bot.database.fazwynn.fazwynn_database import FazwynnDatabase
+    from faz.utils.database.base_model import BaseModel
+    from sqlalchemy import ColumnElement
+    from sqlalchemy import Connection
+    from sqlalchemy import Select
+
+    from faz.bot.app.discord.history.history_cache import HistoryCache
+
+
+class DataFrameLoader:
+    """Loads fazwynn history into DataFrames without blocking the event loop.
+
+    pandas reads through the synchronous engine, so every load runs on a thread pool sized to
+    the database connection pool. A load never waits for a connection while holding a thread,
+    and no more loads run at once than the pool can serve.
+
+    History is streamed from a server-side cursor in chunks of `stream_chunk_rows` rows, and
+    reduced with `ChangePointReducer` as it arrives. Peak memory is bounded by the chunk size
+    and the number of changes, not by the length of the period. If the server supports window
+    functions, the change points are already picked out by the query with `LAG()`, so only
+    they are sent over the connection.
+
+    If a `HistoryCache` is given, results are served from it and loaded on a miss only.
+
+    At most `max_in_flight` queries run at once, and at most `max_in_flight_per_gather` of
+    them for the loads of one `gather` call. The limits are taken by the queries only, so cache
+    hits and nested gathers never wait on them.
+    """
+
+    IN_CLAUSE_CHUNK_SIZE = 500
+    """Maximum number of keys in the `IN (...)` list of a single bulk query."""
+    STREAM_CHUNK_ROWS = 10_000
+    """Number of rows fetched from the cursor at a time when streaming history."""
+    WINDOW_FUNCTION_VERSIONS = {"mariadb": (10, 2), "mysql": (8, 0), "sqlite": (3, 25)}
+    """Earliest server version with window functions, by dialect. Other dialects use the
+    Python-side reduction only."""
+
+    def __init__(
+        self,
+        db: FazwynnDatabase,
+        max_workers: int,
+        cache: HistoryCache | None = None,
+        *,
+        stream_chunk_rows: int = STREAM_CHUNK_ROWS,
+        max_in_flight: int | None = None,
+        max_in_flight_per_gather: int | None = None,
+    ) -> None:
+        """
+        Args:
+            db (FazwynnDatabase): The fazwynn database.
+            max_workers (int): Number of loader threads. Should be the connection pool size.
+            cache (HistoryCache | None, optional): Shared query results. Defaults to None.
+            stream_chunk_rows (int, optional): Rows fetched from the cursor at a time.
+                Defaults to STREAM_CHUNK_ROWS.
+            max_in_flight (int | None, optional): Maximum number of queries running at once.
+                Defaults to `max_workers`.
+            max_in_flight_per_gather (int | None, optional): Maximum number of queries running
+                at once for one `gather` call. Defaults to `max_in_flight`.
+        """
+        self._db = db
+        self._cache = cache
+        self._stream_chunk_rows = stream_chunk_rows
+        self._max_in_flight = max_in_flight or max_workers
+        self._max_in_flight_per_gather = max_in_flight_per_gather or self._max_in_flight
+        self._in_flight = asyncio.Semaphore(self._max_in_flight)
+        self._warned_no_window_functions = False
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="DataFrameLoader")
+
+    async def run[T](self, func: Callable[..., T], *args: object) -> T:
+        """Runs a blocking function on the loader thread pool.
+
+        Args:
+            func (Callable[..., T]): The blocking function.
+            *args (object): Arguments passed to `func`.
+
+        Returns:
+            T: The return value of `func`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def gather[T](self, *loads: Callable[[], Awaitable[T]]) -> list[T]:
+        """Runs loads concurrently, within the per gather limit of in-flight queries.
+
+        Loads may gather again. Their queries count towards the limit of the outermost gather.
+
+        Args:
+            *loads (Callable[[], Awaitable[T]]): Loads to run, e.g. partials of the load methods.
+
+        Returns:
+            list[T]: The result of each load, in the order of `loads`.
+        """
+        if _gather_slots.get() is not None:
+            return await asyncio.gather(*(load() for load in loads))
+        token = _gather_slots.set(asyncio.Semaphore(self._max_in_flight_per_gather))
+        try:
+            # The tasks copy the context, and with it the slots, when created
+            return await asyncio.gather(*(load() for load in loads))
+        finally:
+            _gather_slots.reset(token)
+
+    async def character_history(
+        self, character_uuid: bytes, period_begin: datetime, period_end: datetime
+    ) -> pd.DataFrame:
+        return await self._cached(
+            "character_history",
+            character_uuid,
+            period_begin,
+            period_end,
+            partial(
+                self._select_in_period,
+                CharacterHistory,
+                CharacterHistory.character_uuid,
+                (character_uuid,),
+                1,
+            ),
+        )
+
+    async def player_history(
+        self, player_uuid: bytes, period_begin: datetime, period_end: datetime
+    ) -> pd.DataFrame:
+        return await self._cached(
+            "player_history",
+            player_uuid,
+            period_begin,
+            period_end,
+            partial(self._select_in_period, PlayerHistory, PlayerHistory.uuid, (player_uuid,), 1),
+        )
+
+    async def player_histories(
+        self,
+        player_uuids: Iterable[bytes],
+        period_begin: datetime,
+        period_end: datetime,
+        *,
+        chunk_size: int = IN_CLAUSE_CHUNK_SIZE,
+    ) -> pd.DataFrame:
+        """Loads the history of many players at once, with one query per `chunk_size` players.
+
+        Args:
+            player_uuids (Iterable[bytes]): UUIDs of the players.
+            period_begin (datetime): The start of the period.
+            period_end (datetime): The end of the period.
+            chunk_size (int, optional): Maximum number of players per query.
+                Defaults to IN_CLAUSE_CHUNK_SIZE.
+
+        Returns:
+            pd.DataFrame: `PlayerHistory` records of all players, sorted by `datetime` in
+                ascending order.
+        """
+        keys = tuple(dict.fromkeys(player_uuids))
+        return await self._cached(
+            "player_histories",
+            frozenset(keys),
+            period_begin,
+            period_end,
+            partial(self._select_in_period, PlayerHistory, PlayerHistory.uuid, keys, chunk_size),
+        )
+
+    async def player_activities(
+        self,
+        player_uuids: Iterable[bytes],
+        period_begin: datetime,
+        period_end: datetime,
+        *,
+        chunk_size: int = IN_CLAUSE_CHUNK_SIZE,
+    ) -> pd.DataFrame:
+        """Loads the sessions of many players overlapping a period, with one query per
+        `chunk_size` players.
+
+        Args:
+            player_uuids (Iterable[bytes]): UUIDs of the players.
+            period_begin (datetime): The start of the period.
+            period_end (datetime): The end of the period.
+            chunk_size (int, optional): Maximum number of players per query.
+                Defaults to IN_CLAUSE_CHUNK_SIZE.
+
+        Returns:
+            pd.DataFrame: `uuid`, `logon_datetime` and `logoff_datetime` of every session that
+                overlaps the period.
+        """
+        model = PlayerActivityHistory
+        keys = tuple(dict.fromkeys(player_uuids))
+
+        async def load(begin: datetime, end: datetime) -> pd.DataFrame:
+            def build_stmt(chunk: Sequence[Any]) -> Select[Any]:
+                return select(model.uuid, model.logon_datetime, model.logoff_datetime).where(
+                    model.uuid.in_(chunk),
+                    model.logoff_datetime >= begin,
+                    model.logon_datetime <= end,
+                )
+
+            columns = ["uuid", "logon_datetime", "logoff_datetime"]
+            frames = await self._select_in_chunks(
+                keys, chunk_size, build_stmt, columns, self._read_sql
+            )
+            if len(frames) == 1:
+                return frames[0]
+            return pd.concat(frames, ignore_index=True)
+
+        return await self._cached(
+            "player_activities", frozenset(keys), period_begin, period_end, load, trim_sessions
+        )
+
+    async def guild_history(
+        self, guild_uuid: bytes, period_begin: datetime, period_end: datetime
+    ) -> pd.DataFrame:
+        return await self._cached(
+            "guild_history",
+            guild_uuid,
+            period_begin,
+            period_end,
+            partial(self._select_in_period, GuildHistory, GuildHistory.uuid, (guild_uuid,), 1),
+        )
+
+    async def guild_member_history(
+        self, player_uuid: bytes, period_begin: datetime, period_end: datetime
+    ) -> pd.DataFrame:
+        return await self._cached(
+            "guild_member_history",
+            player_uuid,
+            period_begin,
+            period_end,
+            partial(
+                self._select_in_period,
+                GuildMemberHistory,
+                GuildMemberHistory.uuid,
+                (player_uuid,),
+                1,
+            ),
+        )
+
+    async def _cached(
+        self,
+        kind: str,
+        entity: Hashable,
+        period_begin: datetime,
+        period_end: datetime,
+        load: Callable[[datetime, datetime], Awaitable[pd.DataFrame]],
+        trim: Callable[[pd.DataFrame, datetime, datetime], pd.DataFrame] = trim_rows,
+    ) -> pd.DataFrame:
+        async def limited_load(begin: datetime, end: datetime) -> pd.DataFrame:
+            async with AsyncExitStack() as stack:
+                # Slots of the gather first, so that a waiting gather holds no global slot
+                gather_slots = _gather_slots.get()
+                if gather_slots is not None:
+                    await stack.enter_async_context(gather_slots)
+                await stack.enter_async_context(self._in_flight)
+                return await load(begin, end)
+
+        with timed_phase("db_fetch"):
+            if self._cache is None:
+                return await limited_load(period_begin, period_end)
+            return await self._cache.get_or_load(
+                kind, entity, period_begin, period_end, limited_load, trim
+            )
+
+    async def _select_in_period(
+        self,
+        model: type[BaseModel],
+        key_column: ColumnElement[Any],
+        keys: Iterable[Any],
+        chunk_size: int,
+        period_begin: datetime,
+        period_end: datetime,
+    ) -> pd.DataFrame:
+        dt = model.datetime  # type: ignore
+        in_period = (dt >= period_begin, dt <= period_end)
+        if self._cache is None:
+            reduced, exact = in_period, None
+        else:
+            # The cache trims results to a period beginning and ending anywhere in the first and
+            # last interval, so the rows there are read as they are. The first and last row of
+            # every entity in the trimmed period are then never reduced away.
+            edge = timedelta(seconds=self._cache.refresh_interval)
+            reduced = (dt >= period_begin + edge, dt <= period_end - edge)
+            exact = (*in_period, or_(dt < period_begin + edge, dt > period_end - edge))
+
+        def build_stmt(where: Sequence[ColumnElement[bool]], chunk: Sequence[Any]) -> Select[Any]:
+            return select(model).where(key_column.in_(chunk), *where).order_by(dt)
+
+        columns = [column.name for column in model.__table__.columns]
+        read = partial(self._read_history, key=key_column.key)
+        frames = await self._select_in_chunks(
+            keys, chunk_size, partial(build_stmt, reduced), columns, read
+        )
+        if exact is not None:
+            frames += await self._select_in_chunks(
+                keys, chunk_size, partial(build_stmt, exact), columns, self._read_sql
+            )
+        return self._concat_sorted(frames, "datetime")
+
+    async def _select_in_chunks(
+        self,
+        keys: Iterable[Any],
+        chunk_size: int,
+        build_stmt: Callable[[Sequence[Any]], Select[Any]],
+        columns: Sequence[str],
+        read: Callable[[Select[Any]], pd.DataFrame],
+    ) -> list[pd.DataFrame]:
+        """Runs `build_stmt` over `keys` split into chunks of at most `chunk_size` keys, and
+        reads each statement with `read`.
+
+        Returns a single empty frame with `columns` if there are no keys.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if len(unique_keys) == 0:
+            return [pd.DataFrame(columns=columns)]
+
+        frames: list[pd.DataFrame] = []
+        for i in range(0, len(unique_keys), chunk_size):
+            stmt = build_stmt(unique_keys[i : i + chunk_size])
+            frames.append(await self.run(read, stmt))
+        return frames
+
+    def _read_sql(self, stmt: Select[Any]) -> pd.DataFrame:
+        return pd.read_sql_query(stmt, self._db.engine)
+
+    def _read_history(self, stmt: Select[Any], key: str) -> pd.DataFrame:
+        """Streams the rows of `stmt`, sorted by `datetime`, and reduces them to the change
+        points of each `key`.
+        """
+        reducer = ChangePointReducer(key)
+        with self._db.engine.connect() as conn:
+            if self._supports_window_functions(conn):
+                stmt = self._select_change_points(stmt, key)
+            conn = conn.execution_options(
+                stream_results=True, max_row_buffer=self._stream_chunk_rows
+            )
+            for chunk in pd.read_sql_query(stmt, conn, chunksize=self._stream_chunk_rows):
+                reducer.feed(chunk)
+        return reducer.result()
+
+    def _supports_window_functions(self, conn: Connection) -> bool:
+        dialect = conn.dialect
+        name = "mariadb" if getattr(dialect, "is_mariadb", False) else dialect.name
+        min_version = self.WINDOW_FUNCTION_VERSIONS.get(name)
+        version = dialect.server_version_info
+        if min_version is not None and version is not None and version >= min_version:
+            return True
+        if not self._warned_no_window_functions:
+            self._warned_no_window_functions = True
+            logger.warning(
+                f"{name} {version} has no window functions, history is reduced in Python only"
+            )
+        return False
+
+    @staticmethod
+    def _select_change_points(stmt: Select[Any], key: str) -> Select[Any]:
+        """Wraps `stmt` to return only the rows `ChangePointReducer` would keep: the first and
+        last row of each `key`, and the rows where a value differs from the previous row of the
+        same `key`.
+        """
+        rows = stmt.order_by(None).subquery()
+        window = {"partition_by": rows.c[key], "order_by": rows.c.datetime}
+        values = [col for col in rows.c if col.key != key and col.key not in NON_VALUE_COLUMNS]
+        is_change_point = or_(
+            func.lag(rows.c.datetime).over(**window).is_(None),
+            func.lead(rows.c.datetime).over(**window).is_(None),
+            *(col.is_distinct_from(func.lag(col).over(**window)) for col in values),
+        )
+        flagged = select(*rows.c, is_change_point.label("is_change_point")).subquery()
+        return (
+            select(*(flagged.c[col.key] for col in rows.c))
+            .where(flagged.c.is_change_point)
+            .order_by(flagged.c.datetime)
+        )
+
+    @staticmethod
+    def _concat_sorted(frames: Sequence[pd.DataFrame], by: str) -> pd.DataFrame:
+        """Merges per-chunk results, each already sorted by `by`, into one sorted frame."""
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True).sort_values(
+            by, kind="stable", ignore_index=True
+        )
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    @property
+    def max_in_flight_per_gather(self) -> int:
+        return self._max_in_flight_per_gather
+
+    def shutdown(self) -> None:
+        """Stops accepting loads. Loads that haven't started yet are cancelled."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from datetime import timedelta
+import math
+import time
+from typing import Awaitable, Callable, Hashable, NamedTuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    import pandas as pd
+
+    from faz.bot.app.discord.bot._metrics import Metrics
+
+
+class _Entry(NamedTuple):
+    df: pd.DataFrame
+    expires_at: float
+
+
+type _Key = tuple[str, Hashable, datetime, datetime]
+
+
+def trim_rows(df: pd.DataFrame, begin: datetime, end: datetime) -> pd.DataFrame:
+    """Keeps the history rows with `datetime` in [begin, end]."""
+    begin, end = _to_naive_local(begin), _to_naive_local(end)
+    return df[(df["datetime"] >= begin) & (df["datetime"] <= end)].reset_index(drop=True)
+
+
+def trim_sessions(df: pd.DataFrame, begin: datetime, end: datetime) -> pd.DataFrame:
+    """Keeps the sessions, from `logon_datetime` to `logoff_datetime`, overlapping [begin, end]."""
+    begin, end = _to_naive_local(begin), _to_naive_local(end)
+    is_overlapping = (df["logoff_datetime"] >= begin) & (df["logon_datetime"] <= end)
+    return df[is_overlapping].reset_index(drop=True)
+
+
+def _to_naive_local(dt: datetime) -> datetime:
+    # History datetimes are naive local time, the same as what datetime.timestamp() assumes
+    return dt.astimezone().replace(tzinfo=None)
+
+
+class HistoryCache:
+    """Size-bounded LRU cache of history query results, shared by every user of the bot.
+
+    Entries are keyed by (query kind, entity, period), with both ends of the period widened to
+    a multiple of `refresh_interval`. Periods requested a few seconds apart, e.g. "last 7 days"
+    run by two users of the same guild, land on the same entry. Every entry expires at the next
+    multiple of `refresh_interval`, which is when the upstream data is refreshed.
+
+    An entry holds the result of the widened period, and is trimmed back to the requested
+    period when returned. Loads must therefore return every row in the first and last
+    `refresh_interval` of the widened period, where a requested period can begin or end.
+    """
+
+    def __init__(
+        self,
+        metrics: Metrics,
+        max_entries: int = 128,
+        refresh_interval: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._metrics = metrics
+        self._max_entries = max_entries
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._pending: dict[_Key, asyncio.Task[pd.DataFrame]] = {}
+
+    async def get_or_load(
+        self,
+        kind: str,
+        entity: Hashable,
+        period_begin: datetime,
+        period_end: datetime,
+        load: Callable[[datetime, datetime], Awaitable[pd.DataFrame]],
+        trim: Callable[[pd.DataFrame, datetime, datetime], pd.DataFrame] = trim_rows,
+    ) -> pd.DataFrame:
+        """Gets the cached result of a history query, loading it on a miss.
+
+        Concurrent misses of the same key share one load. The load runs in a task of the cache,
+        and finishes even if the callers waiting for it are cancelled.
+
+        Args:
+            kind (str): Query kind, e.g. "player_history".
+            entity (Hashable): The queried entity, e.g. a player UUID.
+            period_begin (datetime): The start of the period.
+            period_end (datetime): The end of the period.
+            load (Callable[[datetime, datetime], Awaitable[pd.DataFrame]]): Loads the result of
+                the widened period.
+            trim (Callable[[pd.DataFrame, datetime, datetime], pd.DataFrame], optional):
+                Returns a new frame with the rows of a result in a period. Defaults to
+                trim_rows.
+
+        Returns:
+            pd.DataFrame: The result in the requested period, safe to modify.
+        """
+        begin = self._floor(period_begin)
+        end = self._ceil(period_end)
+        key = (kind, entity, begin, end)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > self._clock():
+            self._entries.move_to_end(key)
+            self._metrics.counter("history_cache_hits_total", kind).inc()
+            return trim(entry.df, period_begin, period_end)
+
+        self._metrics.counter("history_cache_misses_total", kind).inc()
+        pending = self._pending.get(key)
+        if pending is None:
+            # The load belongs to the cache, so cancelling one caller doesn't fail the others
+            pending = asyncio.get_running_loop().create_task(self._load(key, load))
+            pending.add_done_callback(self._retrieve_exception)
+            self._pending[key] = pending
+        return trim(await asyncio.shield(pending), period_begin, period_end)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def _load(
+        self, key: _Key, load: Callable[[datetime, datetime], Awaitable[pd.DataFrame]]
+    ) -> pd.DataFrame:
+        try:
+            df = await load(key[2], key[3])
+            self._put(key, df)
+            return df
+        finally:
+            del self._pending[key]
+
+    def _put(self, key: _Key, df: pd.DataFrame) -> None:
+        now = self._clock()
+        expires_at = (math.floor(now / self._refresh_interval) + 1) * self._refresh_interval
+        self._entries[key] = _Entry(df, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._metrics.counter("history_cache_evictions_total", evicted_key[0]).inc()
+
+    def _floor(self, dt: datetime) -> datetime:
+        return dt - timedelta(seconds=dt.timestamp() % self._refresh_interval)
+
+    def _ceil(self, dt: datetime) -> datetime:
+        remainder = dt.timestamp() % self._refresh_interval
+        if remainder == 0:
+            return dt
+        return dt + timedelta(seconds=self._refresh_interval - remainder)
+
+    @staticmethod
+    def _retrieve_exception(task: asyncio.Task[pd.DataFrame]) -> None:
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def entries(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def refresh_interval(self) -> float:
+        return self._refresh_interval
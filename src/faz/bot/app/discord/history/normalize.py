@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pandas as pd
+
+PLAYER_CATEGORICAL_COLUMNS = ("username", "guild_name", "guild_rank")
+"""Player history columns with few distinct values, stored as categoricals."""
+
+
+def normalize_player_history(player_df: pd.DataFrame) -> pd.DataFrame:
+    """Prepares a `PlayerHistory` frame once after loading, instead of on every build.
+
+    Blank and missing usernames, guild names and guild ranks become "None". The columns become
+    categoricals, which store each distinct string once, so a frame of many rows per player
+    takes a fraction of the memory. `uuid` is encoded with `encode_uuids`.
+
+    Args:
+        player_df (pd.DataFrame): `PlayerHistory` records. Modified in place.
+
+    Returns:
+        pd.DataFrame: `player_df`.
+    """
+    for column in PLAYER_CATEGORICAL_COLUMNS:
+        if column not in player_df.columns:
+            continue
+        values = player_df[column].astype(object)
+        is_blank = values.isna() | (values == "")
+        player_df[column] = values.mask(is_blank, "None").astype("category")
+    return encode_uuids(player_df, "uuid")
+
+
+def normalize_character_history(char_df: pd.DataFrame) -> pd.DataFrame:
+    """Prepares a `CharacterHistory` frame once after loading. `character_uuid` is encoded with
+    `encode_uuids`.
+
+    Args:
+        char_df (pd.DataFrame): `CharacterHistory` records. Modified in place.
+
+    Returns:
+        pd.DataFrame: `char_df`.
+    """
+    return encode_uuids(char_df, "character_uuid")
+
+
+def encode_uuids(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Stores the 16-byte UUIDs of `column` as a categorical.
+
+    Each row then holds a small integer code into the distinct UUIDs, instead of a reference to
+    its own `bytes` object. Comparing the column to a UUID compares the codes, and grouping by
+    it groups the codes. Group with `observed=True`, so UUIDs filtered out of the frame don't
+    come back as empty groups.
+
+    Args:
+        df (pd.DataFrame): The frame. Modified in place.
+        column (str): Name of the UUID column. Ignored if `df` doesn't have it.
+
+    Returns:
+        pd.DataFrame: `df`.
+    """
+    if column in df.columns:
+        df[column] = df[column].astype("category")
+    return df
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+import asyncio
+from typing import Iterable, Mapping, TYPE_CHECKING
+
+from loguru import logger
+
+from faz.bot.app.discord.bot.errors import ApplicationException
+
+if TYPE_CHECKING:
+    from faz.bot.app.discord.bot.bot import Bot
+
+
+class BaseTracker(ABC):
+    """Abstract base class of the background tasks that post tracker notifications.
+
+    A tracker polls every `poll_interval` seconds on the bot's event loop. It keeps an inverted
+    index from the values associated with its `TRACKED_TYPES` track entries to the channels
+    tracking them, taken from the bot's track index whenever that changes. The notifications of a poll
+    are queued in the bot's outbox, which batches them into messages and paces their delivery.
+    """
+
+    NAME: str
+    """Name of the tracker, the label of its metrics."""
+    TRACKED_TYPES: tuple[str, ...]
+    """Track entry types whose associated values this tracker follows."""
+
+    def __init__(self, bot: Bot, poll_interval: float = 60.0) -> None:
+        self._bot = bot
+        self._poll_interval = poll_interval
+
+        self._index: dict[bytes, frozenset[int]] = {}
+        self._index_version: int | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @abstractmethod
+    async def _poll(self) -> None:
+        """Reads the changes since the last poll, and notifies the channels tracking them."""
+        ...
+
+    def start(self) -> None:
+        """Starts polling in a background task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stops polling, and waits for the background task to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run(self) -> None:
+        """Polls every `poll_interval` seconds, forever. A failed poll is logged and skipped."""
+        while True:
+            try:
+                await self.poll()
+            except Exception:
+                logger.exception(f"Failed polling {self.NAME} tracker")
+            await asyncio.sleep(self._poll_interval)
+
+    async def poll(self) -> None:
+        """Reloads the index if the track index changed, then polls once."""
+        with self._bot.metrics.time("tracker_poll_seconds", self.NAME):
+            if self._index_version != self._bot.track_index.version:
+                await self.load_index()
+            await self._poll()
+
+    async def load_index(self) -> None:
+        """Reloads the value to channel IDs index from the track index."""
+        track_index = self._bot.track_index
+        self._index_version = track_index.version
+        self._index = track_index.tracked_values(self.TRACKED_TYPES)
+
+    async def _notify(self, lines: Mapping[int, Iterable[str]]) -> None:
+        """Queues notification lines in the outbox, which batches them into messages.
+
+        Args:
+            lines (Mapping[int, Iterable[str]]): The lines of every channel, by channel ID.
+        """
+        for channel_id, channel_lines in lines.items():
+            try:
+                channel = await self._bot.utils.must_get_sendable_channel(channel_id)
+            except ApplicationException as exc:
+                self._bot.metrics.counter("tracker_send_failures_total", self.NAME).inc()
+                logger.warning(
+                    f"Failed sending tracker notification to channel {channel_id}: {exc}"
+                )
+                continue
+            self._bot.outbox.enqueue(channel, "\n".join(channel_lines))
+            self._bot.metrics.counter("tracker_notifications_total", self.NAME).inc()
+
+    @property
+    def index_size(self) -> int:
+        """Number of tracked values."""
+        return len(self._index)
+
+    @property
+    def poll_interval(self) -> float:
+        return self._poll_interval
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from collections import defaultdict
+import math
+from typing import Any, Iterable, override, TYPE_CHECKING
+
+from faz.bot.database.fazwynn.model.guild_history import GuildHistory
+from faz.bot.database.fazwynn.model.player_history import PlayerHistory
+from faz.bot.database.fazwynn.model.player_info import PlayerInfo
+from sqlalchemy import func
+from sqlalchemy import select
+
+from faz.bot.app.discord.track._base_tracker import BaseTracker
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from sqlalchemy import ColumnElement
+
+    from faz.bot.app.discord.bot.bot import Bot
+
+
+type _Watermarks = tuple[datetime | None, datetime | None]
+"""Newest `player_history` and `guild_history` datetime processed."""
+type _Event = tuple[datetime, bytes, str]
+"""Datetime, guild UUID and notification line of a guild event."""
+type _GuildRow = tuple[bytes, Any, datetime]
+"""Guild UUID, level and datetime of a `guild_history` row."""
+type _PlayerRow = tuple[bytes, str, str | None, str | None, datetime]
+"""Player UUID, username, guild name, guild rank and datetime of a `player_history` row."""
+
+
+class GuildTracker(BaseTracker):
+    """Posts the member joins and leaves, rank changes and level ups of tracked guilds.
+
+    History is read incrementally. Every poll reads only the `player_history` and
+    `guild_history` rows newer than the watermark of their table, which is the newest datetime
+    of the table when the previous poll started, up to the newest datetime now. The events of
+    every tracked guild are derived from these rows in one pass, then fanned out to each
+    channel tracking the guild, so the database load of a poll doesn't grow with the number of
+    channels tracking the same guild.
+
+    The members of a guild start from `player_info` when the guild is first tracked. Ranks
+    and levels start from the first row read, and change events are posted from then on.
+    `guild_member_history` has no guild column, so membership is derived from the guild name
+    and rank of `player_history` instead.
+    """
+
+    NAME = "guild"
+    TRACKED_TYPES = ("GUILD",)
+    IN_CLAUSE_CHUNK_SIZE = 500
+    """Maximum number of keys in the `IN (...)` list of a single query."""
+
+    def __init__(self, bot: Bot, poll_interval: float = 60.0) -> None:
+        super().__init__(bot, poll_interval)
+        self._watermarks: _Watermarks | None = None
+        self._guild_names: dict[bytes, str] = {}
+        self._guild_uuids: dict[str, bytes] = {}
+        self._members: dict[bytes, bytes] = {}
+        self._ranks: dict[bytes, str | None] = {}
+        self._levels: dict[bytes, float] = {}
+
+    @override
+    async def load_index(self) -> None:
+        """Reloads the index, and the members of the guilds that weren't tracked before."""
+        tracked_before = set(self._guild_names)
+        await super().load_index()
+        guilds = set(self._index)
+
+        self._guild_names = await self._bot.track_entry_loader.get_names({"GUILD": guilds})
+        self._guild_uuids = {name: uuid for uuid, name in self._guild_names.items()}
+        for player, guild in list(self._members.items()):
+            if guild not in guilds:
+                del self._members[player]
+                self._ranks.pop(player, None)
+        self._levels = {guild: level for guild, level in self._levels.items() if guild in guilds}
+
+        new_guilds = guilds - tracked_before
+        if len(new_guilds) > 0:
+            self._members.update(await self._select_members(new_guilds))
+
+    @override
+    async def _poll(self) -> None:
+        """Notifies the channels tracking a guild of its events since the last poll. The first
+        poll only sets the watermarks.
+        """
+        latest = await self._select_latest_datetimes()
+        watermarks, self._watermarks = self._watermarks, latest
+        if watermarks is None or len(self._index) == 0:
+            return
+
+        guild_rows = await self._select_guild_history(watermarks[1], latest[1])
+        player_rows = await self._select_player_history(watermarks[0], latest[0])
+        events = [*self._level_events(guild_rows), *self._member_events(player_rows)]
+        events.sort(key=lambda event: event[0])
+        self._bot.metrics.counter("tracker_changes_total", self.NAME).inc(len(events))
+
+        lines: defaultdict[int, list[str]] = defaultdict(list)
+        for _, guild, line in events:
+            for channel_id in self._index.get(guild, ()):
+                lines[channel_id].append(line)
+        await self._notify(lines)
+
+    def _level_events(self, rows: Iterable[_GuildRow]) -> list[_Event]:
+        events: list[_Event] = []
+        for guild, level, dt in rows:
+            previous = self._levels.get(guild)
+            self._levels[guild] = level
+            if previous is not None and math.floor(level) > math.floor(previous):
+                line = f"**{self._guild_names[guild]}** reached level {math.floor(level)}"
+                events.append((dt, guild, line))
+        return events
+
+    def _member_events(self, rows: Iterable[_PlayerRow]) -> list[_Event]:
+        events: list[_Event] = []
+        for player, username, guild_name, rank, dt in rows:
+            previous_guild = self._members.get(player)
+            guild = None if guild_name is None else self._guild_uuids.get(guild_name)
+            if guild != previous_guild:
+                if previous_guild is not None:
+                    line = f"`{username}` left **{self._guild_names[previous_guild]}**"
+                    events.append((dt, previous_guild, line))
+                    del self._members[player]
+                    self._ranks.pop(player, None)
+                if guild is not None:
+                    line = f"`{username}` joined **{self._guild_names[guild]}**"
+                    events.append((dt, guild, line))
+                    self._members[player] = guild
+                    self._ranks[player] = rank
+            elif guild is not None:
+                previous_rank = self._ranks.get(player)
+                if previous_rank is not None and rank is not None and rank != previous_rank:
+                    line = (
+                        f"`{username}` rank in **{self._guild_names[guild]}**: "
+                        f"{previous_rank} -> {rank}"
+                    )
+                    events.append((dt, guild, line))
+                self._ranks[player] = rank
+        return events
+
+    async def _select_latest_datetimes(self) -> _Watermarks:
+        stmt = select(
+            select(func.max(PlayerHistory.datetime)).scalar_subquery(),
+            select(func.max(GuildHistory.datetime)).scalar_subquery(),
+        )
+        async with self._bot.fazwynn_db.enter_async_session() as ses:
+            res = await ses.execute(stmt)
+            return res.tuples().one()
+
+    async def _select_members(self, guilds: Iterable[bytes]) -> list[tuple[bytes, bytes]]:
+        """Player UUID and guild UUID of the current members of some guilds."""
+        rows: list[tuple[bytes, bytes]] = []
+        async with self._bot.fazwynn_db.enter_async_session() as ses:
+            for chunk in self._chunks(guilds):
+                stmt = select(PlayerInfo.uuid, PlayerInfo.guild_uuid).where(
+                    PlayerInfo.guild_uuid.in_(chunk)
+                )
+                res = await ses.execute(stmt)
+                rows.extend(res.tuples().all())  # type: ignore
+        return rows
+
+    async def _select_guild_history(
+        self, begin: datetime | None, end: datetime | None
+    ) -> list[_GuildRow]:
+        """The rows of the tracked guilds in (begin, end], by datetime."""
+        if end is None:
+            return []
+        rows: list[_GuildRow] = []
+        async with self._bot.fazwynn_db.enter_async_session() as ses:
+            for chunk in self._chunks(self._index):
+                stmt = select(GuildHistory.uuid, GuildHistory.level, GuildHistory.datetime).where(
+                    self._in_period(GuildHistory.datetime, begin, end),
+                    GuildHistory.uuid.in_(chunk),
+                )
+                res = await ses.execute(stmt)
+                rows.extend(res.tuples().all())
+        rows.sort(key=lambda row: row[2])
+        return rows
+
+    async def _select_player_history(
+        self, begin: datetime | None, end: datetime | None
+    ) -> list[_PlayerRow]:
+        """The rows in (begin, end] of players in, or joining, a tracked guild, by datetime."""
+        if end is None:
+            return []
+        columns = (
+            PlayerHistory.uuid,
+            PlayerHistory.username,
+            PlayerHistory.guild_name,
+            PlayerHistory.guild_rank,
+            PlayerHistory.datetime,
+        )
+        period = self._in_period(PlayerHistory.datetime, begin, end)
+        stmts = [select(*columns).where(period, PlayerHistory.guild_name.in_(self._guild_uuids))]
+        stmts.extend(
+            select(*columns).where(period, PlayerHistory.uuid.in_(chunk))
+            for chunk in self._chunks(self._members)
+        )
+        # A row can match both the guild name and the member UUID
+        rows: dict[tuple[bytes, datetime], _PlayerRow] = {}
+        async with self._bot.fazwynn_db.enter_async_session() as ses:
+            for stmt in stmts:
+                res = await ses.execute(stmt)
+                rows.update(((row[0], row[4]), row) for row in res.tuples().all())
+        return sorted(rows.values(), key=lambda row: row[4])
+
+    @staticmethod
+    def _in_period(
+        column: ColumnElement[datetime], begin: datetime | None, end: datetime
+    ) -> ColumnElement[bool]:
+        if begin is None:
+            return column <= end
+        return (column > begin) & (column <= end)
+
+    def _chunks(self, values: Iterable[bytes]) -> list[list[bytes]]:
+        values = list(values)
+        return [
+            values[i : i + self.IN_CLAUSE_CHUNK_SIZE]
+            for i in range(0, len(values), self.IN_CLAUSE_CHUNK_SIZE)
+        ]
+
+    @property
+    def members(self) -> int:
+        """Number of players known to be in a tracked guild."""
+        return len(self._members)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import override, Sequence, TYPE_CHECKING
+
+from faz.bot.database.fazwynn.model.online_players import OnlinePlayers
+from sqlalchemy import select
+
+from faz.bot.app.discord.track._base_tracker import BaseTracker
+
+if TYPE_CHECKING:
+    from faz.bot.app.discord.bot.bot import Bot
+
+
+def diff_sorted(
+    previous: Sequence[bytes], current: Sequence[bytes]
+) -> tuple[list[bytes], list[bytes]]:
+    """Compares two sorted sequences of unique values in one merge pass.
+
+    Args:
+        previous (Sequence[bytes]): The earlier values, sorted.
+        current (Sequence[bytes]): The later values, sorted.
+
+    Returns:
+        tuple[list[bytes], list[bytes]]: The values only in `current`, and the values only in
+            `previous`, both sorted.
+    """
+    added: list[bytes] = []
+    removed: list[bytes] = []
+    i = j = 0
+    while i < len(previous) and j < len(current):
+        if previous[i] == current[j]:
+            i += 1
+            j += 1
+        elif previous[i] < current[j]:
+            removed.append(previous[i])
+            i += 1
+        else:
+            added.append(current[j])
+            j += 1
+    removed.extend(previous[i:])
+    added.extend(current[j:])
+    return added, removed
+
+
+class OnlineTracker(BaseTracker):
+    """Posts the tracked players that log on or off Wynncraft to the channels tracking them.
+
+    Every poll reads the online player snapshot, sorts it by UUID, and diffs it against the
+    previous one in a single pass. Only the players that joined or left are looked up in the
+    index, from player UUID to channel IDs, so the work after the diff grows with the number
+    of changes, not with the number of trackers.
+    """
+
+    NAME = "online"
+    TRACKED_TYPES = ("ONLINE", "PLAYER")
+
+    def __init__(self, bot: Bot, poll_interval: float = 60.0) -> None:
+        super().__init__(bot, poll_interval)
+        self._snapshot: list[bytes] | None = None
+
+    @override
+    async def _poll(self) -> None:
+        """Notifies the channels tracking the players that logged on or off since the last
+        poll. The first poll only takes the snapshot.
+        """
+        servers = await self._select_online_players()
+        snapshot = sorted(servers)
+        previous, self._snapshot = self._snapshot, snapshot
+        if previous is None:
+            return
+        joined, left = diff_sorted(previous, snapshot)
+        self._bot.metrics.counter("tracker_changes_total", self.NAME).inc(len(joined) + len(left))
+
+        events: defaultdict[int, list[tuple[bytes, str | None]]] = defaultdict(list)
+        for uuid in joined:
+            for channel_id in self._index.get(uuid, ()):
+                events[channel_id].append((uuid, servers[uuid]))
+        for uuid in left:
+            for channel_id in self._index.get(uuid, ()):
+                events[channel_id].append((uuid, None))
+        if len(events) == 0:
+            return
+
+        # Every tracked value is a player UUID
+        uuids = {uuid for channel_events in events.values() for uuid, _ in channel_events}
+        names = await self._bot.track_entry_loader.get_names({"ONLINE": uuids})
+        await self._notify(
+            {
+                channel_id: [self._format_event(names[uuid], server) for uuid, server in evs]
+                for channel_id, evs in events.items()
+            }
+        )
+
+    async def _select_online_players(self) -> dict[bytes, str]:
+        stmt = select(OnlinePlayers.uuid, OnlinePlayers.server)
+        async with self._bot.fazwynn_db.enter_async_session() as ses:
+            res = await ses.execute(stmt)
+            return dict(res.tuples().all())
+
+    @staticmethod
+    def _format_event(name: str, server: str | None) -> str:
+        if server is None:
+            return f"`{name}` logged off"
+        return f"`{name}` logged on to {server}"
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Sequence, TYPE_CHECKING
+from uuid import UUID
+
+from faz.bot.database.fazcord.model.discord_channel import DiscordChannel
+from faz.bot.database.fazcord.model.track_entry import TrackEntry
+from faz.bot.database.fazcord.model.track_entry_association import TrackEntryAssociation
+from faz.bot.database.fazwynn.model.guild_info import GuildInfo
+from faz.bot.database.fazwynn.model.player_info import PlayerInfo
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.orm import contains_eager
+from sqlalchemy.orm import lazyload
+from sqlalchemy.orm import selectinload
+
+if TYPE_CHECKING:
+    from faz.bot.database.fazcord.fazcord_database import FazcordDatabase
+    from faz.bot.database.fazwynn.fazwynn_database import FazwynnDatabase
+    from sqlalchemy import Select
+
+
+class TrackEntryLoader:
+    """Loads track entries together with everything shown about them.
+
+    The entries of a guild are loaded with their channel and associations in two statements,
+    however many entries there are. The UUIDs associated with the entries are resolved to
+    player and guild names with one statement per table.
+    """
+
+    NAMED_TYPES = {
+        "GUILD": (GuildInfo.uuid, GuildInfo.name),
+        "ONLINE": (PlayerInfo.uuid, PlayerInfo.latest_username),
+        "PLAYER": (PlayerInfo.uuid, PlayerInfo.latest_username),
+    }
+    """Track entry types whose associated values are UUIDs, and the UUID and name columns
+    that resolve them."""
+
+    def __init__(self, fazcord_db: FazcordDatabase, fazwynn_db: FazwynnDatabase) -> None:
+        self._fazcord_db = fazcord_db
+        self._fazwynn_db = fazwynn_db
+
+    async def select_by_guild_id(self, guild_id: int) -> Sequence[TrackEntry]:
+        """Selects the track entries of the channels of a guild, ordered by channel ID.
+
+        Args:
+            guild_id (int): The discord guild ID.
+
+        Returns:
+            Sequence[TrackEntry]: The track entries, with `channel` and `associations` loaded.
+        """
+        async with self._fazcord_db.enter_async_session() as ses:
+            res = await ses.execute(self._select_by_guild_id(guild_id))
+            return res.scalars().unique().all()
+
+    async def get_display_names(self, entries: Iterable[TrackEntry]) -> dict[bytes, str]:
+        """Resolves the associated values of track entries to names.
+
+        Args:
+            entries (Iterable[TrackEntry]): Track entries with `associations` loaded.
+
+        Returns:
+            dict[bytes, str]: Name of every associated value of a `NAMED_TYPES` entry, by value.
+                Values without a name are shown as UUID strings.
+        """
+        uuids: dict[str, set[bytes]] = {type_: set() for type_ in self.NAMED_TYPES}
+        for entry in entries:
+            if entry.type in uuids:
+                uuids[entry.type].update(value.associated_value for value in entry.associations)
+        return await self.get_names(uuids)
+
+    async def get_names(self, uuids: dict[str, Iterable[bytes]]) -> dict[bytes, str]:
+        """Resolves UUIDs to names, with one statement per table.
+
+        Args:
+            uuids (dict[str, Iterable[bytes]]): UUIDs to resolve, by the `NAMED_TYPES` type
+                whose table names them.
+
+        Returns:
+            dict[bytes, str]: Name of every UUID. UUIDs without a name are shown as UUID
+                strings.
+        """
+        uuid_sets = {type_: set(values) for type_, values in uuids.items()}
+        names = {uuid: str(UUID(bytes=uuid)) for values in uuid_sets.values() for uuid in values}
+        if len(names) == 0:
+            return names
+        async with self._fazwynn_db.enter_async_session() as ses:
+            for stmt in self._select_names(uuid_sets):
+                res = await ses.execute(stmt)
+                names.update(res.tuples().all())
+        return names
+
+    async def select_entry_values(self) -> Sequence[tuple[int, str, bool, bytes | None]]:
+        """Selects every track entry with its associated values, in one statement.
+
+        Returns:
+            Sequence[tuple[int, str, bool, bytes | None]]: Channel ID, type, enabled and
+                associated value of every association, or of the entry alone if it has none.
+        """
+        stmt = select(
+            TrackEntry.channel_id,
+            TrackEntry.type,
+            TrackEntry.enabled,
+            TrackEntryAssociation.associated_value,
+        ).outerjoin(TrackEntry.associations)
+        async with self._fazcord_db.enter_async_session() as ses:
+            res = await ses.execute(stmt)
+            return res.tuples().all()
+
+    async def select_checksum(self) -> tuple[int, int, int, int]:
+        """Selects the checksum of the track entries and their associated values, the same as
+        `TrackIndex.checksum`.
+
+        Returns:
+            tuple[int, int, int, int]: Number of entries, sum of the CRC32 of every entry's
+                "channel_id:type:enabled", number of associations, and sum of the CRC32 of every
+                association's "channel_id:" followed by the associated value.
+        """
+        async with self._fazcord_db.enter_async_session() as ses:
+            res = await ses.execute(self._select_checksum())
+            entries, entry_crc, values, value_crc = res.tuples().one()
+            return int(entries), int(entry_crc), int(values), int(value_crc)
+
+    def _select_names(self, uuids: dict[str, set[bytes]]) -> list[Select[tuple[bytes, str]]]:
+        # Types named by the same table, like ONLINE and PLAYER, share a statement
+        by_table: dict[type, tuple[Any, Any, set[bytes]]] = {}
+        for type_, values in uuids.items():
+            if len(values) == 0:
+                continue
+            uuid, name = self.NAMED_TYPES[type_]
+            by_table.setdefault(uuid.class_, (uuid, name, set()))[2].update(values)
+        return [
+            select(uuid, name).where(uuid.in_(values)) for uuid, name, values in by_table.values()
+        ]
+
+    @staticmethod
+    def _select_checksum() -> Select[tuple[int, int, int, int]]:
+        entry_crc = func.crc32(
+            func.concat(TrackEntry.channel_id, ":", TrackEntry.type, ":", TrackEntry.enabled)
+        )
+        value_crc = func.crc32(
+            func.concat(TrackEntry.channel_id, ":", TrackEntryAssociation.associated_value)
+        )
+        return select(
+            select(func.count()).select_from(TrackEntry).scalar_subquery(),
+            select(func.coalesce(func.sum(entry_crc), 0)).scalar_subquery(),
+            select(func.count()).select_from(TrackEntryAssociation).scalar_subquery(),
+            select(func.coalesce(func.sum(value_crc), 0))
+            .select_from(TrackEntryAssociation)
+            .join(TrackEntryAssociation.track_entry)
+            .scalar_subquery(),
+        )
+
+    @staticmethod
+    def _select_by_guild_id(guild_id: int) -> Select[tuple[TrackEntry]]:
+        return (
+            select(TrackEntry)
+            .join(TrackEntry.channel)
+            .where(DiscordChannel.guild_id == guild_id)
+            .options(
+                contains_eager(TrackEntry.channel).lazyload("*"),
+                selectinload(TrackEntry.associations).lazyload("*"),
+                lazyload(TrackEntry.creator),
+            )
+            .order_by(TrackEntry.channel_id)
+        )
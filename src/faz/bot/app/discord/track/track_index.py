@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from typing import Iterable, TYPE_CHECKING
+import zlib
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from faz.bot.app.discord.bot._metrics import Metrics
+    from faz.bot.app.discord.track.track_entry_loader import TrackEntryLoader
+
+
+type Checksum = tuple[int, int, int, int]
+"""Number of entries, sum of the entry CRC32s, number of associated values, and sum of the
+value CRC32s, as selected by `TrackEntryLoader.select_checksum`."""
+
+
+class TrackIndex:
+    """In-memory index of the track entries, from tracked values and types to channel IDs.
+
+    The index is loaded once at startup, and kept up to date by the commands that add, toggle
+    and remove track entries, which update it right after they change the database. Changes
+    made elsewhere are picked up by reconciling every `reconcile_interval` seconds. A
+    reconcile selects a checksum of the track entries, which the index maintains as it
+    changes, and reloads the index only if the checksums differ.
+
+    Only enabled entries are found by the lookups. Every change increments `version`, so
+    readers that derive their own structures from the index know when to rebuild them.
+    """
+
+    def __init__(
+        self, loader: TrackEntryLoader, metrics: Metrics, reconcile_interval: float = 300.0
+    ) -> None:
+        """Initialize a new TrackIndex instance.
+
+        Args:
+            loader (TrackEntryLoader): The loader to select track entries with.
+            metrics (Metrics): The metrics to record reconciles in.
+            reconcile_interval (float, optional): Seconds between reconciles. Defaults to
+                300.0.
+        """
+        self._loader = loader
+        self._metrics = metrics
+        self._reconcile_interval = reconcile_interval
+
+        self._entries: dict[int, tuple[str, bool]] = {}
+        self._values: dict[int, set[bytes]] = {}
+        self._channels_by_type: defaultdict[str, set[int]] = defaultdict(set)
+        self._channels_by_value: defaultdict[str, defaultdict[bytes, set[int]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        self._checksum = [0, 0, 0, 0]
+        self._version = 0
+        self._tracked_values: dict[tuple[str, ...], tuple[int, dict[bytes, frozenset[int]]]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def load(self) -> None:
+        """Replaces the index with the track entries in the database.
+
+        A change made to the index while selecting may not be in the selected rows, so the
+        entries are selected again until none is.
+        """
+        while True:
+            version = self._version
+            rows = await self._loader.select_entry_values()
+            if version == self._version:
+                break
+        self._clear()
+        for channel_id, type_, enabled, value in rows:
+            if channel_id not in self._entries:
+                self.add_entry(channel_id, type_, enabled)
+            if value is not None:
+                self.add_value(channel_id, value)
+        self._version += 1
+
+    async def reconcile(self) -> bool:
+        """Reloads the index if its checksum differs from the database's.
+
+        Returns:
+            bool: Whether the index was reloaded.
+        """
+        with self._metrics.time("track_index_reconcile_seconds"):
+            version = self._version
+            checksum = await self._loader.select_checksum()
+            # The index changed while selecting, so the checksums can't be compared
+            if version != self._version or checksum == self.checksum:
+                return False
+            self._metrics.counter("track_index_mismatches_total").inc()
+            logger.warning(f"Track index checksum {self.checksum} differs from {checksum}")
+            await self.load()
+            return True
+
+    def start(self) -> None:
+        """Starts reconciling in a background task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stops reconciling, and waits for the background task to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run(self) -> None:
+        """Reconciles every `reconcile_interval` seconds, forever. A failed reconcile is logged
+        and skipped.
+        """
+        while True:
+            await asyncio.sleep(self._reconcile_interval)
+            try:
+                await self.reconcile()
+            except Exception:
+                logger.exception("Failed reconciling track index")
+
+    def channels(self, type_: str, value: bytes) -> frozenset[int]:
+        """Gets the channels of the enabled entries of a type tracking a value.
+
+        Args:
+            type_ (str): The track entry type.
+            value (bytes): The associated value.
+
+        Returns:
+            frozenset[int]: The channel IDs.
+        """
+        return frozenset(self._channels_by_value.get(type_, {}).get(value, ()))
+
+    def channels_of_type(self, type_: str) -> frozenset[int]:
+        """Gets the channels of the enabled entries of a type.
+
+        Args:
+            type_ (str): The track entry type.
+
+        Returns:
+            frozenset[int]: The channel IDs.
+        """
+        return frozenset(self._channels_by_type.get(type_, ()))
+
+    def tracked_values(self, types: Iterable[str]) -> dict[bytes, frozenset[int]]:
+        """Gets the values tracked by the enabled entries of some types, and their channels.
+        The result is cached until the index changes, and must not be modified.
+
+        Args:
+            types (Iterable[str]): The track entry types.
+
+        Returns:
+            dict[bytes, frozenset[int]]: The channel IDs tracking every value, by value.
+        """
+        key = tuple(sorted(types))
+        cached = self._tracked_values.get(key)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        merged: defaultdict[bytes, set[int]] = defaultdict(set)
+        for type_ in key:
+            for value, channel_ids in self._channels_by_value.get(type_, {}).items():
+                merged[value].update(channel_ids)
+        tracked = {value: frozenset(channel_ids) for value, channel_ids in merged.items()}
+        self._tracked_values[key] = (self._version, tracked)
+        return tracked
+
+    def add_entry(self, channel_id: int, type_: str, enabled: bool = True) -> None:
+        """Adds a track entry without associated values, replacing the channel's entry.
+
+        Args:
+            channel_id (int): The channel ID of the entry.
+            type_ (str): The track entry type.
+            enabled (bool, optional): Whether the entry is enabled. Defaults to True.
+        """
+        self.remove_entry(channel_id)
+        self._entries[channel_id] = (type_, enabled)
+        self._values[channel_id] = set()
+        if enabled:
+            self._channels_by_type[type_].add(channel_id)
+        self._checksum[0] += 1
+        self._checksum[1] += self.entry_crc(channel_id, type_, enabled)
+        self._version += 1
+
+    def remove_entry(self, channel_id: int) -> None:
+        """Removes a track entry and its associated values. Unknown channels are ignored.
+
+        Args:
+            channel_id (int): The channel ID of the entry.
+        """
+        if channel_id not in self._entries:
+            return
+        for value in list(self._values[channel_id]):
+            self.remove_value(channel_id, value)
+        type_, enabled = self._entries.pop(channel_id)
+        del self._values[channel_id]
+        self._channels_by_type[type_].discard(channel_id)
+        self._checksum[0] -= 1
+        self._checksum[1] -= self.entry_crc(channel_id, type_, enabled)
+        self._version += 1
+
+    def set_enabled(self, channel_id: int, enabled: bool) -> None:
+        """Enables or disables a track entry. Unknown channels are ignored.
+
+        Args:
+            channel_id (int): The channel ID of the entry.
+            enabled (bool): Whether the entry is enabled.
+        """
+        if channel_id not in self._entries or self._entries[channel_id][1] == enabled:
+            return
+        type_, _ = self._entries[channel_id]
+        self._entries[channel_id] = (type_, enabled)
+        self._checksum[1] += self.entry_crc(channel_id, type_, enabled) - self.entry_crc(
+            channel_id, type_, not enabled
+        )
+        by_value = self._channels_by_value[type_]
+        if enabled:
+            self._channels_by_type[type_].add(channel_id)
+            for value in self._values[channel_id]:
+                by_value[value].add(channel_id)
+        else:
+            self._channels_by_type[type_].discard(channel_id)
+            for value in self._values[channel_id]:
+                self._discard(by_value, value, channel_id)
+        self._version += 1
+
+    def add_value(self, channel_id: int, value: bytes) -> None:
+        """Associates a value with a track entry. Unknown channels are ignored.
+
+        Args:
+            channel_id (int): The channel ID of the entry.
+            value (bytes): The associated value.
+        """
+        if channel_id not in self._entries or value in self._values[channel_id]:
+            return
+        type_, enabled = self._entries[channel_id]
+        self._values[channel_id].add(value)
+        if enabled:
+            self._channels_by_value[type_][value].add(channel_id)
+        self._checksum[2] += 1
+        self._checksum[3] += self.value_crc(channel_id, value)
+        self._version += 1
+
+    def remove_value(self, channel_id: int, value: bytes) -> None:
+        """Removes a value from a track entry. Unknown channels and values are ignored.
+
+        Args:
+            channel_id (int): The channel ID of the entry.
+            value (bytes): The associated value.
+        """
+        if channel_id not in self._entries or value not in self._values[channel_id]:
+            return
+        type_, _ = self._entries[channel_id]
+        self._values[channel_id].discard(value)
+        self._discard(self._channels_by_value[type_], value, channel_id)
+        self._checksum[2] -= 1
+        self._checksum[3] -= self.value_crc(channel_id, value)
+        self._version += 1
+
+    def counts(self) -> list[tuple[str, int, int, int]]:
+        """Counts the indexed track entries of every type.
+
+        Returns:
+            list[tuple[str, int, int, int]]: Type, number of entries, number of enabled
+                entries and number of associated values, by type.
+        """
+        counts: defaultdict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+        for channel_id, (type_, enabled) in self._entries.items():
+            count = counts[type_]
+            count[0] += 1
+            count[1] += enabled
+            count[2] += len(self._values[channel_id])
+        return [(type_, *count) for type_, count in sorted(counts.items())]  # type: ignore
+
+    @staticmethod
+    def entry_crc(channel_id: int, type_: str, enabled: bool) -> int:
+        """CRC32 of an entry, the same as MySQL's `CRC32(CONCAT(channel_id, ':', type, ':',
+        enabled))`.
+        """
+        return zlib.crc32(f"{channel_id}:{type_}:{int(enabled)}".encode())
+
+    @staticmethod
+    def value_crc(channel_id: int, value: bytes) -> int:
+        """CRC32 of an associated value, the same as MySQL's `CRC32(CONCAT(channel_id, ':',
+        associated_value))`.
+        """
+        return zlib.crc32(f"{channel_id}:".encode() + value)
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._values.clear()
+        self._channels_by_type.clear()
+        self._channels_by_value.clear()
+        self._checksum = [0, 0, 0, 0]
+
+    @staticmethod
+    def _discard(by_value: dict[bytes, set[int]], value: bytes, channel_id: int) -> None:
+        channel_ids = by_value.get(value)
+        if channel_ids is None:
+            return
+        channel_ids.discard(channel_id)
+        if len(channel_ids) == 0:
+            del by_value[value]
+
+    @property
+    def checksum(self) -> Checksum:
+        return tuple(self._checksum)  # type: ignore
+
+    @property
+    def version(self) -> int:
+        """Incremented on every change of the index."""
+        return self._version
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    @property
+    def reconcile_interval(self) -> float:
+        return self._reconcile_interval
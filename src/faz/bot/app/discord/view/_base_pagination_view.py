@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Any, TYPE_CHECKING
+import asyncio
+import contextvars
+from typing import Any, Coroutine, override, TYPE_CHECKING
 
 from nextcord import ButtonStyle
 from nextcord.ui import Button
 
+from faz.bot.app.discord.bot._metrics import timed_phase
 from faz.bot.app.discord.view._base_view import BaseView
 
 if TYPE_CHECKING:
@@ -22,7 +25,10 @@ class BasePaginationView[T](BaseView, ABC):
 
     This class provides a base structure for pagination views that allow users to navigate
     through multiple pages of an embed message. It includes buttons for first, previous,
-    next, last, and stop controls.
+    next, last, and stop controls. After a page is shown, the pages before and after it are
+    rendered in the background, so that the next click only sends. Subclasses may build their
+    options in the background too, in `_precompute_task`. Both tasks are cancelled once the view
+    stops or times out.
 
     Attributes:
         _embed (PaginationEmbed): The embed object that represents the paginated content.
@@ -42,6 +48,8 @@ class BasePaginationView[T](BaseView, ABC):
             bot, interaction, timeout=timeout, auto_defer=auto_defer, prevent_update=prevent_update
         )
         self._embed_director = embed_director
+        self._prerender_task: asyncio.Task[None] | None = None
+        self._precompute_task: asyncio.Task[None] | None = None
 
         self._buttons_added = False
 
@@ -152,13 +160,52 @@ class BasePaginationView[T](BaseView, ABC):
         """Add page navigation buttons and send the initial message with the embed."""
         embed = self._embed_director.construct_page(1)
         self._manage_navigation_button()
-        await self.interaction.send(embed=embed, view=self)
+        with timed_phase("discord_send"):
+            await self.interaction.send(embed=embed, view=self)
+        self._prerender_neighbours()
 
     async def _edit_message_page(self, interaction: Interaction[Any], new_page: int = 1) -> None:
         """Set the embed builder to a new page, construct an embed, and edit the message with the new embed."""
         embed = self._embed_director.construct_page(new_page)
         self._manage_navigation_button()
-        await interaction.edit(embed=embed, view=self)
+        with timed_phase("discord_send"):
+            await interaction.edit(embed=embed, view=self)
+        self._prerender_neighbours()
+
+    def _prerender_neighbours(self) -> None:
+        """Renders the pages around the shown page in a background task."""
+        if self._embed_director.page_count < 2:
+            return
+        if self._prerender_task is not None:
+            self._prerender_task.cancel()
+        self._prerender_task = self._create_background_task(
+            self._embed_director.prerender_neighbours()
+        )
+
+    @staticmethod
+    def _create_background_task(coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        """Runs work in a background task outside of the command's context, so that its
+        `timed_phase`s aren't recorded as phases of the command.
+        """
+        return asyncio.create_task(coro, context=contextvars.Context())
+
+    @override
+    def stop(self) -> None:
+        """Stops the view, and cancels the rendering still running in the background."""
+        self._cancel_background_tasks()
+        super().stop()
+
+    @override
+    async def on_timeout(self) -> None:
+        """Cancels the rendering still running in the background, then removes the view."""
+        self._cancel_background_tasks()
+        await super().on_timeout()
+
+    def _cancel_background_tasks(self) -> None:
+        for task in (self._prerender_task, self._precompute_task):
+            if task is not None:
+                task.cancel()
+        self._prerender_task = self._precompute_task = None
 
     def _manage_navigation_button(self) -> None:
         if self._embed_director.page_count > 1:
@@ -74,6 +74,10 @@ class MemberHistoryView(BasePaginationView):
         await self._embed_director.setup()
         self.set_embed_director_options()
         await self._initial_send_message()
+        if self.bot.app.properties.PRECOMPUTE_HISTORY_OPTIONS:
+            self._precompute_task = self._create_background_task(
+                self._embed_director.precompute_fields()
+            )
 
     async def _mode_select_callback(self, interaction: Interaction) -> None:
         """Callback for mode selection."""
@@ -1,15 +1,14 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from datetime import datetime
 from typing import Any, override, TYPE_CHECKING
-from uuid import UUID
 
 from nextcord.ui import StringSelect
 
 from faz.bot.app.discord.embed.director.player_history_embed_director import (
     PlayerHistoryEmbedDirector,
 )
+from faz.bot.app.discord.history.character_history_context import CharacterHistoryContext
 from faz.bot.app.discord.select.player_history_data_option import PlayerHistoryDataOption
 from faz.bot.app.discord.select.player_history_data_select import PlayerHistoryDataSelect
 from faz.bot.app.discord.view._base_pagination_view import BasePaginationView
@@ -36,7 +35,9 @@ class PlayerHistoryView(BasePaginationView):
         self._period_begin = period_begin
         self._period_end = period_end
 
-        self._character_labels: dict[str, str] = {}
+        self._characters = CharacterHistoryContext(
+            bot.dataframe_loader, player, period_begin, period_end
+        )
         self._selected_character: str | None = None
         self._selected_data: PlayerHistoryDataOption = PlayerHistoryDataOption.ALL
         self._data_select = PlayerHistoryDataSelect(self._id_select_callback)
@@ -46,7 +47,7 @@ class PlayerHistoryView(BasePaginationView):
             self._player,
             self._period_begin,
             self._period_end,
-            self._character_labels,
+            self._characters,
         )
         super().__init__(bot, interaction, self._embed_director)
 
@@ -54,11 +55,16 @@ class PlayerHistoryView(BasePaginationView):
     async def run(self) -> None:
         """Initial method to setup and run the view."""
         self.add_item(self._data_select)
-        await self._add_character_select()
-
-        await self._embed_director.setup()
+        # Both wait for the same character history load
+        await self.bot.dataframe_loader.gather(
+            self._add_character_select, self._embed_director.setup
+        )
         self.set_embed_director_options()
         await self._initial_send_message()
+        if self.bot.app.properties.PRECOMPUTE_HISTORY_OPTIONS:
+            self._precompute_task = self._create_background_task(
+                self._embed_director.precompute_fields()
+            )
 
     async def _add_character_select(self) -> None:
         """Helper method to add character selection during setup."""
@@ -66,22 +72,9 @@ class PlayerHistoryView(BasePaginationView):
         self._character_select.callback = self._character_select_callback
         self._character_select.add_option(label="Total", value="total")
 
-        await self._player.awaitable_attrs.characters
-        ch_counter = defaultdict(int)
-        for ch in self._player.characters:
-            ch_hists = await self.bot.fazwynn_db.character_history.select_between_period(
-                ch.character_uuid, self._period_begin, self._period_end
-            )
-            if len(ch_hists) == 0:
-                continue
-            ch_counter[ch.type] += 1
-            # select ch_hist with max datetime
-            latest_ch_hist = max(ch_hists, key=lambda x: x.datetime)
-            total_level = latest_ch_hist.get_total_level()
-            label = f"{ch.type}{ch_counter[ch.type]} (Lv. {total_level})"
-            uuid = str(UUID(bytes=ch.character_uuid))
+        await self._characters.load()
+        for uuid, label in self._characters.character_labels.items():
             self._character_select.add_option(label=label, value=uuid)
-            self._character_labels[uuid] = label
 
         if len(self._character_select.options) == 0:
             self._character_select.placeholder = "No character"
@@ -0,0 +1,72 @@
+import contextvars
+import math
+
+import pytest
+
+from faz.bot.app.discord.bot._metrics import Histogram
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.bot._metrics import timed_phase
+
+
+def test_histogram_observe():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.bucket_counts == [2, 3, 4]
+    assert histogram.count == 4
+    assert histogram.sum == 2.65
+
+
+def test_histogram_registry():
+    metrics = Metrics()
+    histogram = metrics.histogram("command_latency_seconds", "history guild_history")
+    assert metrics.histogram("command_latency_seconds", "history guild_history") is histogram
+    assert metrics.histogram("command_latency_seconds", "stats worldlist") is not histogram
+    assert set(metrics.histograms) == {
+        ("command_latency_seconds", "history guild_history"),
+        ("command_latency_seconds", "stats worldlist"),
+    }
+
+
+def test_histogram_quantile():
+    histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+    assert math.isnan(histogram.quantile(0.5))
+
+    for value in (0.05, 0.15, 0.15, 0.3):
+        histogram.observe(value)
+
+    assert histogram.quantile(0.5) == pytest.approx(0.15)
+    assert histogram.quantile(0.25) == pytest.approx(0.1)
+    assert histogram.quantile(1.0) == pytest.approx(0.4)
+    histogram.observe(10.0)
+    assert histogram.quantile(0.99) == 0.4
+
+
+def test_timed_phase_records_into_bound_command():
+    metrics = Metrics()
+    with timed_phase("db_fetch"):
+        pass
+    assert metrics.histograms == {}
+
+    def invoke() -> None:
+        metrics.bind_command("history guild_history")
+        with timed_phase("db_fetch"):
+            pass
+
+    contextvars.copy_context().run(invoke)
+    assert metrics.histogram("command_db_fetch_seconds", "history guild_history").count == 1
+
+    with timed_phase("db_fetch"):
+        pass
+    assert metrics.histogram("command_db_fetch_seconds", "history guild_history").count == 1
+
+
+def test_gauge_registry():
+    metrics = Metrics()
+    gauge = metrics.gauge("outbox_queue_depth")
+    gauge.inc(3)
+    gauge.dec()
+    assert metrics.gauge("outbox_queue_depth") is gauge
+    assert gauge.value == 2
+    gauge.set(0)
+    assert metrics.gauges[("outbox_queue_depth", "")].value == 0
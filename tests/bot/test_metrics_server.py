@@ -0,0 +1,45 @@
+import asyncio
+import unittest
+
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.bot._metrics_server import MetricsServer
+from faz.bot.app.discord.bot._metrics_server import render_prometheus
+
+
+class TestMetricsServer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.metrics = Metrics()
+        self.metrics.counter("history_cache_hits_total", "player_history").inc(2)
+        self.metrics.gauge("outbox_queue_depth").set(3)
+        histogram = self.metrics.histogram("command_latency_seconds", 'say "hi"')
+        histogram.observe(0.2)
+
+    def test_render_prometheus(self) -> None:
+        text = render_prometheus(self.metrics)
+
+        self.assertIn("# TYPE history_cache_hits_total counter\n", text)
+        self.assertIn('history_cache_hits_total{label="player_history"} 2\n', text)
+        self.assertIn("# TYPE outbox_queue_depth gauge\noutbox_queue_depth 3\n", text)
+        self.assertIn("# TYPE command_latency_seconds histogram\n", text)
+        self.assertIn('command_latency_seconds_bucket{label="say \\"hi\\"",le="0.1"} 0\n', text)
+        self.assertIn('command_latency_seconds_bucket{label="say \\"hi\\"",le="0.25"} 1\n', text)
+        self.assertIn('command_latency_seconds_bucket{label="say \\"hi\\"",le="+Inf"} 1\n', text)
+        self.assertIn('command_latency_seconds_count{label="say \\"hi\\""} 1\n', text)
+
+    async def test_serves_metrics(self) -> None:
+        server = MetricsServer(self.metrics, "127.0.0.1", 0)
+        await server.start()
+        try:
+            self.assertEqual((await self._get(server.port, "/metrics"))[:15], b"HTTP/1.0 200 OK")
+            self.assertEqual((await self._get(server.port, "/"))[:22], b"HTTP/1.0 404 Not Found")
+        finally:
+            await server.close()
+
+    async def _get(self, port: int, path: str) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+        return response
@@ -0,0 +1,98 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+from nextcord import HTTPException
+
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.bot._outbox import Outbox
+from faz.bot.app.discord.bot._outbox import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.bucket = TokenBucket(rate=1.0, capacity=2, clock=lambda: self.now)
+
+    def test_refills_at_rate_up_to_capacity(self) -> None:
+        self.assertEqual(self.bucket.try_acquire(), 0)
+        self.assertEqual(self.bucket.try_acquire(), 0)
+        self.assertEqual(self.bucket.try_acquire(), 1.0)
+
+        self.now = 0.5
+        self.assertEqual(self.bucket.try_acquire(), 0.5)
+        self.now = 10.0
+        self.assertEqual(self.bucket.try_acquire(), 0)
+        self.assertEqual(self.bucket.tokens, 1)
+
+    def test_block(self) -> None:
+        self.bucket.block(3.0)
+
+        self.assertEqual(self.bucket.try_acquire(), 3.0)
+        self.now = 3.0
+        self.assertEqual(self.bucket.try_acquire(), 1.0)
+
+
+class TestOutbox(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.metrics = Metrics()
+        self.outbox = Outbox(self.metrics, backoff=0)
+        self.channel = MagicMock(id=1, send=AsyncMock())
+
+    async def asyncTearDown(self) -> None:
+        await self.outbox.close()
+
+    async def test_coalesces_pending_messages(self) -> None:
+        futures = [self.outbox.enqueue(self.channel, f"line {i}") for i in range(3)]
+        self.assertEqual(self.outbox.queue_depth, 3)
+
+        await asyncio.gather(*futures)
+
+        self.channel.send.assert_awaited_once_with("line 0\nline 1\nline 2")
+        self.assertEqual(self.outbox.queue_depth, 0)
+        self.assertEqual(self.metrics.gauge("outbox_queue_depth").value, 0)
+        self.assertEqual(self.metrics.histogram("outbox_delivery_seconds").count, 3)
+        self.assertEqual(self.metrics.counter("outbox_messages_total").value, 1)
+
+    async def test_splits_content_over_message_limit(self) -> None:
+        await self.outbox.send(self.channel, "\n".join(["a" * 900] * 5))
+
+        sent = [call.args[0] for call in self.channel.send.await_args_list]
+        self.assertEqual([len(message) for message in sent], [1801, 1801, 900])
+
+    def test_split_long_line(self) -> None:
+        parts = Outbox._split("b\n" + "a" * 4500)
+
+        self.assertEqual([len(part) for part in parts], [1, 2000, 2000, 500])
+
+    async def test_retries_rate_limited_send(self) -> None:
+        response = MagicMock(status=429, headers={"Retry-After": "0"})
+        self.channel.send.side_effect = [HTTPException(response, "rate limited"), None]
+
+        await self.outbox.send(self.channel, "test")
+
+        self.assertEqual(self.channel.send.await_count, 2)
+        self.assertEqual(self.metrics.counter("outbox_retries_total").value, 1)
+
+    async def test_fails_without_retrying_client_error(self) -> None:
+        response = MagicMock(status=403, headers={})
+        self.channel.send.side_effect = HTTPException(response, "forbidden")
+
+        with self.assertRaises(HTTPException):
+            await self.outbox.send(self.channel, "test")
+
+        self.channel.send.assert_awaited_once()
+        self.assertEqual(self.metrics.counter("outbox_failures_total").value, 1)
+
+    async def test_fails_batch_on_connection_error_and_keeps_draining(self) -> None:
+        self.channel.send.side_effect = [ConnectionResetError("reset"), None]
+
+        first = self.outbox.enqueue(self.channel, "a" * 2000)
+        second = self.outbox.enqueue(self.channel, "b")
+
+        with self.assertRaises(ConnectionResetError):
+            await first
+        await second
+        self.assertEqual(self.channel.send.await_count, 2)
+        self.assertEqual(self.metrics.counter("outbox_failures_total").value, 1)
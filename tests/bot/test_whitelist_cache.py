@@ -0,0 +1,56 @@
+from datetime import datetime
+from datetime import timedelta
+from time import monotonic
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.bot._whitelist_cache import Groups
+from faz.bot.app.discord.bot._whitelist_cache import WhitelistCache
+
+
+class TestWhitelistCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.db = MagicMock()
+        self.select = self.db.whitelist_group.select = AsyncMock(return_value=None)
+        self.metrics = Metrics()
+        self.cache = WhitelistCache(self.db, self.metrics, ttl=60)
+
+    async def test_caches_lookup(self) -> None:
+        self.select.return_value = MagicMock(until=None)
+
+        self.assertTrue(await self.cache.is_member(Groups.BAN, 1))
+        self.assertTrue(await self.cache.is_member(Groups.BAN, 1))
+
+        self.select.assert_awaited_once_with((1, "ban"))
+        self.assertEqual(self.metrics.counter("whitelist_cache_misses_total", "ban").value, 1)
+        self.assertEqual(self.metrics.counter("whitelist_cache_hits_total", "ban").value, 1)
+
+    async def test_caches_missing_entry(self) -> None:
+        self.assertFalse(await self.cache.is_member(Groups.GUILD, 1))
+        self.assertFalse(await self.cache.is_member(Groups.GUILD, 1))
+
+        self.select.assert_awaited_once_with((1, "guild"))
+
+    async def test_invalidate(self) -> None:
+        self.assertFalse(await self.cache.is_member(Groups.BAN, 1))
+        self.select.return_value = MagicMock(until=None)
+
+        self.cache.invalidate(Groups.BAN, 1)
+
+        self.assertTrue(await self.cache.is_member(Groups.BAN, 1))
+        self.assertEqual(self.select.await_count, 2)
+
+    async def test_expired_until(self) -> None:
+        self.select.return_value = MagicMock(until=datetime.now() - timedelta(minutes=1))
+
+        self.assertFalse(await self.cache.is_member(Groups.BAN, 1))
+
+    async def test_until_shortens_ttl(self) -> None:
+        self.select.return_value = MagicMock(until=datetime.now() + timedelta(seconds=1))
+
+        self.assertTrue(await self.cache.is_member(Groups.BAN, 1))
+
+        entry = self.cache._entries[(Groups.BAN, 1)]
+        self.assertLessEqual(entry.expires_at, monotonic() + 1)
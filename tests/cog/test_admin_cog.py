@@ -12,6 +12,8 @@ from faz.bot.database.fazcord.fazcord_database import FazcordDatabase
 from faz.bot.database.fazwynn.fazwynn_database import FazwynnDatabase
 
 from faz.bot.app.discord.app._properties import Properties
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.bot._outbox import Outbox
 from faz.bot.app.discord.bot._utils import Utils
 from faz.bot.app.discord.bot.bot import Bot
 from faz.bot.app.discord.bot.errors import ApplicationException
@@ -59,6 +61,7 @@ class TestAdminCog(IsolatedAsyncioTestCase):
         """Test if ban method successfully bans user that's not already banned."""
         await self.admin.ban(mock_intr, user_id="1")
         self.assertTrue(await self.db.whitelist_group.is_banned_user(1))
+        self.mock_bot.checks.invalidate_ban.assert_called_once_with(1)
 
     async def test_ban_user_already_banned(self, mock_intr: MagicMock) -> None:
         """Test if ban method fails banning user that's already banned."""
@@ -73,6 +76,7 @@ class TestAdminCog(IsolatedAsyncioTestCase):
 
         await self.admin.unban(mock_intr, user_id="1")
         self.assertFalse(await self.db.whitelist_group.is_banned_user(1))
+        self.mock_bot.checks.invalidate_ban.assert_called_once_with(1)
 
     async def test_unban_not_banned(self, mock_intr: MagicMock) -> None:
         """Test if ban method fails banning user that's already banned."""
@@ -87,6 +91,8 @@ class TestAdminCog(IsolatedAsyncioTestCase):
         mock_intr.send.assert_awaited_once_with("test")
 
     async def test_send(self, mock_intr: MagicMock) -> None:
+        mock_intr.response.defer = AsyncMock()
+        self.mock_bot.outbox = Outbox(Metrics())
         mock_channel = self._get_mock_channel()
         self.mock_utils.must_get_channel.return_value = mock_channel
         await self.admin.send(mock_intr, 1, "test")
@@ -96,6 +102,12 @@ class TestAdminCog(IsolatedAsyncioTestCase):
         self.mock_utils.must_get_channel.return_value = mock_channel
         with self.assertRaises(ApplicationException):
             await self.admin.send(mock_intr, 1, "test")
+        mock_channel = self._get_mock_channel()
+        mock_channel.send.side_effect = ConnectionResetError("reset")
+        self.mock_utils.must_get_channel.return_value = mock_channel
+        with self.assertRaises(ApplicationException):
+            await self.admin.send(mock_intr, 1, "test")
+        self.assertEqual(mock_intr.response.defer.await_count, 3)
 
     async def test_sync_guild(self, mock_intr: MagicMock) -> None:
         mock_intr.response.defer = AsyncMock()
@@ -125,6 +137,7 @@ class TestAdminCog(IsolatedAsyncioTestCase):
         """Test if whitelist method successfully whitelists guild that's not already whitelisted."""
         await self.admin.whitelist(mock_intr, guild_id="1")
         self.assertTrue(await self.db.whitelist_group.is_whitelisted_guild(1))
+        self.mock_bot.checks.invalidate_whitelist.assert_called_once_with(1)
 
     async def test_whitelist_guild_already_whitelisted(self, mock_intr: MagicMock) -> None:
         """Test if whitelist method fails whitelisting guild that's already whitelisted."""
@@ -132,6 +145,16 @@ class TestAdminCog(IsolatedAsyncioTestCase):
         with self.assertRaises(ApplicationException):
             await self.admin.whitelist(mock_intr, guild_id="1")
 
+    async def test_metrics(self, mock_intr: MagicMock) -> None:
+        """Test if metrics method sends the phase timings of commands."""
+        metrics = Metrics()
+        metrics.histogram("command_db_fetch_seconds", "history guild_history").observe(0.2)
+        self.mock_bot.metrics = metrics
+        await self.admin.metrics(mock_intr)
+        message = mock_intr.send.call_args.args[0]
+        self.assertIn("command_db_fetch", message)
+        self.assertIn("history guild_history", message)
+
     async def asyncTearDown(self) -> None:
         await self.db.async_engine.dispose()
         return await super().asyncTearDown()
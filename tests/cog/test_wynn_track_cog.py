@@ -36,17 +36,18 @@ class TestWynnTrackCog(unittest.IsolatedAsyncioTestCase):
 
         self.utils.must_get_channel.assert_called_once_with("123")
         self.bot.fazcord_db.track_entry.toggle.assert_called_once_with("123")
+        self.bot.track_index.set_enabled.assert_called_once_with("123", True)
         mock_respond_successful.assert_called_once_with(
             self.intr, "Toggled track entry on channel `123` (`test-channel`) to True"
         )
 
     @patch("faz.bot.app.discord.cog.wynn_track_cog.WynnTrackCog._respond_successful")
     async def test_show_no_trackers(self, mock_respond_successful: MagicMock):
-        self.bot.fazcord_db.track_entry.select_by_guild_id = AsyncMock(return_value=[])
+        self.bot.track_entry_loader.select_by_guild_id = AsyncMock(return_value=[])
 
         await self.cog.show(self.intr)
 
-        self.bot.fazcord_db.track_entry.select_by_guild_id.assert_called_once_with(123456789)
+        self.bot.track_entry_loader.select_by_guild_id.assert_called_once_with(123456789)
         mock_respond_successful.assert_called_once_with(
             self.intr, "This server does not have any Wynncraft trackers registred"
         )
@@ -57,14 +58,15 @@ class TestWynnTrackCog(unittest.IsolatedAsyncioTestCase):
         mock_entry.channel_id = "123"
         mock_entry.channel.channel_name = "test-channel"
         mock_entry.type = "GUILD"
-        mock_entry.awaitable_attrs.channel = self._mock_awaitable_attr()
-        mock_entry.awaitable_attrs.associations = self._mock_awaitable_attr()
-        mock_entry.associations = [MagicMock(associated_value="test-guild")]
-        self.bot.fazcord_db.track_entry.select_by_guild_id = AsyncMock(return_value=[mock_entry])
+        mock_entry.associations = [MagicMock(associated_value=b"guild-uuid")]
+        loader = self.bot.track_entry_loader
+        loader.select_by_guild_id = AsyncMock(return_value=[mock_entry])
+        loader.get_display_names = AsyncMock(return_value={b"guild-uuid": "test-guild"})
 
         await self.cog.show(self.intr)
 
-        self.bot.fazcord_db.track_entry.select_by_guild_id.assert_called_once_with(123456789)
+        loader.select_by_guild_id.assert_called_once_with(123456789)
+        loader.get_display_names.assert_called_once_with([mock_entry])
         mock_respond_successful.assert_called_once_with(
             self.intr, "- `123 (test-channel)`: GUILD\n\t- `test-guild`"
         )
@@ -75,12 +77,17 @@ class TestWynnTrackCog(unittest.IsolatedAsyncioTestCase):
         mock_channel.id = "123"
         mock_channel.name = "test-channel"
         self.utils.must_get_channel.return_value = mock_channel
+        self.bot.fazcord_db.track_entry.select_by_channel_id = AsyncMock(
+            return_value=MagicMock(id=7)
+        )
         self.bot.fazcord_db.track_entry.delete = AsyncMock()
 
         await self.cog.remove(self.intr, "123")
 
         self.utils.must_get_channel.assert_called_once_with("123")
-        self.bot.fazcord_db.track_entry.delete.assert_called_once_with("123")
+        session = self.bot.fazcord_db.enter_async_session.return_value.__aenter__.return_value
+        self.bot.fazcord_db.track_entry.delete.assert_called_once_with(7, session=session)
+        self.bot.track_index.remove_entry.assert_called_once_with("123")
         mock_respond_successful.assert_called_once_with(
             self.intr, "Removed track entry on channel `123 (test-channel)`"
         )
@@ -128,6 +135,7 @@ class TestWynnTrackCog(unittest.IsolatedAsyncioTestCase):
             session=self.bot.fazcord_db.enter_async_session.return_value.__aenter__.return_value,
         )
         self.bot.fazcord_db.track_entry.insert.assert_called_once()
+        self.bot.track_index.add_entry.assert_called_once_with("123", "GUILD")
         mock_respond_successful.assert_called_once_with(
             self.intr, "Added `GUILD` track entry on channel `123 (test-channel)`"
         )
@@ -158,11 +166,40 @@ class TestWynnTrackCog(unittest.IsolatedAsyncioTestCase):
             session=self.bot.fazcord_db.enter_async_session.return_value.__aenter__.return_value,
         )
         self.bot.fazcord_db.track_entry_association.insert.assert_called_once()
+        self.bot.track_index.add_value.assert_called_once_with("123", "test-uuid")
         mock_respond_successful.assert_called_once_with(
             self.intr,
             "Added guild `test-guild` to `GUILD` track entry on channel `123 (test-channel)`",
         )
 
+    @patch("faz.bot.app.discord.cog.wynn_track_cog.WynnTrackCog._respond_successful")
+    async def test_add_track_entry_player_value(self, mock_respond_successful: MagicMock):
+        mock_channel = MagicMock()
+        mock_channel.id = "123"
+        mock_channel.name = "test-channel"
+        self.utils.must_get_channel.return_value = mock_channel
+        mock_track_entry = MagicMock()
+        mock_track_entry.associations = []
+        mock_track_entry.awaitable_attrs.associations = self._mock_awaitable_attr()
+        self.bot.fazcord_db.track_entry.select_by_channel_id = AsyncMock(
+            return_value=mock_track_entry
+        )
+        self.bot.fazcord_db.track_entry_association.model = MagicMock()
+        self.bot.fazcord_db.track_entry_association.insert = AsyncMock()
+        self.bot.fazwynn_db.player_info.get_player = AsyncMock(
+            return_value=MagicMock(uuid="test-uuid")
+        )
+
+        await self.cog._add_track_entry(self.intr, "123", "PLAYER", "test-user")
+
+        self.bot.fazwynn_db.player_info.get_player.assert_called_once_with("test-user")
+        self.bot.fazcord_db.track_entry_association.insert.assert_called_once()
+        self.bot.track_index.add_value.assert_called_once_with("123", "test-uuid")
+        mock_respond_successful.assert_called_once_with(
+            self.intr,
+            "Added player `test-user` to `PLAYER` track entry on channel `123 (test-channel)`",
+        )
+
     @patch("faz.bot.app.discord.cog.wynn_track_cog.WynnTrackCog._respond_successful")
     async def test_add_track_entry_remove_existing_value(self, mock_respond_successful: MagicMock):
         mock_channel = MagicMock()
@@ -224,3 +261,32 @@ class TestWynnTrackCog(unittest.IsolatedAsyncioTestCase):
         mock_respond_successful.assert_called_once_with(
             self.intr, "Removed track entry on channel `123 (test-channel)`"
         )
+        self.bot.track_index.remove_value.assert_not_called()
+        self.bot.track_index.remove_entry.assert_called_once_with("123")
+
+    @patch("faz.bot.app.discord.cog.wynn_track_cog.WynnTrackCog._respond_successful")
+    async def test_add_track_entry_failed_commit_leaves_index(
+        self, mock_respond_successful: MagicMock
+    ):
+        self.utils.must_get_channel.return_value = MagicMock(id="123")
+        self.bot.fazcord_db.track_entry.select_by_channel_id = AsyncMock(return_value=None)
+        self.bot.fazcord_db.track_entry.insert = AsyncMock()
+        session = self.bot.fazcord_db.enter_async_session.return_value
+        session.__aexit__ = AsyncMock(side_effect=RuntimeError("commit failed"))
+
+        with self.assertRaises(RuntimeError):
+            await self.cog._add_track_entry(self.intr, "123", "GUILD", "test-guild")
+
+        self.bot.track_index.add_entry.assert_not_called()
+        mock_respond_successful.assert_not_called()
+
+    async def test_index(self):
+        self.bot.track_index.counts.return_value = [("GUILD", 2, 1, 3)]
+        self.bot.track_index.version = 7
+        self.intr.send = AsyncMock()
+
+        await self.cog.index(self.intr)
+
+        message = self.intr.send.call_args.args[0]
+        self.assertIn("GUILD", message)
+        self.assertIn("Version: 7", message)
@@ -0,0 +1,34 @@
+from faz.bot.app.discord.embed.builder._base_field_builder import BaseFieldBuilder
+from faz.bot.app.discord.embed.embed_field import EmbedField
+
+
+def test_add_embed_field_keeps_every_line():
+    fields: list[EmbedField] = []
+
+    BaseFieldBuilder._add_embed_field(fields, "label", "a\nb\nc")
+
+    assert [(field.name, field.value) for field in fields] == [("label", "a\nb\nc")]
+
+
+def test_add_embed_field_splits_long_value_on_newlines():
+    fields: list[EmbedField] = []
+    lines = [f"{n:09}" for n in range(200)]
+
+    BaseFieldBuilder._add_embed_field(fields, "label", "\n".join(lines))
+
+    assert [field.name for field in fields] == ["label", ""]
+    assert all(len(field.value) <= 1024 for field in fields)
+    assert "\n".join(field.value for field in fields).split("\n") == lines
+
+
+def test_add_embed_field_splits_long_line():
+    fields: list[EmbedField] = []
+
+    BaseFieldBuilder._add_embed_field(fields, "label", "a\n" + "b" * 2500)
+
+    assert [(field.name, len(field.value)) for field in fields] == [
+        ("label", 1),
+        ("", 1024),
+        ("", 1024),
+        ("", 452),
+    ]
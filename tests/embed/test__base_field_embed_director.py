@@ -0,0 +1,92 @@
+from datetime import datetime
+import unittest
+from unittest.mock import MagicMock
+
+from nextcord import Embed
+
+from faz.bot.app.discord.embed.builder.embed_builder import EmbedBuilder
+from faz.bot.app.discord.embed.director._base_field_embed_director import BaseFieldEmbedDirector
+from faz.bot.app.discord.embed.embed_field import EmbedField
+
+
+class _FieldEmbedDirector(BaseFieldEmbedDirector):
+    def __init__(self, embed_builder: EmbedBuilder | None = None, **kwargs) -> None:
+        super().__init__(embed_builder or MagicMock(), **kwargs)
+        self.build_count = 0
+
+    async def setup(self) -> None: ...
+
+    def build(self, option: str) -> list[EmbedField]:
+        self.build_count += 1
+        return [EmbedField(option, option)]
+
+    def _iter_field_builds(self):
+        for option in ("a", "b"):
+            yield option, lambda option=option: self.build(option)
+
+
+class TestBaseFieldEmbedDirector(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.director = _FieldEmbedDirector()
+
+    def test_get_fields_memoizes_by_key(self) -> None:
+        fields = self.director._get_fields("a", lambda: self.director.build("a"))
+
+        self.assertIs(self.director._get_fields("a", lambda: self.director.build("a")), fields)
+        self.assertEqual(self.director.build_count, 1)
+
+    async def test_precompute_fields(self) -> None:
+        self.director._get_fields("a", lambda: self.director.build("a"))
+
+        await self.director.precompute_fields()
+        fields = self.director._get_fields("b", lambda: self.director.build("b"))
+
+        self.assertEqual(fields[0].name, "b")
+        self.assertEqual(self.director.build_count, 2)
+
+    def test_paginating_keeps_built_embed(self) -> None:
+        builder = EmbedBuilder(initial_embed=Embed(title="t"))
+        director = _FieldEmbedDirector(builder)
+        director.set_items([EmbedField("a", "a")])
+        builder.set_title("Title")
+
+        self.assertEqual(director.page_count, 1)
+        self.assertEqual(builder.get_embed().title, "Title")
+
+    def test_packs_fields_up_to_embed_size(self) -> None:
+        interaction = MagicMock()
+        interaction.created_at = datetime.now()
+        interaction.user.display_name = "u" * 32
+        builder = EmbedBuilder(interaction, Embed(title="t" * 100, description="d" * 500))
+        director = _FieldEmbedDirector(builder)
+        fields = [EmbedField(f"f{i}", "v" * (100 + 50 * (i % 20))) for i in range(60)]
+        director.set_items(fields)
+        self.assertGreater(director.page_count, 1)
+
+        page_fields = []
+        for page in range(1, director.page_count + 1):
+            embed = director.construct_page(page)
+            self.assertLessEqual(len(embed), BaseFieldEmbedDirector.EMBED_SIZE_LIMIT)
+            self.assertLessEqual(len(embed.fields), BaseFieldEmbedDirector.EMBED_FIELD_LIMIT)
+            page_fields.extend(embed.fields[:-1])
+            # Greedy: the first field of the next page would not have fit
+            if page < director.page_count:
+                next_field = director.get_items(page + 1)[0]
+                next_size = len(next_field.name) + len(next_field.value)
+                self.assertGreater(len(embed) + next_size, director.EMBED_SIZE_LIMIT - 256)
+
+        self.assertEqual([field.name for field in page_fields], [field.name for field in fields])
+
+    def test_limits_field_count(self) -> None:
+        director = _FieldEmbedDirector()
+
+        director.set_items([EmbedField("f", "v")] * 25)
+        self.assertEqual(director.page_count, 1)
+
+        # One field is left for the page number
+        director.set_items([EmbedField("f", "v")] * 26)
+        self.assertEqual([len(director.get_items(page)) for page in (1, 2)], [24, 2])
+
+        director = _FieldEmbedDirector(items_per_page=5)
+        director.set_items([EmbedField("f", "v")] * 12)
+        self.assertEqual(director.page_count, 3)
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import Mock
 
 from nextcord import Embed
@@ -90,3 +91,43 @@ def test_page_count(pagination_embed_director):
     assert pagination_embed_director.page_count == 1
     pagination_embed_director.set_items(["item1"] * 21)
     assert pagination_embed_director.page_count == 7
+
+
+def test_construct_page_reuses_rendered_page(pagination_embed_director):
+    pagination_embed_director.set_items(["item1"] * 7)
+
+    first = pagination_embed_director.construct_page(2)
+    again = pagination_embed_director.construct_page(2)
+
+    assert pagination_embed_director.embed_builder.build.call_count == 1
+    assert again is not first
+    assert pagination_embed_director.current_page == 2
+
+
+def test_render_key(pagination_embed_director):
+    director = pagination_embed_director
+    items = ["item1"] * 7
+
+    director.set_items(items, render_key="a").construct_page(1)
+    director.set_items(["item2"], render_key="b").construct_page(1)
+    director.set_items(items, render_key="a").construct_page(1)
+    assert director.embed_builder.build.call_count == 2
+
+    # Without a key, pages are only reused until the items are set again
+    director.set_items(items).construct_page(1)
+    director.set_items(items).construct_page(1)
+    assert director.embed_builder.build.call_count == 4
+
+
+def test_prerender_neighbours(pagination_embed_director):
+    director = pagination_embed_director
+    director.set_items(["item1"] * 7)
+    director.construct_page(1)
+
+    asyncio.run(director.prerender_neighbours())
+
+    assert director.current_page == 1
+    assert director.embed_builder.build.call_count == 3
+    director.construct_page(2)
+    director.construct_page(3)
+    assert director.embed_builder.build.call_count == 3
@@ -0,0 +1,58 @@
+from datetime import datetime
+import unittest
+from unittest.mock import MagicMock
+
+from tabulate import tabulate
+
+from faz.bot.app.discord.embed.builder.embed_builder import EmbedBuilder
+from faz.bot.app.discord.embed.director._base_table_embed_director import BaseTableEmbedDirector
+
+HEADER = ("#", "Username", "Activity")
+
+
+class _TableEmbedDirector(BaseTableEmbedDirector):
+    async def setup(self) -> None: ...
+
+
+class TestBaseTableEmbedDirector(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interaction = MagicMock()
+        self.interaction.created_at = datetime.now()
+        self.rows = [(1, "a", "1h"), (2, "a_long_username", "2h"), (3, "b", "3h")]
+
+    def _descriptions(self, director: BaseTableEmbedDirector) -> list[str]:
+        return [director.construct_page(page).description for page in (1, 2)]  # type: ignore
+
+    def test_pages_share_column_widths(self) -> None:
+        director = _TableEmbedDirector(
+            EmbedBuilder(self.interaction), items=self.rows, items_per_page=2, item_header=HEADER
+        )
+
+        first, second = self._descriptions(director)
+
+        self.assertEqual(first.splitlines()[1], second.splitlines()[1])
+        self.assertEqual(first, "```ml\n" + tabulate(self.rows[:2], HEADER, "github") + "\n```")
+        self.assertIn("|   3 | b               | 3h         |", second)
+
+    def test_use_tabulate(self) -> None:
+        director = _TableEmbedDirector(
+            EmbedBuilder(self.interaction),
+            items=self.rows,
+            items_per_page=2,
+            item_header=HEADER,
+            use_tabulate=True,
+        )
+
+        _, second = self._descriptions(director)
+
+        self.assertEqual(second, "```ml\n" + tabulate(self.rows[2:], HEADER, "github") + "\n```")
+
+    def test_set_items_formats_new_table(self) -> None:
+        director = _TableEmbedDirector(
+            EmbedBuilder(self.interaction), items=self.rows, item_header=HEADER
+        )
+        director.construct_page(1)
+
+        director.set_items([(1, "c", "4h")])
+
+        self.assertIn("| c          | 4h         |", director.construct_page(1).description)
@@ -102,6 +102,14 @@ def test_set_builder_initial_embed(embed_builder):
     assert embed.title == "Initial Title"
 
 
+def test_initial_embed(embed_builder):
+    initial_embed = Embed(title="Initial Title")
+    embed_builder.set_builder_initial_embed(initial_embed)
+    embed_builder.set_title("Title")
+    assert embed_builder.initial_embed is initial_embed
+    assert embed_builder.get_embed().title == "Title"
+
+
 def test_add_author(embed_builder):
     embed_builder._add_author()
     embed = embed_builder.get_embed()
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+import pandas as pd
+
+from faz.bot.app.discord.embed.director.guild_activity_embed_director import (
+    GuildActivityEmbedDirector,
+)
+
+
+def test_get_activity_times_clips_sessions_to_period():
+    begin = datetime(2024, 1, 1)
+    end = datetime(2024, 1, 2)
+    sessions = pd.DataFrame(
+        [
+            (b"a", datetime(2023, 12, 31, 23), datetime(2024, 1, 1, 1)),
+            (b"a", datetime(2024, 1, 1, 5), datetime(2024, 1, 1, 6)),
+            (b"b", datetime(2024, 1, 1, 23), datetime(2024, 1, 2, 3)),
+        ],
+        columns=["uuid", "logon_datetime", "logoff_datetime"],
+    )
+
+    ret = GuildActivityEmbedDirector._get_activity_times(sessions, begin, end)
+
+    assert ret == {b"a": 7200.0, b"b": 3600.0}
+
+
+def test_get_activity_times_ignores_sessions_outside_period():
+    begin = datetime(2024, 1, 1, 12, 1)
+    end = datetime(2024, 1, 1, 13)
+    sessions = pd.DataFrame(
+        [
+            (b"a", datetime(2024, 1, 1, 11, 55), datetime(2024, 1, 1, 12, 0, 30)),
+            (b"a", datetime(2024, 1, 1, 12, 10), datetime(2024, 1, 1, 12, 11)),
+            (b"b", datetime(2024, 1, 1, 13, 5), datetime(2024, 1, 1, 13, 10)),
+        ],
+        columns=["uuid", "logon_datetime", "logoff_datetime"],
+    )
+
+    ret = GuildActivityEmbedDirector._get_activity_times(sessions, begin, end)
+
+    assert ret == {b"a": 60.0, b"b": 0.0}
+
+
+def test_get_activity_times_empty():
+    sessions = pd.DataFrame(columns=["uuid", "logon_datetime", "logoff_datetime"])
+
+    ret = GuildActivityEmbedDirector._get_activity_times(sessions, datetime.now(), datetime.now())
+
+    assert ret == {}
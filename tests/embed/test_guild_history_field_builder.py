@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from faz.bot.app.discord.embed.builder.guild_history_field_builder import GuildHistoryFieldBuilder
+from faz.bot.app.discord.embed.embed_field import EmbedField
+from faz.bot.app.discord.history.normalize import normalize_player_history
+from faz.bot.app.discord.select.guild_history_data_options import GuildHistoryDataOption
+from faz.bot.app.discord.select.guild_history_mode_options import GuildHistoryModeOptions
+
+
+def _reference_overall(player_df: pd.DataFrame, guild_df: pd.DataFrame) -> list[EmbedField]:
+    """The per-player loop `_parser_overall` replaced."""
+    player_df = player_df.replace("", "None")
+    builder = GuildHistoryFieldBuilder()
+    ret: list[EmbedField] = []
+    earliest = guild_df.iloc[guild_df["datetime"].idxmin()]
+    latest = guild_df.iloc[guild_df["datetime"].idxmax()]
+    if earliest["level"] != latest["level"]:
+        builder._add_embed_field(ret, "Level", f"{earliest['level']} -> {latest['level']}")
+
+    lines_guild = {}
+    lines_rank = {}
+    for uuid in pd.unique(player_df["uuid"]):
+        player = player_df[player_df["uuid"] == uuid]
+        earliest_ = player.loc[player["datetime"].idxmin()]
+        latest_ = player.loc[player["datetime"].idxmax()]
+        username = latest_["username"]
+        if earliest_["guild_name"] != latest_["guild_name"]:
+            lines_guild[username] = f"{earliest_['guild_name']} -> {latest_['guild_name']}"
+        if earliest_["guild_rank"] != latest_["guild_rank"]:
+            lines_rank[username] = f"{earliest_['guild_rank']} -> {latest_['guild_rank']}"
+
+    for lines in (lines_guild, lines_rank):
+        if len(lines) == 0:
+            continue
+        label_space = builder._get_max_key_length(lines)
+        desc = "\n".join(
+            builder._diff_str_or_blank(value, label, label_space) for label, value in lines.items()
+        )
+        builder._add_embed_field(ret, "", desc)
+    return ret
+
+
+def _reference_member_list(player_df: pd.DataFrame) -> list[EmbedField]:
+    """The per-row loop `_parser_historical_member_list` replaced."""
+    player_df = player_df.replace("", "None")
+    builder = GuildHistoryFieldBuilder()
+    lines = []
+    prev_value = None
+    for uuid in pd.unique(player_df["uuid"]):
+        player = player_df[player_df["uuid"] == uuid]
+        lines.append(f"**{player.iloc[-1]['username']}**")
+        new_lines = []
+        for _, row in player.iterrows():
+            if row["guild_name"] == "None":
+                val = "None"
+            else:
+                val = f"{row['guild_name']} ({row['guild_rank']})"
+            if prev_value == val:
+                continue
+            prev_value = val
+            new_lines.append(f"{builder._get_formatted_timestamp(row)}: {val}")
+        if len(new_lines) < 2:
+            lines.pop()
+            continue
+        lines.extend(new_lines)
+    ret: list[EmbedField] = []
+    builder._add_embed_field(ret, "Member List", "\n".join(lines))
+    return ret
+
+
+def _random_player_df(seed: int, players: int = 30, rows: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    uuids = [bytes([i]) * 16 for i in range(players)]
+    return pd.DataFrame(
+        {
+            "uuid": [uuids[i] for i in rng.integers(0, players, rows)],
+            # Few distinct usernames, so that players share them
+            "username": [f"user{i}" for i in rng.integers(0, players // 2, rows)],
+            "guild_name": rng.choice(["Guild", "Other", ""], rows, p=[0.8, 0.1, 0.1]),
+            "guild_rank": rng.choice(["RECRUIT", "CAPTAIN", "CHIEF"], rows, p=[0.8, 0.1, 0.1]),
+            # Coarse datetimes, so that players have ties
+            "datetime": pd.to_datetime(np.sort(rng.integers(0, rows // 4, rows)) * 60, unit="s"),
+        }
+    )
+
+
+def _guild_df() -> pd.DataFrame:
+    return pd.DataFrame({"level": [10.5, 11.25], "datetime": pd.to_datetime([0, 6000], unit="s")})
+
+
+def _as_tuples(fields: list[EmbedField]) -> list[tuple[str, str]]:
+    return [(field.name, field.value) for field in fields]
+
+
+def _build(
+    player_df: pd.DataFrame, mode: GuildHistoryModeOptions, data: GuildHistoryDataOption
+) -> list[tuple[str, str]]:
+    builder = GuildHistoryFieldBuilder()
+    builder.set_data(normalize_player_history(player_df.copy()), _guild_df()).set_mode_option(
+        mode
+    ).set_data_option(data)
+    return _as_tuples(list(builder.build()))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_overall_matches_reference(seed):
+    player_df = _random_player_df(seed)
+
+    fields = _build(player_df, GuildHistoryModeOptions.OVERALL, GuildHistoryDataOption.MEMBER_LIST)
+
+    assert fields == _as_tuples(_reference_overall(player_df, _guild_df()))
+    assert len(fields) == 3
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_member_list_matches_reference(seed):
+    player_df = _random_player_df(seed)
+
+    fields = _build(
+        player_df, GuildHistoryModeOptions.HISTORICAL, GuildHistoryDataOption.MEMBER_LIST
+    )
+
+    assert fields == _as_tuples(_reference_member_list(player_df))
+    assert len(fields[0][1]) > 0
+
+
+def test_member_list_carries_previous_value_across_players():
+    player_df = pd.DataFrame(
+        {
+            "uuid": [b"a", b"a", b"b", b"b", b"b"],
+            "username": ["a", "a", "b", "b", "b"],
+            "guild_name": ["G", "G", "G", "", "G"],
+            "guild_rank": ["R", "C", "C", "C", "C"],
+            "datetime": pd.to_datetime([0, 60, 120, 180, 240], unit="s"),
+        }
+    )
+
+    fields = _build(
+        player_df, GuildHistoryModeOptions.HISTORICAL, GuildHistoryDataOption.MEMBER_LIST
+    )
+
+    assert fields[0][1] == (
+        "**a**\n<t:0:R>: G (R)\n<t:60:R>: G (C)\n**b**\n<t:180:R>: None\n<t:240:R>: G (C)"
+    )
+    assert fields == _as_tuples(_reference_member_list(player_df))
+
+
+def test_empty_player_df():
+    player_df = _random_player_df(0).iloc[:0]
+
+    overall = _build(player_df, GuildHistoryModeOptions.OVERALL, GuildHistoryDataOption.MEMBER_LIST)
+    member_list = _build(
+        player_df, GuildHistoryModeOptions.HISTORICAL, GuildHistoryDataOption.MEMBER_LIST
+    )
+
+    assert overall == _as_tuples(_reference_overall(player_df, _guild_df()))
+    assert member_list == [("Member List", "")]
@@ -0,0 +1,85 @@
+from uuid import UUID
+
+import pandas as pd
+
+from faz.bot.app.discord.embed.builder.player_history_field_builder import (
+    PlayerHistoryFieldBuilder,
+)
+from faz.bot.app.discord.history.normalize import normalize_character_history
+from faz.bot.app.discord.select.player_history_data_option import PlayerHistoryDataOption
+
+CHAR1 = "00000000-0000-0000-0000-000000000001"
+CHAR2 = "00000000-0000-0000-0000-000000000002"
+
+
+def _get_builder() -> PlayerHistoryFieldBuilder:
+    char_df = pd.DataFrame(
+        {
+            "character_uuid": [UUID(CHAR1).bytes] * 4 + [UUID(CHAR2).bytes] * 2,
+            "level": [1, 1, 2, 2, 5, 5],
+            "wars": [0, 1, 1, 3, 7, 7],
+            "datetime": pd.to_datetime([0, 60, 120, 180, 0, 60], unit="s"),
+            "unique_id": [b""] * 6,
+        }
+    )
+    player_df = pd.DataFrame(
+        {
+            "username": ["a", "b"],
+            "guild_name": ["g", "g"],
+            "guild_rank": ["r", "r"],
+            "datetime": pd.to_datetime([0, 180], unit="s"),
+        }
+    )
+    return (
+        PlayerHistoryFieldBuilder()
+        .set_character_labels({CHAR1: "ARCHER1", CHAR2: "MAGE1"})
+        .set_data(player_df, char_df)
+    )
+
+
+def test_numerical_parser_skips_unchanged_rows():
+    fields = _get_builder().set_data_option(PlayerHistoryDataOption.WARS).build()
+
+    assert [(field.name, field.value) for field in fields] == [
+        ("ARCHER1", "<t:0:R>: `0`\n<t:60:R>: `1`\n<t:180:R>: `3`"),
+        ("MAGE1", "<t:0:R>: `7`"),
+    ]
+
+
+def test_numerical_parser_float_format():
+    fields = _get_builder().set_data_option(PlayerHistoryDataOption.LEVEL).build()
+
+    assert fields[0].value == "<t:0:R>: `1.00`\n<t:120:R>: `2.00`"
+
+
+def test_numerical_parser_skips_characters_without_rows():
+    builder = _get_builder()
+    builder.set_character_labels({CHAR1: "ARCHER1", "00000000-0000-0000-0000-000000000003": "X"})
+
+    fields = builder.set_data_option(PlayerHistoryDataOption.WARS).build()
+
+    assert [field.name for field in fields] == ["ARCHER1"]
+
+
+def test_numerical_all():
+    fields = _get_builder().set_data_option(PlayerHistoryDataOption.ALL).build()
+
+    assert fields[0].value == "`Username : ` a -> b\n`Level    : ` +1.00\n`Wars     : ` +3.00"
+
+
+def test_encoded_character_uuids_build_the_same_fields():
+    builder = _get_builder()
+    expected = {
+        option: [(field.name, field.value) for field in builder.set_data_option(option).build()]
+        for option in (
+            PlayerHistoryDataOption.ALL,
+            PlayerHistoryDataOption.LEVEL,
+            PlayerHistoryDataOption.WARS,
+        )
+    }
+
+    builder.set_character_data(normalize_character_history(builder._char_df.copy()))
+
+    for option, fields in expected.items():
+        built = builder.set_data_option(option).build()
+        assert [(field.name, field.value) for field in built] == fields
@@ -0,0 +1,42 @@
+import pytest
+from tabulate import tabulate
+
+from faz.bot.app.discord.embed.builder.table_builder import TableBuilder
+
+HEADER = ["#", "World", "Player Count", "Uptime"]
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [],
+        [(1, "WC1", 30, "1h 2m"), (10, "WC10", 5, "3d")],
+        [(i, f"WC{i}", i * 7, f"{i}h") for i in range(1, 150)],
+        [(1, "a very long world name", None, " padded ")],
+    ],
+)
+def test_matches_tabulate_github(rows):
+    assert TableBuilder(HEADER, rows).build() == tabulate(rows, headers=HEADER, tablefmt="github")
+
+
+def test_pages_share_column_widths():
+    rows = [(1, "WC1", 5, "1h"), (2, "a long world name", 100_000, "2h")]
+    table = TableBuilder(HEADER, rows)
+
+    first = table.build(0, 1).splitlines()
+    second = table.build(1, 2).splitlines()
+
+    assert first[:2] == second[:2]
+    assert first[2] == "|   1 | WC1               |              5 | 1h       |"
+    assert len(first[2]) == len(second[2])
+    assert table.row_count == 2
+
+
+def test_numeric_columns():
+    rows = [(1.5, True, "1"), (2, False, "2")]
+
+    lines = TableBuilder(["a", "b", "c"], rows).build().splitlines()
+
+    # Floats are numbers, bools and numeric strings are not
+    assert lines[2] == "| 1.5 | True  | 1   |"
+    assert lines[3] == "|   2 | False | 2   |"
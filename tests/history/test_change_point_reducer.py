@@ -0,0 +1,93 @@
+from uuid import UUID
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from faz.bot.app.discord.embed.builder.player_history_field_builder import (
+    PlayerHistoryFieldBuilder,
+)
+from faz.bot.app.discord.history.change_point_reducer import ChangePointReducer
+from faz.bot.app.discord.select.player_history_data_option import PlayerHistoryDataOption
+
+
+def _random_char_df(seed: int, characters: int = 4, rows: int = 500) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    uuids = [UUID(int=i + 1).bytes for i in range(characters)]
+    return pd.DataFrame(
+        {
+            "character_uuid": [uuids[i] for i in rng.integers(0, characters, rows)],
+            "level": np.cumsum(rng.random(rows) < 0.02) + 1,
+            "wars": np.cumsum(rng.random(rows) < 0.05),
+            "datetime": pd.date_range("2024-01-01", periods=rows, freq="5min"),
+            "unique_id": [bytes([i % 256]) for i in range(rows)],
+        }
+    )
+
+
+def _reduce(df: pd.DataFrame, chunk_rows: int) -> pd.DataFrame:
+    reducer = ChangePointReducer("character_uuid")
+    for i in range(0, len(df), chunk_rows):
+        reducer.feed(df.iloc[i : i + chunk_rows])
+    assert reducer.rows_fed == len(df)
+    return reducer.result()
+
+
+def _build(char_df: pd.DataFrame, option: PlayerHistoryDataOption) -> list[tuple[str, str]]:
+    player_df = pd.DataFrame(
+        {
+            "username": ["a"],
+            "guild_name": ["g"],
+            "guild_rank": ["r"],
+            "datetime": pd.to_datetime([0], unit="s"),
+        }
+    )
+    labels = {str(UUID(int=i + 1)): f"ARCHER{i + 1}" for i in range(4)}
+    builder = (
+        PlayerHistoryFieldBuilder()
+        .set_character_labels(labels)
+        .set_data(player_df, char_df)
+        .set_data_option(option)
+    )
+    return [(field.name, field.value) for field in builder.build()]
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 7, 100, 1000])
+def test_builds_the_same_fields(chunk_rows):
+    df = _random_char_df(chunk_rows)
+
+    reduced = _reduce(df, chunk_rows)
+
+    assert len(reduced) < len(df) / 2
+    for option in (
+        PlayerHistoryDataOption.ALL,
+        PlayerHistoryDataOption.LEVEL,
+        PlayerHistoryDataOption.WARS,
+    ):
+        assert _build(reduced, option) == _build(df, option)
+
+
+def test_keeps_first_and_last_rows_of_each_entity():
+    df = pd.DataFrame(
+        {
+            "character_uuid": [b"a", b"a", b"a", b"b", b"a"],
+            "wars": [1, 1, 1, 1, 1],
+            "datetime": range(5),
+        }
+    )
+
+    reduced = _reduce(df, 2)
+
+    assert reduced["datetime"].tolist() == [0, 3, 4]
+    assert reduced.index.tolist() == [0, 1, 2]
+
+
+def test_empty():
+    reducer = ChangePointReducer("character_uuid")
+    reducer.feed(pd.DataFrame(columns=["character_uuid", "wars", "datetime"]))
+
+    ret = reducer.result()
+
+    assert ret.empty
+    assert ret.columns.tolist() == ["character_uuid", "wars", "datetime"]
+    assert ChangePointReducer("character_uuid").result().empty
@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from faz.bot.database.fazwynn.model.character_history import CharacterHistory
+import pandas as pd
+
+from faz.bot.app.discord.history.character_history_context import CharacterHistoryContext
+from faz.bot.app.discord.history.character_history_context import TOTAL_LEVEL_COLUMNS
+from faz.bot.app.discord.history.dataframe_loader import DataFrameLoader
+
+
+def _char_df(uuid: bytes, levels: list[float]) -> pd.DataFrame:
+    df = pd.DataFrame({column: [1.5] * len(levels) for column in TOTAL_LEVEL_COLUMNS})
+    df["level"] = levels
+    df["character_uuid"] = [uuid] * len(levels)
+    df["datetime"] = pd.to_datetime(range(len(levels)), unit="s")
+    return df
+
+
+class TestCharacterHistoryContext(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.uuids = [UUID(int=i + 1).bytes for i in range(3)]
+        frames = {
+            self.uuids[0]: _char_df(self.uuids[0], [10, 20]),
+            self.uuids[1]: _char_df(self.uuids[1], []),
+            self.uuids[2]: _char_df(self.uuids[2], [30.75]),
+        }
+        self.loader = DataFrameLoader(MagicMock(), max_workers=1)
+        self.addCleanup(self.loader.shutdown)
+        self.loader.character_history = AsyncMock(side_effect=lambda uuid, *_: frames[uuid])
+        self.player = MagicMock()
+        # Relationship already loaded
+        characters_loaded = asyncio.get_running_loop().create_future()
+        characters_loaded.set_result(None)
+        self.player.awaitable_attrs.characters = characters_loaded
+        self.player.characters = [
+            MagicMock(character_uuid=uuid, type=type_)
+            for uuid, type_ in zip(self.uuids, ("ARCHER",) * 3)
+        ]
+        self.context = CharacterHistoryContext(
+            self.loader, self.player, datetime(2024, 1, 1), datetime(2024, 2, 1)
+        )
+
+    async def test_labels_and_frame_from_one_load(self) -> None:
+        await asyncio.gather(self.context.load(), self.context.load())
+        await self.context.load()
+
+        self.assertEqual(self.loader.character_history.await_count, 3)
+        # 12 professions at 1.5 floor to 12
+        self.assertEqual(
+            self.context.character_labels,
+            {
+                str(UUID(bytes=self.uuids[0])): "ARCHER1 (Lv. 32)",
+                str(UUID(bytes=self.uuids[2])): "ARCHER2 (Lv. 42)",
+            },
+        )
+        char_df = self.context.character_df
+        self.assertEqual(len(char_df), 3)
+        self.assertIsInstance(char_df["character_uuid"].dtype, pd.CategoricalDtype)
+
+    async def test_total_level_matches_model(self) -> None:
+        row = _char_df(self.uuids[2], [30.75]).iloc[0]
+        record = SimpleNamespace(**{column: row[column] for column in TOTAL_LEVEL_COLUMNS})
+
+        self.assertEqual(
+            CharacterHistoryContext._get_total_level(row),
+            CharacterHistory.get_total_level(record),  # type: ignore
+        )
+
+    async def test_no_history(self) -> None:
+        self.player.characters = self.player.characters[1:2]
+
+        await self.context.load()
+
+        self.assertEqual(self.context.character_labels, {})
+        self.assertTrue(self.context.character_df.empty)
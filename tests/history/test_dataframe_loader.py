@@ -0,0 +1,175 @@
+import asyncio
+from datetime import datetime
+from datetime import timedelta
+from functools import partial
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from faz.bot.database.fazwynn.fazwynn_database import FazwynnDatabase
+import pandas as pd
+from sqlalchemy import column
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy import Select
+from sqlalchemy import StaticPool
+from sqlalchemy import table
+
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.history.dataframe_loader import DataFrameLoader
+from faz.bot.app.discord.history.history_cache import HistoryCache
+
+
+class TestDataFrameLoader(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.db = MagicMock(spec=FazwynnDatabase)
+        self.loader = DataFrameLoader(self.db, max_workers=2)
+
+    def tearDown(self) -> None:
+        self.loader.shutdown()
+
+    async def test_run_off_event_loop_thread(self) -> None:
+        thread = await self.loader.run(threading.current_thread)
+        self.assertIsNot(thread, threading.current_thread())
+        self.assertTrue(thread.name.startswith("DataFrameLoader"))
+
+    async def test_player_history(self) -> None:
+        df = pd.DataFrame({"uuid": [b"a"]})
+        stmts = []
+
+        def read_history(stmt, key):
+            stmts.append((stmt.compile().params["uuid_1"], key))
+            return df
+
+        self.loader._read_history = read_history  # type: ignore
+
+        ret = await self.loader.player_history(b"a", datetime(2024, 1, 1), datetime(2024, 2, 1))
+
+        self.assertIs(ret, df)
+        self.assertEqual(stmts, [([b"a"], "uuid")])
+
+    async def test_cached_history_reads_edges_unreduced(self) -> None:
+        loader = DataFrameLoader(self.db, max_workers=1, cache=HistoryCache(Metrics()))
+        self.addCleanup(loader.shutdown)
+        begin, end = datetime(2024, 1, 1, 0, 0), datetime(2024, 1, 1, 1, 0)
+        reads = []
+
+        def read(reduced, stmt, key=None):
+            reads.append((reduced, sorted(stmt.compile().params.values(), key=str)))
+            dt = begin + timedelta(minutes=30 if reduced else 1)
+            return pd.DataFrame({"uuid": [b"a"], "datetime": [dt]})
+
+        loader._read_history = partial(read, True)  # type: ignore
+        loader._read_sql = partial(read, False)  # type: ignore
+
+        ret = await loader.player_history(b"a", begin, end)
+
+        edge = timedelta(minutes=5)
+        self.assertEqual(
+            reads,
+            [
+                (True, sorted([[b"a"], begin + edge, end - edge], key=str)),
+                (False, sorted([[b"a"], begin, end, begin + edge, end - edge], key=str)),
+            ],
+        )
+        self.assertEqual(ret["datetime"].tolist(), [begin + timedelta(minutes=m) for m in (1, 30)])
+
+    async def test_player_histories_chunks_in_clause(self) -> None:
+        chunks = []
+
+        def read_history(stmt, key):
+            keys = stmt.compile().params["uuid_1"]
+            chunks.append(list(keys))
+            return pd.DataFrame({"uuid": list(keys), "datetime": [3 - len(chunks)] * len(keys)})
+
+        self.loader._read_history = read_history  # type: ignore
+
+        ret = await self.loader.player_histories(
+            [b"a", b"b", b"a", b"c"], datetime(2024, 1, 1), datetime(2024, 2, 1), chunk_size=2
+        )
+
+        self.assertEqual(chunks, [[b"a", b"b"], [b"c"]])
+        self.assertEqual(ret["uuid"].tolist(), [b"c", b"a", b"b"])
+        self.assertEqual(ret.index.tolist(), [0, 1, 2])
+
+    async def test_player_histories_empty(self) -> None:
+        ret = await self.loader.player_histories([], MagicMock(), MagicMock())
+
+        self.assertTrue(ret.empty)
+        self.assertIn("guild_name", ret.columns)
+
+    async def test_gather_limits_queries_per_gather_and_in_total(self) -> None:
+        loader = DataFrameLoader(self.db, max_workers=3, max_in_flight_per_gather=2)
+        self.addCleanup(loader.shutdown)
+        running = peak = 0
+
+        async def load(begin, end):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return pd.DataFrame({"entity": [begin]})
+
+        def query(i):
+            return partial(loader._cached, "kind", i, i, i, load)
+
+        async def nested(i):
+            return await loader.gather(query(i), query(i + 1))
+
+        ret = await loader.gather(query(0), partial(nested, 1), query(3))
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(ret[0]["entity"].tolist(), [0])
+        self.assertEqual([df["entity"].tolist() for df in ret[1]], [[1], [2]])
+
+        peak = 0
+        await asyncio.gather(*(loader.gather(query(i)) for i in range(6)))
+        self.assertEqual(peak, 3)
+
+    async def test_read_history_streams_change_points(self) -> None:
+        loader = self._sqlite_loader()
+
+        ret = await loader.run(loader._read_history, *self._stmt())
+
+        # The first and last row of each player and the rows where wars changed
+        self.assertEqual(ret["datetime"].tolist(), [0, 1, 3, 4, 6])
+        self.assertEqual(ret.index.tolist(), [0, 1, 2, 3, 4])
+
+    async def test_read_history_without_window_functions(self) -> None:
+        loader = self._sqlite_loader()
+        loader.WINDOW_FUNCTION_VERSIONS = {}  # type: ignore
+
+        ret = await loader.run(loader._read_history, *self._stmt())
+
+        self.assertEqual(ret["datetime"].tolist(), [0, 1, 3, 4, 6])
+
+    def test_select_change_points(self) -> None:
+        loader = self._sqlite_loader()
+        stmt, key = self._stmt()
+
+        ret = pd.read_sql_query(loader._select_change_points(stmt, key), self.db.engine)
+
+        self.assertEqual(ret.columns.tolist(), ["uuid", "wars", "datetime"])
+        self.assertEqual(ret["datetime"].tolist(), [0, 1, 3, 4, 6])
+
+    def _sqlite_loader(self) -> DataFrameLoader:
+        # One in-memory database, shared by the loader thread
+        self.db.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        pd.DataFrame(
+            {
+                "uuid": [b"a", b"b", b"a", b"a", b"b", b"a", b"a"],
+                "wars": [1, 5, 1, 2, 5, 2, 2],
+                "datetime": range(7),
+            }
+        ).to_sql("history", self.db.engine, index=False)
+        loader = DataFrameLoader(self.db, max_workers=1, stream_chunk_rows=2)
+        self.addCleanup(loader.shutdown)
+        return loader
+
+    @staticmethod
+    def _stmt() -> tuple[Select, str]:
+        history = table("history", column("uuid"), column("wars"), column("datetime"))
+        return select(history).order_by(history.c.datetime), "uuid"
@@ -0,0 +1,174 @@
+import asyncio
+from datetime import datetime
+from datetime import timezone
+import unittest
+
+import pandas as pd
+
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.history.history_cache import HistoryCache
+from faz.bot.app.discord.history.history_cache import trim_sessions
+
+
+def _naive(dt: datetime) -> datetime:
+    return dt.astimezone().replace(tzinfo=None)
+
+
+class TestHistoryCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.now = 1_000_000.0
+        self.metrics = Metrics()
+        self.cache = HistoryCache(
+            self.metrics, max_entries=2, refresh_interval=300.0, clock=lambda: self.now
+        )
+        self.loads: list[tuple[datetime, datetime]] = []
+
+    async def _load(self, begin: datetime, end: datetime) -> pd.DataFrame:
+        self.loads.append((begin, end))
+        return pd.DataFrame(
+            {"value": [len(self.loads)], "datetime": [_naive(begin + (end - begin) / 2)]}
+        )
+
+    async def _get(self, entity: object, begin: datetime, end: datetime) -> pd.DataFrame:
+        return await self.cache.get_or_load("player_history", entity, begin, end, self._load)
+
+    def _dt(self, timestamp: float) -> datetime:
+        return datetime.fromtimestamp(timestamp, timezone.utc)
+
+    async def test_nearby_periods_share_entry(self) -> None:
+        first = await self._get(b"a", self._dt(610), self._dt(1190))
+        second = await self._get(b"a", self._dt(650), self._dt(1150))
+
+        self.assertEqual(self.loads, [(self._dt(600), self._dt(1200))])
+        self.assertEqual(second["value"].tolist(), [1])
+        self.assertIsNot(first, second)
+        self.assertEqual(
+            self.metrics.counter("history_cache_hits_total", "player_history").value, 1
+        )
+        self.assertEqual(
+            self.metrics.counter("history_cache_misses_total", "player_history").value, 1
+        )
+
+    async def test_returns_copies(self) -> None:
+        df = await self._get(b"a", self._dt(0), self._dt(300))
+        df.loc[0, "value"] = 100
+
+        df = await self._get(b"a", self._dt(0), self._dt(300))
+
+        self.assertEqual(df["value"].tolist(), [1])
+
+    async def test_expires_at_next_refresh(self) -> None:
+        await self._get(b"a", self._dt(0), self._dt(300))
+        self.now = 1_000_199.0
+        await self._get(b"a", self._dt(0), self._dt(300))
+        self.now = 1_000_200.0
+        await self._get(b"a", self._dt(0), self._dt(300))
+
+        self.assertEqual(len(self.loads), 2)
+
+    async def test_evicts_least_recently_used(self) -> None:
+        await self._get(b"a", self._dt(0), self._dt(300))
+        await self._get(b"b", self._dt(0), self._dt(300))
+        await self._get(b"a", self._dt(0), self._dt(300))
+        await self._get(b"c", self._dt(0), self._dt(300))
+        await self._get(b"a", self._dt(0), self._dt(300))
+        await self._get(b"b", self._dt(0), self._dt(300))
+
+        self.assertEqual(len(self.loads), 4)
+        self.assertEqual(self.cache.entries, 2)
+        self.assertEqual(
+            self.metrics.counter("history_cache_evictions_total", "player_history").value, 2
+        )
+
+    async def test_concurrent_misses_share_load(self) -> None:
+        release = asyncio.Event()
+
+        async def load(begin: datetime, end: datetime) -> pd.DataFrame:
+            self.loads.append((begin, end))
+            await release.wait()
+            return pd.DataFrame({"value": [1], "datetime": [_naive(self._dt(100))]})
+
+        tasks = [
+            asyncio.create_task(
+                self.cache.get_or_load("guild_history", b"a", self._dt(0), self._dt(300), load)
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        self.assertEqual(len(self.loads), 1)
+        self.assertEqual([df["value"].tolist() for df in results], [[1], [1], [1]])
+
+    async def test_cancelled_caller_does_not_cancel_shared_load(self) -> None:
+        release = asyncio.Event()
+
+        async def load(begin: datetime, end: datetime) -> pd.DataFrame:
+            self.loads.append((begin, end))
+            await release.wait()
+            return pd.DataFrame({"value": [1], "datetime": [_naive(self._dt(100))]})
+
+        tasks = [
+            asyncio.create_task(
+                self.cache.get_or_load("guild_history", b"a", self._dt(0), self._dt(300), load)
+            )
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        tasks[0].cancel()
+        await asyncio.sleep(0)
+        release.set()
+        df = await tasks[1]
+
+        self.assertTrue(tasks[0].cancelled())
+        self.assertEqual(df["value"].tolist(), [1])
+        self.assertEqual(len(self.loads), 1)
+        self.assertEqual(self.cache.entries, 1)
+
+    async def test_failed_load_not_cached(self) -> None:
+        async def load(begin: datetime, end: datetime) -> pd.DataFrame:
+            raise RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            await self.cache.get_or_load("guild_history", b"a", self._dt(0), self._dt(300), load)
+
+        df = await self._get(b"a", self._dt(0), self._dt(300))
+
+        self.assertEqual(df["value"].tolist(), [1])
+
+    async def test_trims_to_unaligned_period(self) -> None:
+        times = [600, 605, 700, 1100, 1195, 1200]
+
+        async def load(begin: datetime, end: datetime) -> pd.DataFrame:
+            return pd.DataFrame({"datetime": [_naive(self._dt(t)) for t in times]})
+
+        df = await self.cache.get_or_load(
+            "player_history", b"a", self._dt(610), self._dt(1190), load
+        )
+        wider = await self.cache.get_or_load(
+            "player_history", b"a", self._dt(605), self._dt(1195), load
+        )
+
+        self.assertEqual(df["datetime"].tolist(), [_naive(self._dt(t)) for t in (700, 1100)])
+        self.assertEqual(df.index.tolist(), [0, 1])
+        self.assertEqual(len(wider), 4)
+
+    async def test_trims_sessions_to_overlap(self) -> None:
+        sessions = [(600, 605), (605, 650), (700, 800), (1180, 1200), (1195, 1200)]
+
+        async def load(begin: datetime, end: datetime) -> pd.DataFrame:
+            return pd.DataFrame(
+                {
+                    "logon_datetime": [_naive(self._dt(on)) for on, _ in sessions],
+                    "logoff_datetime": [_naive(self._dt(off)) for _, off in sessions],
+                }
+            )
+
+        df = await self.cache.get_or_load(
+            "player_activities", b"a", self._dt(610), self._dt(1190), load, trim_sessions
+        )
+
+        self.assertEqual(
+            df["logon_datetime"].tolist(), [_naive(self._dt(t)) for t in (605, 700, 1180)]
+        )
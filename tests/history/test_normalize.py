@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from faz.bot.app.discord.history.normalize import normalize_character_history
+from faz.bot.app.discord.history.normalize import normalize_player_history
+
+
+def test_blank_and_missing_become_none():
+    df = pd.DataFrame(
+        {
+            "username": ["a", "a", "b"],
+            "guild_name": ["Guild", "", None],
+            "guild_rank": ["CHIEF", np.nan, ""],
+            "rank": ["", "", ""],
+        }
+    )
+
+    ret = normalize_player_history(df)
+
+    assert ret is df
+    assert df["guild_name"].tolist() == ["Guild", "None", "None"]
+    assert df["guild_rank"].tolist() == ["CHIEF", "None", "None"]
+    assert isinstance(df["username"].dtype, pd.CategoricalDtype)
+    # Columns outside PLAYER_CATEGORICAL_COLUMNS are left as is
+    assert df["rank"].tolist() == ["", "", ""]
+
+
+def test_uses_less_memory():
+    rows = 10_000
+    df = pd.DataFrame(
+        {
+            "username": [f"player{i % 100}" for i in range(rows)],
+            "guild_name": ["Some Guild Name"] * rows,
+            "guild_rank": ["RECRUIT", "CAPTAIN"] * (rows // 2),
+        }
+    )
+    before = df.memory_usage(deep=True).sum()
+
+    normalize_player_history(df)
+
+    assert df.memory_usage(deep=True).sum() < before / 4
+
+
+def test_uuids_become_codes():
+    uuids = [bytes([i]) * 16 for i in range(3)]
+    df = pd.DataFrame({"character_uuid": [uuids[i] for i in (2, 0, 2, 1)], "level": [1, 2, 3, 4]})
+
+    normalize_character_history(df)
+
+    column = df["character_uuid"]
+    assert isinstance(column.dtype, pd.CategoricalDtype)
+    assert column.tolist() == [uuids[i] for i in (2, 0, 2, 1)]
+    assert (column == uuids[2]).tolist() == [True, False, True, False]
+    assert not (column == b"missing").any()
+
+
+def test_uuids_use_less_memory():
+    rows = 10_000
+    df = pd.DataFrame({"uuid": [bytes([i % 100]) * 16 for i in range(rows)]})
+    before = df.memory_usage(deep=True).sum()
+
+    normalize_player_history(df)
+
+    assert df.memory_usage(deep=True).sum() < before / 4
+
+
+def test_missing_uuid_column():
+    df = pd.DataFrame()
+
+    assert normalize_character_history(df) is df
+    assert df.empty
@@ -0,0 +1,77 @@
+from datetime import datetime
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import call
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.track.guild_tracker import GuildTracker
+from faz.bot.app.discord.track.track_index import TrackIndex
+
+G1, G2 = (UUID(int=i).bytes for i in range(1, 3))
+P1, P2, P3 = (UUID(int=i).bytes for i in range(11, 14))
+T0, T1, T2 = (datetime(2024, 1, 1, 0, minute) for minute in range(3))
+
+
+class TestGuildTracker(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.bot = MagicMock()
+        self.bot.metrics = Metrics()
+        self.bot.track_index = self.track_index = TrackIndex(MagicMock(), Metrics())
+        for channel_id, guilds in ((1, (G1,)), (2, (G1, G2))):
+            self.track_index.add_entry(channel_id, "GUILD")
+            for guild in guilds:
+                self.track_index.add_value(channel_id, guild)
+        self.bot.track_entry_loader.get_names = AsyncMock(return_value={G1: "Alpha", G2: "Beta"})
+        self.channels = {i: MagicMock(id=i) for i in (1, 2)}
+        self.bot.utils.must_get_sendable_channel = AsyncMock(side_effect=self.channels.get)
+
+        self.tracker = GuildTracker(self.bot)
+        self.tracker._select_members = AsyncMock(return_value=[(P1, G1), (P2, G1)])
+        self.tracker._select_latest_datetimes = AsyncMock(side_effect=[(T0, T0), (T2, T2)])
+        self.tracker._select_guild_history = AsyncMock(
+            return_value=[(G1, 85.5, T1), (G1, 86.1, T2)]
+        )
+        self.tracker._select_player_history = AsyncMock(
+            return_value=[
+                (P1, "p1", "Alpha", "RECRUIT", T1),
+                (P2, "p2", None, None, T1),
+                (P3, "p3", "Beta", "RECRUIT", T1),
+                (P1, "p1", "Alpha", "CAPTAIN", T2),
+            ]
+        )
+
+    async def test_events_since_watermark_fan_out_to_channels(self) -> None:
+        await self.tracker.poll()
+        self.tracker._select_player_history.assert_not_called()
+
+        await self.tracker.poll()
+
+        self.tracker._select_guild_history.assert_awaited_once_with(T0, T2)
+        self.tracker._select_player_history.assert_awaited_once_with(T0, T2)
+        alpha = [
+            "`p2` left **Alpha**",
+            "**Alpha** reached level 86",
+            "`p1` rank in **Alpha**: RECRUIT -> CAPTAIN",
+        ]
+        self.assertCountEqual(
+            self.bot.outbox.enqueue.call_args_list,
+            [
+                call(self.channels[1], "\n".join(alpha)),
+                call(self.channels[2], "\n".join([alpha[0], "`p3` joined **Beta**", *alpha[1:]])),
+            ],
+        )
+        self.assertEqual(self.tracker.members, 2)
+
+    async def test_index_reload_loads_members_of_new_guilds_only(self) -> None:
+        await self.tracker.load_index()
+        self.track_index.remove_entry(2)
+        self.track_index.remove_value(1, G1)
+        self.track_index.add_value(1, G2)
+
+        await self.tracker.load_index()
+
+        self.assertEqual(self.tracker._select_members.await_args_list, [call({G1, G2})])
+        # The members of the untracked guild are dropped
+        self.assertEqual(self.tracker.members, 0)
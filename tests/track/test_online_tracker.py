@@ -0,0 +1,106 @@
+import random
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import call
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.bot.errors import ParseException
+from faz.bot.app.discord.track.online_tracker import diff_sorted
+from faz.bot.app.discord.track.online_tracker import OnlineTracker
+from faz.bot.app.discord.track.track_index import TrackIndex
+
+A, B, C, D = (UUID(int=i).bytes for i in range(1, 5))
+
+
+def _track_index(entries: dict[int, tuple[str, list[bytes]]]) -> TrackIndex:
+    index = TrackIndex(MagicMock(), Metrics())
+    for channel_id, (type_, values) in entries.items():
+        index.add_entry(channel_id, type_)
+        for value in values:
+            index.add_value(channel_id, value)
+    return index
+
+
+class TestDiffSorted(unittest.TestCase):
+    def test_matches_set_difference(self) -> None:
+        rng = random.Random(0)
+        for _ in range(50):
+            population = [UUID(int=i).bytes for i in range(100)]
+            previous = sorted(rng.sample(population, rng.randint(0, 60)))
+            current = sorted(rng.sample(population, rng.randint(0, 60)))
+
+            added, removed = diff_sorted(previous, current)
+
+            self.assertEqual(added, sorted(set(current) - set(previous)))
+            self.assertEqual(removed, sorted(set(previous) - set(current)))
+
+
+class TestOnlineTracker(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.bot = MagicMock()
+        self.bot.metrics = Metrics()
+        loader = self.bot.track_entry_loader
+        loader.get_names = AsyncMock(
+            side_effect=lambda uuids: {u: u.hex()[-1] for u in uuids["ONLINE"]}
+        )
+        self.channels = {i: MagicMock(id=i) for i in (1, 2, 3)}
+        self.bot.utils.must_get_sendable_channel = AsyncMock(side_effect=self.channels.get)
+        self.bot.track_index = _track_index(
+            {1: ("ONLINE", [A, B]), 2: ("PLAYER", [A]), 3: ("ONLINE", [D])}
+        )
+        self.tracker = OnlineTracker(self.bot)
+        self.tracker._select_online_players = AsyncMock()
+
+    async def _poll(self, servers: dict[bytes, str]) -> None:
+        self.tracker._select_online_players.return_value = servers
+        await self.tracker.poll()
+
+    async def test_notifies_tracking_channels_of_changes(self) -> None:
+        await self._poll({B: "WC1", D: "WC2"})
+        self.bot.track_entry_loader.get_names.assert_not_called()
+
+        await self._poll({A: "WC3", C: "WC4", D: "WC2"})
+
+        self.bot.track_entry_loader.get_names.assert_awaited_once_with({"ONLINE": {A, B}})
+        self.assertCountEqual(
+            self.bot.outbox.enqueue.call_args_list,
+            [
+                call(self.channels[1], "`1` logged on to WC3\n`2` logged off"),
+                call(self.channels[2], "`1` logged on to WC3"),
+            ],
+        )
+        self.assertEqual(self.bot.metrics.counter("tracker_changes_total", "online").value, 3)
+        self.assertEqual(self.tracker.index_size, 3)
+
+    async def test_notifies_player_entries(self) -> None:
+        self.bot.track_index = _track_index({2: ("PLAYER", [C])})
+        self.tracker = OnlineTracker(self.bot)
+        self.tracker._select_online_players = AsyncMock()
+        await self._poll({})
+
+        await self._poll({C: "WC1"})
+        await self._poll({})
+
+        self.assertEqual(
+            self.bot.outbox.enqueue.call_args_list,
+            [
+                call(self.channels[2], "`3` logged on to WC1"),
+                call(self.channels[2], "`3` logged off"),
+            ],
+        )
+
+    async def test_missing_channel_does_not_stop_other_channels(self) -> None:
+        def get_channel(channel_id: int) -> MagicMock:
+            if channel_id == 1:
+                raise ParseException("Failed getting object from ID 1")
+            return self.channels[channel_id]
+
+        self.bot.utils.must_get_sendable_channel.side_effect = get_channel
+        await self._poll({})
+
+        await self._poll({A: "WC1"})
+
+        self.bot.outbox.enqueue.assert_called_once_with(self.channels[2], "`1` logged on to WC1")
+        self.assertEqual(self.bot.metrics.counter("tracker_send_failures_total", "online").value, 1)
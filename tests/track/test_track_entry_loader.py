@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from faz.bot.database.fazcord.fazcord_database import FazcordDatabase
+from faz.bot.database.fazwynn.fazwynn_database import FazwynnDatabase
+from sqlalchemy.dialects import mysql
+
+from faz.bot.app.discord.track.track_entry_loader import TrackEntryLoader
+
+
+def _entry(type_: str, *values: bytes) -> MagicMock:
+    return MagicMock(type=type_, associations=[MagicMock(associated_value=v) for v in values])
+
+
+class TestTrackEntryLoader(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.fazcord_db = MagicMock(spec=FazcordDatabase)
+        self.fazwynn_db = MagicMock(spec=FazwynnDatabase)
+        self.session = self.fazwynn_db.enter_async_session.return_value.__aenter__.return_value
+        self.session.execute = AsyncMock()
+        self.loader = TrackEntryLoader(self.fazcord_db, self.fazwynn_db)
+
+    async def test_get_display_names_one_query_per_table(self) -> None:
+        guild, player, unknown = (UUID(int=i).bytes for i in range(1, 4))
+        self.session.execute.side_effect = [
+            MagicMock(**{"tuples.return_value.all.return_value": [(guild, "Guild")]}),
+            MagicMock(**{"tuples.return_value.all.return_value": [(player, "player")]}),
+        ]
+        entries = [
+            _entry("GUILD", guild),
+            _entry("ONLINE", player, unknown),
+            _entry("PLAYER", player),
+            _entry("HUNTED"),
+        ]
+
+        names = await self.loader.get_display_names(entries)
+
+        self.assertEqual(
+            names, {guild: "Guild", player: "player", unknown: str(UUID(bytes=unknown))}
+        )
+        self.assertEqual(self.session.execute.await_count, 2)
+
+    async def test_get_display_names_without_values(self) -> None:
+        names = await self.loader.get_display_names([_entry("HUNTED"), _entry("GUILD")])
+
+        self.assertEqual(names, {})
+        self.fazwynn_db.enter_async_session.assert_not_called()
+
+    def test_select_by_guild_id_joins_channel_once(self) -> None:
+        sql = str(self.loader._select_by_guild_id(1).compile(dialect=mysql.dialect()))
+
+        self.assertEqual(sql.count("JOIN"), 1)
+        self.assertIn("discord_channel.channel_name", sql)
+
+    async def test_select_checksum_is_one_statement(self) -> None:
+        session = self.fazcord_db.enter_async_session.return_value.__aenter__.return_value
+        session.execute = AsyncMock(
+            return_value=MagicMock(**{"tuples.return_value.one.return_value": (2, 10, 1, 5)})
+        )
+
+        checksum = await self.loader.select_checksum()
+
+        self.assertEqual(checksum, (2, 10, 1, 5))
+        session.execute.assert_awaited_once()
+        sql = str(self.loader._select_checksum().compile(dialect=mysql.dialect()))
+        self.assertEqual(sql.count("crc32"), 2)
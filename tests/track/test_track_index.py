@@ -0,0 +1,111 @@
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.track.track_index import TrackIndex
+
+A, B, C = (UUID(int=i).bytes for i in range(1, 4))
+ROWS = [
+    (1, "GUILD", True, A),
+    (1, "GUILD", True, B),
+    (2, "GUILD", False, A),
+    (3, "ONLINE", True, A),
+    (4, "HUNTED", True, None),
+]
+
+
+def _checksum(rows: list[tuple[int, str, bool, bytes | None]]) -> tuple[int, int, int, int]:
+    """The checksum the database would select for the rows."""
+    entries = {(channel_id, type_, enabled) for channel_id, type_, enabled, _ in rows}
+    values = [(channel_id, value) for channel_id, _, _, value in rows if value is not None]
+    return (
+        len(entries),
+        sum(TrackIndex.entry_crc(*entry) for entry in entries),
+        len(values),
+        sum(TrackIndex.value_crc(*value) for value in values),
+    )
+
+
+class TestTrackIndex(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.loader = MagicMock()
+        self.loader.select_entry_values = AsyncMock(return_value=ROWS)
+        self.loader.select_checksum = AsyncMock(return_value=_checksum(ROWS))
+        self.metrics = Metrics()
+        self.index = TrackIndex(self.loader, self.metrics)
+        await self.index.load()
+
+    def test_lookups_find_enabled_entries(self) -> None:
+        self.assertEqual(self.index.channels("GUILD", A), {1})
+        self.assertEqual(self.index.channels("ONLINE", A), {3})
+        self.assertEqual(self.index.channels("ONLINE", C), frozenset())
+        self.assertEqual(self.index.channels_of_type("HUNTED"), {4})
+        self.assertEqual(self.index.tracked_values(["GUILD", "ONLINE"]), {A: {1, 3}, B: {1}})
+        self.assertEqual(
+            self.index.counts(),
+            [("GUILD", 2, 1, 3), ("HUNTED", 1, 1, 0), ("ONLINE", 1, 1, 1)],
+        )
+
+    def test_changes_update_lookups_and_checksum(self) -> None:
+        version = self.index.version
+        self.index.set_enabled(2, True)
+        self.index.set_enabled(1, False)
+        self.index.add_value(3, C)
+        self.index.remove_value(1, B)
+        self.index.remove_entry(4)
+        self.index.add_entry(5, "STAFF")
+
+        self.assertGreater(self.index.version, version)
+        self.assertEqual(self.index.channels("GUILD", A), {2})
+        self.assertEqual(self.index.tracked_values(["GUILD"]), {A: {2}})
+        self.assertEqual(self.index.channels("ONLINE", C), {3})
+        self.assertEqual(self.index.channels_of_type("HUNTED"), frozenset())
+        self.assertEqual(self.index.channels_of_type("STAFF"), {5})
+        rows = [
+            (1, "GUILD", False, A),
+            (2, "GUILD", True, A),
+            (3, "ONLINE", True, A),
+            (3, "ONLINE", True, C),
+            (5, "STAFF", True, None),
+        ]
+        self.assertEqual(self.index.checksum, _checksum(rows))
+
+    def test_tracked_values_cached_until_change(self) -> None:
+        tracked = self.index.tracked_values(["GUILD"])
+        self.assertIs(self.index.tracked_values(("GUILD",)), tracked)
+
+        self.index.add_value(2, C)
+
+        self.assertIsNot(self.index.tracked_values(["GUILD"]), tracked)
+
+    async def test_load_reselects_after_change_while_selecting(self) -> None:
+        rows = [(1, "GUILD", True, A)]
+
+        async def select_entry_values() -> list[tuple[int, str, bool, bytes | None]]:
+            if self.loader.select_entry_values.await_count == 1:
+                # Committed after the select read the table
+                self.index.add_entry(5, "STAFF")
+                return rows
+            return rows + [(5, "STAFF", True, None)]
+
+        self.loader.select_entry_values = AsyncMock(side_effect=select_entry_values)
+
+        await self.index.load()
+
+        self.assertEqual(self.loader.select_entry_values.await_count, 2)
+        self.assertEqual(self.index.channels_of_type("STAFF"), {5})
+        self.assertEqual(self.index.checksum, _checksum(rows + [(5, "STAFF", True, None)]))
+
+    async def test_reconcile_reloads_on_mismatch_only(self) -> None:
+        self.assertFalse(await self.index.reconcile())
+        self.loader.select_entry_values.assert_awaited_once()
+
+        self.loader.select_checksum.return_value = _checksum(ROWS[:2])
+        self.loader.select_entry_values.return_value = ROWS[:2]
+
+        self.assertTrue(await self.index.reconcile())
+        self.assertEqual(self.index.checksum, _checksum(ROWS[:2]))
+        self.assertEqual(self.index.entry_count, 1)
+        self.assertEqual(self.metrics.counter("track_index_mismatches_total").value, 1)
@@ -0,0 +1,82 @@
+import asyncio
+import contextvars
+from typing import override
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import Mock
+
+from nextcord import Embed
+
+from faz.bot.app.discord.bot._metrics import Metrics
+from faz.bot.app.discord.embed.builder.embed_builder import EmbedBuilder
+from faz.bot.app.discord.embed.director._base_pagination_embed_director import (
+    BasePaginationEmbedDirector,
+)
+from faz.bot.app.discord.view._base_pagination_view import BasePaginationView
+
+
+class _MockView(BasePaginationView):
+    @override
+    async def run(self) -> None: ...
+
+
+class _MockEmbedDirector(BasePaginationEmbedDirector[str]):
+    async def setup(self) -> None: ...
+
+    def _process_page_items(self, items: list[str]) -> None:
+        for item in items:
+            self.embed_builder.add_field(Mock(name=item, value=item))
+
+
+class TestBasePaginationView(IsolatedAsyncioTestCase):
+    @override
+    async def asyncSetUp(self) -> None:
+        self._mock_interaction = MagicMock()
+        self._mock_interaction.edit_original_message = AsyncMock()
+        self._view = _MockView(MagicMock(), self._mock_interaction, MagicMock())
+
+    async def test_timeout_cancels_background_tasks(self) -> None:
+        self.assertIsNone(self._view._precompute_task)
+        precompute_task = asyncio.create_task(asyncio.sleep(60))
+        prerender_task = asyncio.create_task(asyncio.sleep(60))
+        self._view._precompute_task = precompute_task
+        self._view._prerender_task = prerender_task
+
+        await self._view.on_timeout()
+        await asyncio.gather(precompute_task, prerender_task, return_exceptions=True)
+
+        self.assertTrue(precompute_task.cancelled())
+        self.assertTrue(prerender_task.cancelled())
+        self.assertIsNone(self._view._precompute_task)
+        self._mock_interaction.edit_original_message.assert_awaited_once()
+
+    async def test_stop_cancels_precompute(self) -> None:
+        task = asyncio.create_task(asyncio.sleep(60))
+        self._view._precompute_task = task
+
+        self._view.stop()
+        await asyncio.gather(task, return_exceptions=True)
+
+        self.assertTrue(task.cancelled())
+        self.assertTrue(self._view.is_finished())
+
+    async def test_prerender_is_not_timed_as_command(self) -> None:
+        metrics = Metrics()
+        builder = Mock(spec_set=EmbedBuilder)
+        builder.build.return_value = Embed()
+        director = _MockEmbedDirector(builder, items=list("abcdefg"), items_per_page=2)
+        view = _MockView(MagicMock(), self._mock_interaction, director)
+
+        async def invoke() -> None:
+            metrics.bind_command("player history")
+            director.construct_page(1)
+            view._prerender_neighbours()
+            assert view._prerender_task is not None
+            await view._prerender_task
+
+        await asyncio.create_task(invoke(), context=contextvars.copy_context())
+
+        self.assertEqual(len(director._page_cache), 3)
+        histogram = metrics.histogram("command_embed_build_seconds", "player history")
+        self.assertEqual(histogram.count, 1)